@@ -86,9 +86,21 @@ BASIC RULES:
 - Words are randomly selected from a predefined list
 - Choose difficulty: Easy (4 letters), Medium (6), Hard (8)
 - You have 6 attempts to guess the word
-- Any English word allowed, including proper nouns
+- Guesses must be valid words from the game's word list
 - No special characters
 
+MULTI-BOARD:
+- Play 2, 4 or 8 words at once (7, 9 or 13 attempts)
+- Every guess is played on every board you have not solved yet
+
+HARD MODE:
+- Turn it on from the Wordy menu
+- Every guess must fit all the feedback so far (greens stay, yellows are used)
+
+WORD RATING:
+- Choose Word Rating in the Wordy menu to cycle any, easier, average or harder
+- Words are rated by how many guesses a solver needs to find them
+
 FEEDBACK SYSTEM:
 After each guess, you'll receive:
 - Number of letters in correct position
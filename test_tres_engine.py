@@ -0,0 +1,151 @@
+# ============================================================
+# TRES ENGINE TESTS - Rule invariants and action validation in TresGame
+# ============================================================
+
+import random
+from collections import Counter
+
+import pytest
+
+from tres_engine import (
+    TresGame, TresHand, COLOR_SET, PLAY, DRAW, CHOOSE_COLOR, PHASE_PLAY, PHASE_COLOR,
+    gen_deck, is_playable,
+)
+
+VARIANTS = [None, {"seven_zero": True}, {"jump_in": True}, {"stacking": False}]
+
+
+def play_random(game, rng, max_turns=2000):
+    """Plays uniformly random legal actions (jump-ins included) until the game ends or stalls."""
+    while not game.is_over and game.turn_count < max_turns:
+        yield rng.choice(game.legal_actions() + game.jump_in_actions())
+
+
+def state(game):
+    """Returns the packed cards, fields and random state of a game for comparison."""
+    packed = game.pack()
+    return packed.hands, packed.deck, packed.discard, packed.top, packed.fields, packed.rng_state
+
+
+def all_cards(game):
+    """Counts every card in the hands, draw pile and discard pile."""
+    cards = Counter(game.discard) + Counter(game.deck)
+    for hand in game.hands:
+        cards.update(hand)
+    return cards
+
+
+def _game_with_wild():
+    """Returns a two-seat game where seat 0 is to play and holds a WILD."""
+    game = TresGame(2, seed=1)
+    game.top = "R5"
+    game.phase = PHASE_PLAY
+    game.turn = 0
+    game.hands[0] = TresHand(["WILD", "G3", "B4"])
+    return game
+
+
+def _game_choosing_color():
+    """Returns a two-seat game waiting for the color of a wild first card."""
+    game = TresGame(2, seed=1)
+    game.top = "WILD"
+    game.phase = PHASE_COLOR
+    game.turn = 0
+    return game
+
+
+@pytest.mark.parametrize("color", ["", "RG", None])
+def test_play_wild_rejects_bad_color(color):
+    game = _game_with_wild()
+    with pytest.raises(ValueError):
+        game.apply((PLAY, "WILD", color))
+    assert game.top == "R5"
+    assert "WILD" in game.hands[0]
+
+
+@pytest.mark.parametrize("color", ["", "RG"])
+def test_choose_color_rejects_bad_color(color):
+    game = _game_choosing_color()
+    with pytest.raises(ValueError):
+        game.apply((CHOOSE_COLOR, color))
+    assert game.top == "WILD"
+    assert game.phase == PHASE_COLOR
+
+
+def test_single_color_letter_is_accepted():
+    game = _game_with_wild()
+    game.apply((PLAY, "WILD", "G"))
+    assert game.top == "GWILD"
+    game.legal_actions()
+
+    game = _game_choosing_color()
+    game.apply((CHOOSE_COLOR, "B"))
+    assert game.top == "BWILD"
+    game.legal_actions()
+
+
+def test_color_set_holds_single_letters_only():
+    assert COLOR_SET == {"R", "G", "B", "Y"}
+
+
+@pytest.mark.parametrize("top,card,playable", [
+    ("R5", "R9", True), ("R5", "G5", True), ("R5", "G9", False),
+    ("R5", "WILD", True), ("RSKIP", "RSKIP", True), ("BDRAWTWO", "GDRAWTWO", True),
+    ("GWILD", "G2", True), ("GWILD", "R2", False),
+])
+def test_is_playable(top, card, playable):
+    assert is_playable(card, top) is playable
+
+
+@pytest.mark.parametrize("rules", VARIANTS)
+@pytest.mark.parametrize("players", [2, 4, 9])
+def test_random_games_keep_every_card(players, rules):
+    game = TresGame(players, seed=players, rules=rules)
+    expected = Counter(gen_deck(random.Random(0), decks=game.decks))
+    for action in play_random(game, random.Random(players)):
+        game.apply(action)
+        assert all_cards(game) == expected
+        assert game.top.endswith(game.discard[-1])
+
+
+@pytest.mark.parametrize("rules", VARIANTS)
+def test_same_seed_and_actions_give_the_same_game(rules):
+    first = TresGame(3, seed=11, rules=rules, record=True)
+    for action in play_random(first, random.Random(5)):
+        first.apply(action)
+    second = TresGame(3, seed=11, rules=rules)
+    for action in first.history:
+        second.apply(action)
+    assert state(second) == state(first)
+
+
+def test_copy_is_independent():
+    game = TresGame(3, seed=4)
+    clone = game.copy()
+    rng = random.Random(1)
+    for action in play_random(clone, rng, max_turns=50):
+        clone.apply(action)
+    fresh = TresGame(3, seed=4)
+    assert state(game) == state(fresh)
+
+
+def test_illegal_actions_are_rejected_without_changing_state():
+    game = _game_with_wild()
+    before = state(game)
+    for action in [(PLAY, "R9", None), (PLAY, "G3", None), (CHOOSE_COLOR, "R"), ("bogus",)]:
+        with pytest.raises(ValueError):
+            game.apply(action)
+    assert state(game) == before
+    game.apply((DRAW,))
+    assert len(game.hands[0]) == 4
+
+
+def test_packed_snapshot_does_not_share_deck_counts():
+    game = TresGame(2, seed=2)
+    packed = game.pack()
+    game.deck_counts["wilds"] = 99
+    assert dict(packed.config[2])["wilds"] == 4
+    restored = packed.unpack()
+    assert restored.deck_counts["wilds"] == 4
+    restored.deck_counts["wilds"] = 0
+    assert packed.unpack().deck_counts["wilds"] == 4
@@ -0,0 +1,72 @@
+# ============================================================
+# TRES REPLAY TESTS - Logs and seeking reproduce the recorded game
+# ============================================================
+
+import random
+
+import pytest
+
+from tres_engine import TresGame
+from tres_replay import game_log, replay, save_log, load_log, TresReplay
+
+INTERVAL = 16  # SMALL SNAPSHOT SPACING: Many snapshot boundaries in a short game
+
+
+def state(game):
+    """Returns the packed cards, fields and random state of a game for comparison."""
+    packed = game.pack()
+    return packed.hands, packed.deck, packed.discard, packed.top, packed.fields, packed.rng_state
+
+
+def recorded_game(rules=None, seed=21, max_turns=400):
+    """
+    Plays a seeded random game and returns it with the state before every action.
+
+    Returns:
+        tuple: (game, states) where states[k] is the state before action k
+    """
+    game = TresGame(3, seed=seed, record=True, rules=rules)
+    rng = random.Random(seed)
+    states = [state(game)]
+    while not game.is_over and game.turn_count < max_turns:
+        game.apply(rng.choice(game.legal_actions() + game.jump_in_actions()))
+        states.append(state(game))
+    return game, states
+
+
+@pytest.mark.parametrize("rules", [None, {"seven_zero": True, "jump_in": True}])
+def test_replay_reproduces_the_game(tmp_path, rules):
+    game, _ = recorded_game(rules)
+    assert state(replay(game_log(game))) == state(game)
+    path = tmp_path / "log.json"
+    save_log(game, path)
+    assert state(replay(load_log(path))) == state(game)
+
+
+def test_seek_reproduces_every_position():
+    game, states = recorded_game()
+    viewer = TresReplay(game_log(game), snapshot_interval=INTERVAL)
+    assert len(viewer) == len(states) - 1 > 4 * INTERVAL
+
+    # FORWARDS - Every position in order builds the snapshot table as it goes
+    for position in range(len(states)):
+        assert state(viewer.seek(position)) == states[position]
+    # BACKWARDS - Restores snapshots instead of replaying from the start
+    for position in reversed(range(len(states))):
+        assert state(viewer.seek(position)) == states[position]
+    # ACROSS SNAPSHOT BOUNDARIES - Jumps either side of each boundary, in both directions
+    rng = random.Random(0)
+    boundaries = range(INTERVAL, len(states), INTERVAL)
+    for boundary in boundaries:
+        for position in (boundary - 1, boundary, boundary + 1, rng.randrange(len(states)), boundary - 1):
+            position = min(position, len(states) - 1)
+            assert state(viewer.seek(position)) == states[position]
+    assert state(viewer.seek(len(states) + 10)) == states[-1]
+    assert state(viewer.seek(-5)) == states[0]
+
+
+def test_seek_far_ahead_from_a_fresh_replay():
+    game, states = recorded_game()
+    viewer = TresReplay(game_log(game), snapshot_interval=INTERVAL)
+    assert state(viewer.seek(3 * INTERVAL + 5)) == states[3 * INTERVAL + 5]
+    assert state(viewer.seek(INTERVAL - 1)) == states[INTERVAL - 1]
@@ -0,0 +1,76 @@
+# ============================================================
+# TRES SAVE TESTS - Save/load round trips and damaged save files
+# ============================================================
+
+import json
+import zlib
+
+import pytest
+
+from tres_engine import TresGame, TresHand, PLAY, ACCEPT, PHASE_PLAY, PHASE_DRAWTWO, PHASE_WILD4
+from tres_save import save_game, load_game, SAVE_VERSION
+
+SETTINGS = {"humans": 1, "bots": 1, "difficulty": "easy", "rules": {}}
+
+
+def state(game):
+    """Returns the packed cards, fields and random state of a game for comparison."""
+    packed = game.pack()
+    return packed.hands, packed.deck, packed.discard, packed.top, packed.fields, packed.rng_state
+
+
+def stacked_game(card, stack_card, color):
+    """Plays card then stack_card on R5, leaving a pending penalty for seat 0 to stack on or accept."""
+    game = TresGame(2, seed=3, record=True)
+    game.top, game.phase, game.turn = "R5", PHASE_PLAY, 0
+    game.hands[0] = TresHand([card, "G3", "B4", "R7", "Y2"])
+    game.hands[1] = TresHand([stack_card, "G6", "B8", "Y9", "R1", "B2"])
+    game.apply((PLAY, card, color))
+    game.apply((PLAY, stack_card, color))
+    return game
+
+
+@pytest.mark.parametrize("card,stack_card,color,phase", [
+    ("RDRAWTWO", "GDRAWTWO", None, PHASE_DRAWTWO),
+    ("WILD+4", "WILD+4", "B", PHASE_WILD4),
+])
+def test_round_trip_keeps_a_pending_stack(tmp_path, card, stack_card, color, phase):
+    game = stacked_game(card, stack_card, color)
+    assert game.phase == phase and game.turn == 0
+    path = tmp_path / "game.tres"
+    save_game(game, SETTINGS, path)
+    loaded, settings = load_game(path)
+
+    assert settings == SETTINGS
+    assert state(loaded) == state(game)
+    assert (loaded.drawtwo_accum, loaded.wild_plus_4_accum) == (game.drawtwo_accum, game.wild_plus_4_accum) != (0, 0)
+    assert loaded.top == game.top == (stack_card if color is None else color + stack_card)
+    assert loaded.history == game.history
+    assert loaded.legal_actions() == game.legal_actions()
+    assert loaded.apply((ACCEPT,)) == game.apply((ACCEPT,))
+    assert state(loaded) == state(game)
+
+
+def write_payload(path, payload):
+    path.write_bytes(zlib.compress(json.dumps(payload).encode()))
+
+
+def test_damaged_saves_raise_value_error(tmp_path):
+    good = tmp_path / "good.tres"
+    save_game(TresGame(2, seed=1), SETTINGS, good)
+    data = json.loads(zlib.decompress(good.read_bytes()))
+
+    truncated = tmp_path / "truncated.tres"
+    truncated.write_bytes(good.read_bytes()[:40])
+    missing = tmp_path / "missing.tres"
+    write_payload(missing, {"version": SAVE_VERSION, "settings": SETTINGS, "game": {"hands": []}})
+    wrong_types = tmp_path / "wrong_types.tres"
+    write_payload(wrong_types, {**data, "game": {**data["game"], "rng": 5}})
+    not_a_dict = tmp_path / "list.tres"
+    write_payload(not_a_dict, [SAVE_VERSION])
+    old = tmp_path / "old.tres"
+    write_payload(old, {**data, "version": SAVE_VERSION - 1})
+
+    for path in (truncated, missing, wrong_types, not_a_dict, old):
+        with pytest.raises(ValueError):
+            load_game(path)
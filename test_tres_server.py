@@ -0,0 +1,106 @@
+# ============================================================
+# TRES SERVER TESTS - In-process loopback server and clients
+# ============================================================
+
+import asyncio
+
+from tres_engine import TresHand, PHASE_PLAY, EVENT_DRAW
+from tres_server import TresServer, TresClient, DEFAULT_HOST
+
+TIMEOUT = 5  # SECONDS TO WAIT FOR ANY ONE SERVER MESSAGE
+
+
+async def receive(client, kind):
+    """Returns the client's next message, which must be of the given type."""
+    message = await asyncio.wait_for(client.receive(), TIMEOUT)
+    assert message is not None and message["type"] == kind, message
+    return message
+
+
+async def open_table(players=2):
+    """
+    Starts a loopback server with one full table and a known position:
+    seat 0 to play on R5 holding WILD, G3, B4, R7 and Y2.
+
+    Returns:
+        tuple: (server, clients, game)
+    """
+    server = await TresServer().start(DEFAULT_HOST, 0)
+    clients = []
+    for seat in range(players):
+        client = await TresClient().connect(DEFAULT_HOST, server.port)
+        client.send(f"NEW {players}" if seat == 0 else "JOIN 1")
+        await receive(client, "joined")
+        clients.append(client)
+    for client in clients:
+        await receive(client, "state")
+    game = server.tables[1].game
+    game.top = "R5"
+    game.phase = PHASE_PLAY
+    game.turn = 0
+    game.pending_skip = False
+    game.drawtwo_accum = game.wild_plus_4_accum = 0
+    game.hands[0] = TresHand(["WILD", "G3", "B4", "R7", "Y2"])
+    return server, clients, game
+
+
+async def close_table(server, clients):
+    for client in clients:
+        await client.close()
+    await server.close()
+
+
+def test_hands_are_private_and_other_draws_are_counts():
+    async def scenario():
+        server, clients, game = await open_table()
+        clients[0].send("DRAW")
+        mine = await receive(clients[0], "state")
+        theirs = await receive(clients[1], "state")
+        assert mine["hand"] == list(game.hands[0])
+        assert theirs["hand"] == list(game.hands[1])
+        assert "hands" not in mine and "hands" not in theirs
+        assert mine["hand_sizes"] == theirs["hand_sizes"] == [6, len(game.hands[1])]
+        drawn = [event for event in mine["events"] if event[0] == EVENT_DRAW]
+        seen = [event for event in theirs["events"] if event[0] == EVENT_DRAW]
+        assert drawn == [[EVENT_DRAW, 0, [game.hands[0][-1]], "draw"]]
+        assert seen == [[EVENT_DRAW, 0, 1, "draw"]]
+        await close_table(server, clients)
+    asyncio.run(scenario())
+
+
+def test_out_of_turn_command_gets_an_error():
+    async def scenario():
+        server, clients, game = await open_table()
+        clients[1].send("DRAW")
+        error = await receive(clients[1], "error")
+        assert "not your turn" in error["message"]
+        assert game.turn == 0 and len(game.hands[0]) == 5
+        await close_table(server, clients)
+    asyncio.run(scenario())
+
+
+def test_quit_mid_game_closes_the_table_for_other_seats():
+    async def scenario():
+        server, clients, game = await open_table(3)
+        clients[0].send("QUIT")
+        for client in clients[1:]:
+            await receive(client, "closed")
+        assert not server.tables
+        await close_table(server, clients)
+    asyncio.run(scenario())
+
+
+def test_malformed_wild_color_leaves_the_table_playable():
+    async def scenario():
+        server, clients, game = await open_table()
+        for command in ("PLAY WILD X", "PLAY WILD RG", "COLOR RG"):
+            clients[0].send(command)
+            await receive(clients[0], "error")
+        assert game.top == "R5" and "WILD" in game.hands[0]
+        clients[0].send("PLAY WILD G")
+        for client in clients:
+            state = await receive(client, "state")
+            assert state["top"] == "GWILD"
+        assert game.turn == 1
+        await close_table(server, clients)
+    asyncio.run(scenario())
@@ -0,0 +1,14 @@
+# ============================================================
+# TRES SIMULATION TESTS - Reproducible tournament statistics
+# ============================================================
+
+from tres_sim import run_tournament, GAMES_PER_CHUNK
+
+
+def test_same_seed_gives_same_stats_for_any_worker_count():
+    games = GAMES_PER_CHUNK + 37  # UNEVEN LAST CHUNK: Spans more than one chunk
+    kwargs = {"players": 3, "policies": ("greedy", "random"), "seed": 7, "max_turns": 400}
+    single = run_tournament(games, workers=1, **kwargs)
+    pooled = run_tournament(games, workers=4, **kwargs)
+    assert single["games"] == games
+    assert single == pooled
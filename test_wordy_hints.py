@@ -0,0 +1,38 @@
+# ============================================================
+# WORDY HINT TESTS - NumPy and NumPy-free hint paths agree
+# ============================================================
+
+import pytest
+
+import wordy_hints
+from wordy_feedback import score_guess, pattern_table
+from wordy_hints import HintEngine
+
+WORDS = ["crane", "slate", "trace", "crate", "react", "caret", "plumb", "stare", "tears", "rates"]
+
+
+def test_pattern_table_matches_the_matrix():
+    pytest.importorskip("numpy")
+    from wordy_feedback import pattern_matrix
+    assert list(pattern_table(WORDS)) == pattern_matrix(WORDS).ravel().tolist()
+
+
+def test_table_engine_gives_the_same_hints(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    matrix_engine = HintEngine.for_words(WORDS, cache_dir=tmp_path)
+    with monkeypatch.context() as patch:
+        patch.setattr(wordy_hints, "np", None)
+        table_engine = HintEngine.for_words(WORDS, cache_dir=tmp_path)
+    assert table_engine.matrix is None
+    assert list(tmp_path.glob("*.bin"))
+    for answer in WORDS:
+        matrix_engine.reset()
+        table_engine.reset()
+        while len(matrix_engine) > 1:
+            guess, bits = matrix_engine.best_guess()
+            assert table_engine.best_guess() == (guess, pytest.approx(bits))
+            pattern = score_guess(guess, answer)
+            matrix_engine.update(guess, pattern)
+            table_engine.update(guess, pattern)
+            assert table_engine.remaining() == matrix_engine.remaining()
+        assert answer in table_engine.remaining()
@@ -2,10 +2,12 @@
 # TRES GAME MODULE - CtrlUno Arcade Card Matching Game
 # ============================================================
 # Card matching game with unique punishment mechanics and multi-player support
-# Features: 2-4 players, special cards (SKIP/DRAWTWO/REVERSE/WILD), Tres punishment mechanic
+# Features: 2-16 players (humans and bots, extra decks merged in for big tables), special cards (SKIP/DRAWTWO/REVERSE/WILD), Tres punishment mechanic
+# Turtle UI driver over the headless rules engine in tres_engine.py
 
-# EXTERNAL LIBRARY IMPORTS - Random number generation for shuffling and gameplay, turtle for card visuals
-import random
+# EXTERNAL LIBRARY IMPORTS - Card shape geometry, crash log location, turtle for card visuals and input dialogs
+import math
+import os
 import turtle
 
 # SHARED MENU IMPORTS - Navigation to quit and help menus
@@ -13,14 +15,29 @@ import quit_menu
 import help_menu
 
 # Import turtle graphics helper for message display
-from gui import show_game_message, verify_player_turn, tg_print, SCREEN_CLEAR
+from gui import show_game_message, verify_player_turn, SCREEN_CLEAR
+
+# RULES ENGINE IMPORTS - Game state, card definitions and action/event vocabulary
+from tres_engine import (
+    TresGame, MIN_PLAYERS, MAX_PLAYERS, COLOR_SET, WILDS,
+    PHASE_COLOR, PHASE_PLAY, PHASE_DRAWTWO, PHASE_WILD4, PHASE_TRES, PHASE_SWAP,
+    PLAY, DRAW, PASS, ACCEPT, PUNISH, DECLINE, CHOOSE_COLOR, SWAP, is_playable, legal_moves,
+    EVENT_DRAW, EVENT_SKIP, EVENT_RESHUFFLE, EVENT_EXHAUSTED, EVENT_PUNISH, EVENT_ROTATE,
+)
+from tres_cards import CARD_NAMES
+
+# REPLAY LOG IMPORTS - Save the game's action log when something goes wrong
+from tres_replay import save_log
+
+# SAVE FILE IMPORTS - Suspend and resume games
+from tres_save import save_game, load_game, has_save, delete_save, SAVE_FILE
+
+# BOT IMPORTS - tres_bots (and its process pool modules) load when Tres starts, not with the arcade
 
 # ============================================================
 # GAME CONSTANTS SECTION - Configuration values and shortcuts
 # ============================================================
 
-PUNISHMENT_THRESHOLD = 40  # TRES PUNISHMENT THRESHOLD - Maximum distance for successful punishment guess (1-100 range)
-
 CARD_SHORTCUTS = {
     "W": "WILD", "W4": "WILD+4",
     "RD2": "RDRAWTWO", "GD2": "GDRAWTWO", "BD2": "BDRAWTWO", "YD2": "YDRAWTWO",
@@ -28,93 +45,75 @@ CARD_SHORTCUTS = {
     "RR": "RREVERSE", "GR": "GREVERSE", "BR": "BREVERSE", "YR": "YREVERSE"
 }
 
-# ============================================================
-# CARD TYPE DEFINITIONS - All card types in the Tres deck
-# ============================================================
-
-# NUMBERED CARDS - Standard playing cards with colors and values
-COLOR_CARDS = [f"{c}{n}" for c in "RGBY" for n in range(1, 10)]  # NUMBERED CARDS 1-9: R/G/B/Y colors (72 total - 2 of each)
-ZERO_CARDS = [f"{c}0" for c in "RGBY"]  # ZERO CARDS: Special cards with value 0, one per color (4 total)
-
-# ACTION CARDS - Special effect cards that modify gameplay
-SKIP_CARDS = [f"{c}SKIP" for c in "RGBY"]  # SKIP CARDS: Skip next player's turn (8 total - 2 per color)
-DRAWTWO_CARDS = [f"{c}DRAWTWO" for c in "RGBY"]  # DRAW TWO CARDS: Force next player to draw 2 cards (8 total - 2 per color, stackable)
-REVERSE_CARDS = [f"{c}REVERSE" for c in "RGBY"]  # REVERSE CARDS: Reverse turn order direction (8 total - 2 per color)
-
-# WILD CARDS - Color-changing cards with special powers
-WILD_CARDS = ["WILD"]  # WILD CARDS: Change color to any choice (4 total in deck)
-WILD_DRAW4_CARDS = ["WILD+4"]  # WILD DRAW FOUR CARDS: Change color and force next player to draw 4 (4 total, stackable)
+# HOUSE RULES - Names accepted at game setup -> rule variant overrides for the engine
+HOUSE_RULES = {
+    "jump_in": {"jump_in": True},
+    "seven_zero": {"seven_zero": True},
+    "draw_until_playable": {"draw_until_playable": True},
+    "no_stacking": {"stacking": False},
+}
 
-# CARD COLLECTIONS - Grouped card types for deck generation
-WILDS = WILD_CARDS + WILD_DRAW4_CARDS  # ALL WILD CARDS: Combined wild and wild+4 types
-SPECIAL_CARDS = SKIP_CARDS + DRAWTWO_CARDS + REVERSE_CARDS  # ALL SPECIAL ACTION CARDS
-CARDS = COLOR_CARDS + ZERO_CARDS + SPECIAL_CARDS + WILDS  # COMPLETE CARD TYPE LIST: All possible card types
+CRASH_LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tres_crash_log.json")  # REPLAY LOG: Written if a game stops on an error (replay with tres_replay.py)
 
 # ============================================================
-# GAME STATE VARIABLES - Track current game status
+# CARD FACE TABLE - Display colors and text per card, parsed once at import
 # ============================================================
 
-# GAME CONTROL FLAGS - Boolean flags for game flow and effects
-t = True  # LOOP CONTROL FLAG: Controls main game loop execution
-skip_in_effect = False  # SKIP EFFECT FLAG: True when next player should be skipped
-drawtwo_in_effect = False  # DRAW TWO EFFECT FLAG: True when draw two is pending on next player
-wild_plus_4_in_effect = False  # WILD PLUS FOUR EFFECT FLAG: True when wild+4 is pending on next player
-drawtwo_accum = 0  # DRAW TWO ACCUMULATOR: Tracks stacked draw two penalties
-wild_plus_4_accum = 0  # WILD PLUS FOUR ACCUMULATOR: Tracks stacked wild+4 penalties
-reverse_order = False  # REVERSE ORDER FLAG: True when turn order is reversed (clockwise/counterclockwise)
-
-# PLAYER STATE VARIABLES - Track player information and hands
-real_player_count = 0  # ACTIVE PLAYER COUNT: Number of players in current game (2-4)
-player_hands = []  # PLAYER HANDS LIST: Master list containing all player hands [player1, player2, player3, player4]
-current_card = ""  # CURRENT CARD IN PLAY: Top card of the discard pile
-current_player = 1  # CURRENT PLAYER NUMBER: Which player's turn it is (1-4)
-
-# INDIVIDUAL PLAYER HAND REFERENCES - Direct access to each player's cards
-player1_hand = []  # PLAYER ONE HAND: List of cards for player 1
-player2_hand = []  # PLAYER TWO HAND: List of cards for player 2
-player3_hand = []  # PLAYER THREE HAND: List of cards for player 3
-player4_hand = []  # PLAYER FOUR HAND: List of cards for player 4
-
-# ============================================================
-# CORE GAME FUNCTIONS - Deck management and game setup
-# ============================================================
+CARD_FILL_COLORS = {
+    'R': ('red', 'white'),
+    'G': ('green', 'white'),
+    'B': ('blue', 'white'),
+    'Y': ('#FDDA0D', 'black')
+}
 
-def gen_deck():
+def card_face(card_name):
     """
-    Creates and shuffles a complete Tres deck.
+    Parses a card name into its display colors and simplified text.
+    
+    Args:
+        card_name (str): Card identifier (e.g., "R5", "GWILD", "BDRAWTWO")
     
-    Deck: 72 color cards, 4 zeros, 8 skips, 8 draw-twos, 8 reverses, 8 wilds (100 total)
+    Returns:
+        tuple: (fill_color, text_color, display_text)
     """
-    deck = (
-        [card for card in COLOR_CARDS for _ in range(2)] +
-        ZERO_CARDS +
-        [card for card in SKIP_CARDS + DRAWTWO_CARDS + REVERSE_CARDS for _ in range(2)] +
-        [card for card in WILD_CARDS + WILD_DRAW4_CARDS for _ in range(4)]
-    )
-    random.shuffle(deck)
-    return deck
+    if card_name.startswith(('R', 'G', 'B', 'Y')):
+        card_value = card_name[1:]
+        fill_color, text_color = CARD_FILL_COLORS[card_name[0]]
+    else:
+        # Uncolored wild cards
+        fill_color, text_color = 'black', 'white'
+        card_value = card_name
+    
+    # Simplify card display text
+    display_text = card_value
+    if "DRAWTWO" in card_value:
+        display_text = "+2"
+    elif "WILD+4" in card_value:
+        display_text = "+4"
+    elif "WILD" in card_value:
+        display_text = "W"
+    elif "SKIP" in card_value:
+        display_text = "⊘"
+    elif "REVERSE" in card_value:
+        display_text = "⇄"
+    return fill_color, text_color, display_text
 
-# DECK AND DISCARD PILE GLOBALS - Module-level game state persistence
-deck = []  # MAIN DECK: Cards available to draw from
-played_cards = []  # DISCARD PILE: Cards that have been played
+CARD_FACES = {name: card_face(name) for name in CARD_NAMES}  # CARD FACE LOOKUP: Every hand card and colored wild top
 
+# ============================================================
+# GAME STATE VARIABLES - Track current game status
+# ============================================================
 
-def starting_hands():
-    """
-    Deals 7 cards to each player and removes them from deck.
-    """
-    global player_hands, deck
-    get_real_player_count()
-    
-    player_hands = [[], [], [], []]
-    for p in range(real_player_count):
-        player_hands[p] = list(deck[p * 7:(p + 1) * 7])
-    deck = deck[real_player_count * 7:]
+game = None  # ACTIVE GAME: TresGame rules engine state driven by this UI
+real_player_count = 0  # HUMAN PLAYER COUNT: Hot-seat players in current game, seated first (1-16)
+bot_player_count = 0  # BOT PLAYER COUNT: Computer players seated after the humans (0-15)
+bot_difficulty = None  # BOT DIFFICULTY: Key of tres_bots.DIFFICULTY_BUDGETS (search time per move), set by get_bot_difficulty()
+rule_variants = {}  # HOUSE RULES: Rule variant overrides for the current game (empty for standard rules)
+highlight_playable = False  # HIGHLIGHT MODE: Outline the cards that can be played on the top card
 
-def player_order():
-    """Returns current player sequence based on reverse_order flag."""
-    order = list(range(1, real_player_count + 1))
-    return order[::-1] if reverse_order else order
+# ============================================================
+# CORE GAME FUNCTIONS - Game setup and display
+# ============================================================
 
 def game_starting():
     """
@@ -131,18 +130,61 @@ def game_starting():
     show_game_message("Game is Starting!", starting_message)
     print(SCREEN_CLEAR)
 
-def setup_first_card():
+# ============================================================
+# CARD SPRITE CACHE - Card bodies pre-built once as compound turtle shapes
+# ============================================================
+
+CARD_CORNER_STEPS = 4  # POLYGON SEGMENTS PER ROUNDED CORNER
+CARD_CIRCLE_STEPS = 24  # POLYGON SEGMENTS FOR THE CENTER OVAL
+
+card_shapes = {}  # REGISTERED CARD SHAPES: (fill_color, width, height) -> turtle shape name
+
+def rounded_rect_points(width, height, radius):
     """
-    Places first card from deck into play and starts game countdown.
+    Returns polygon points for a rounded rectangle centered on (0, 0).
+    
+    Points are in turtle shape coordinates, which match screen coordinates
+    when the stamping turtle faces north (heading 90).
     """
-    global current_card, deck, played_cards
-    current_card = deck.pop(0)
-    played_cards.append(current_card)
-    game_starting()
-
-def draw_uno_card(x, y, card_name, width=60, height=90):
+    points = []
+    corners = ((width / 2 - radius, height / 2 - radius, 0),
+               (-width / 2 + radius, height / 2 - radius, 90),
+               (-width / 2 + radius, -height / 2 + radius, 180),
+               (width / 2 - radius, -height / 2 + radius, 270))
+    for center_x, center_y, start_angle in corners:
+        for step in range(CARD_CORNER_STEPS + 1):
+            angle = math.radians(start_angle + 90 * step / CARD_CORNER_STEPS)
+            points.append((center_x + radius * math.cos(angle), center_y + radius * math.sin(angle)))
+    return tuple(points)
+
+def circle_points(radius):
+    """Returns polygon points for a circle centered on (0, 0)."""
+    return tuple((radius * math.cos(2 * math.pi * step / CARD_CIRCLE_STEPS),
+                  radius * math.sin(2 * math.pi * step / CARD_CIRCLE_STEPS))
+                 for step in range(CARD_CIRCLE_STEPS))
+
+def card_shape(fill_color, width, height):
+    """
+    Returns the name of the turtle shape for a card body, registering it on first use.
+    
+    The shape holds the white border, the colored rounded face and the white
+    center oval, so a whole card body is one stamp. Shapes are shared by every
+    card with the same fill color and size; only the center text differs.
+    """
+    key = (fill_color, width, height)
+    if key not in card_shapes:
+        shape = turtle.Shape("compound")
+        shape.addcomponent(rounded_rect_points(width, height, 8), "white", "white")
+        shape.addcomponent(rounded_rect_points(width - 6, height - 6, 6), fill_color, fill_color)
+        shape.addcomponent(circle_points(25), "white", "white")
+        card_shapes[key] = f"tres_card_{fill_color}_{width}x{height}"
+        turtle.register_shape(card_shapes[key], shape)
+    return card_shapes[key]
+
+def draw_uno_card(x, y, card_name, width=60, height=90, pen=turtle, highlight=False):
     """
     Draws a single UNO-style card at the specified position.
+    Stamps the cached card body shape, then writes the card text on top.
     
     Args:
         x (int): X coordinate for card center
@@ -150,191 +192,230 @@ def draw_uno_card(x, y, card_name, width=60, height=90):
         card_name (str): Card identifier (e.g., "R5", "GWILD", "BDRAWTWO")
         width (int): Card width in pixels
         height (int): Card height in pixels
+        pen: Turtle that owns the drawing (defaults to the shared module turtle)
+        highlight (bool): Outline the card in gold (used for playable cards)
     """
-    # Parse card color and value
-    color_map = {
-        'R': ('red', 'white'),
-        'G': ('green', 'white'),
-        'B': ('blue', 'white'),
-        'Y': ('#FDDA0D', 'black')
-    }
-    
-    if card_name.startswith(('R', 'G', 'B', 'Y')):
-        color_char = card_name[0]
-        card_value = card_name[1:]
-        fill_color, text_color = color_map[color_char]
-    else:
-        # Uncolored wild cards
-        fill_color, text_color = 'black', 'white'
-        card_value = card_name
-    
-    # Draw rounded rectangle helper function
-    def draw_rounded_rect(x_pos, y_pos, w, h, radius, color):
-        turtle.penup()
-        turtle.goto(x_pos - w/2 + radius, y_pos - h/2)
-        turtle.setheading(0)
-        turtle.pendown()
-        turtle.color(color)
-        turtle.begin_fill()
-        
-        # Bottom edge
-        turtle.forward(w - 2*radius)
-        # Bottom-right corner
-        turtle.circle(radius, 90)
-        # Right edge
-        turtle.forward(h - 2*radius)
-        # Top-right corner
-        turtle.circle(radius, 90)
-        # Top edge
-        turtle.forward(w - 2*radius)
-        # Top-left corner
-        turtle.circle(radius, 90)
-        # Left edge
-        turtle.forward(h - 2*radius)
-        # Bottom-left corner
-        turtle.circle(radius, 90)
-        
-        turtle.end_fill()
-    
-    # Draw card outline (white border) with rounded corners
-    draw_rounded_rect(x, y, width, height, 8, "white")
-    
-    # Draw card inner rectangle (colored) with rounded corners
-    draw_rounded_rect(x, y, width - 6, height - 6, 6, fill_color)
-    
-    # Draw white oval in center
-    turtle.penup()
-    turtle.goto(x, y)
-    turtle.color("white")
-    turtle.dot(50)
+    # Look up precomputed card colors and display text
+    fill_color, text_color, display_text = CARD_FACES[card_name]
+    
+    # Stamp the card body (border, colored face and center oval) in one go
+    pen.penup()
+    if highlight:
+        # HIGHLIGHT OUTLINE - A slightly larger gold card body peeks out around the card
+        pen.shape(card_shape("gold", width + 10, height + 10))
+        pen.setheading(90)
+        pen.goto(x, y)
+        pen.stamp()
+    pen.shape(card_shape(fill_color, width, height))
+    pen.setheading(90)
+    pen.goto(x, y)
+    pen.stamp()
     
     # Display card value/text
-    turtle.penup()
-    turtle.goto(x, y - 12)
-    turtle.color(fill_color)
-    
-    # Simplify card display text
-    display_text = card_value
-    if "DRAWTWO" in card_value:
-        display_text = "+2"
-    elif "WILD+4" in card_value:
-        display_text = "+4"
-    elif "WILD" in card_value:
-        display_text = "W"
-    elif "SKIP" in card_value:
-        display_text = "⊘"
-    elif "REVERSE" in card_value:
-        display_text = "⇄"
+    pen.goto(x, y - 12)
+    pen.color(fill_color)
     
     font_size = 16 if len(display_text) <= 2 else 10
-    turtle.write(display_text, align="center", font=("Arial", font_size, "bold"))
-    
-    turtle.penup()
+    pen.write(display_text, align="center", font=("Arial", font_size, "bold"))
 
-def card_visuals(current_player, feedback_message=""):
+# ============================================================
+# TABLE VIEW - Retained-mode turtle view that only redraws dirty regions
+# ============================================================
+
+HAND_CARD_WIDTH = 60  # HAND CARD SIZE: Width and height of cards in the hand row
+HAND_CARD_HEIGHT = 90
+HAND_CARD_SPACING = 70  # HAND SLOT PITCH: Horizontal distance between hand slots
+HAND_ROW_SLOTS = 20  # SLOTS ACROSS THE WINDOW: Slot positions are fixed so a draw only adds one slot
+HAND_ROWS = 2  # VISIBLE HAND ROWS: Cards past HAND_PAGE_SIZE are reached by scrolling
+HAND_PAGE_SIZE = HAND_ROW_SLOTS * HAND_ROWS  # SLOTS ON SCREEN: Bounds how many cards are ever drawn
+HAND_Y = -60  # HAND ROW HEIGHT: Y coordinate of the first row of hand card centers
+HAND_ROW_SPACING = 100  # ROW PITCH: Vertical distance between hand rows
+SCROLL_COMMANDS = {">": 1, "<": -1}  # HAND SCROLLING INPUT: Next and previous page of a large hand
+
+def new_pen():
+    """Creates a hidden, pen-up turtle used to own one region of the table view."""
+    pen = turtle.Turtle(visible=False)
+    pen.penup()
+    pen.speed(0)
+    return pen
+
+def hand_slot_position(slot):
+    """Returns the (x, y) center of a visible hand slot; slots fill each row from the left."""
+    row, column = divmod(slot, HAND_ROW_SLOTS)
+    return (column - (HAND_ROW_SLOTS - 1) / 2) * HAND_CARD_SPACING, HAND_Y - row * HAND_ROW_SPACING
+
+class TableView:
     """
-    Displays current player's hand and the top card using turtle graphics.
+    Retained-mode view of the Tres table.
+    
+    Every region (player title, top card, feedback line, each hand slot) is
+    drawn by its own turtle, so it can be cleared and redrawn on its own.
+    The view remembers what each region currently shows and only redraws
+    regions whose content changed. Only one page of the hand (HAND_PAGE_SIZE
+    cards) is on screen at a time, so drawing cost does not grow with the
+    hand; scroll() moves between pages. Anything else that clears the screen
+    (messages, menus, the turn verification screen) removes the view's
+    turtles, which makes the next render rebuild the whole table.
     """
-    global current_card, player_hands
-
-    screen = turtle.Screen()
-    turtle.clearscreen()
-    screen.tracer(0)
-    screen.title(f"Tres - Player {current_player}'s Turn")
-    turtle.hideturtle()
-    screen.setup(width=1500, height=1000)
-    
-    # Display Current Player Indicator
-    turtle.penup()
-    turtle.goto(0, 320)
-    turtle.color("black")
-    turtle.write(f"Player {current_player}'s Turn", align="center", font=("Arial", 20, "bold"))
-
-    # Display current card in play with visual
-    turtle.penup()
-    turtle.goto(0, 260)
-    turtle.write("Current Card in Play:", align="center", font=("Arial", 14, "bold"))
-    
-    # Draw the current card visually
-    draw_uno_card(0, 170, current_card, width=70, height=100)
-    
-    # Display feedback message if any (multi-line support)
-    if feedback_message:
-        turtle.penup()
-        turtle.color("blue")
-        # Split message into lines if it's too long
-        lines = feedback_message.split('\n')
+    
+    def __init__(self):
+        self.pens = None  # REGION TURTLES: None until the table is built
+        self.slot_pens = []  # ONE TURTLE PER HAND SLOT
+        self.player = None  # RENDERED CONTENT: What each region shows right now
+        self.top = None
+        self.feedback = None
+        self.slots = []
+        self.pager = None
+        self.first = 0  # SCROLL POSITION: Hand index of the first visible card
+    
+    def is_built(self):
+        """Returns True while the table's turtles are still on screen."""
+        return self.pens is not None and self.pens["static"] in turtle.Screen().turtles()
+    
+    def build(self):
+        """Clears the screen and draws the parts of the table that never change."""
+        screen = turtle.Screen()
+        turtle.clearscreen()
+        screen.tracer(0)
+        turtle.hideturtle()
+        screen.setup(width=1500, height=1000)
+        
+        self.pens = {region: new_pen() for region in ("static", "player", "top", "feedback", "pager")}
+        self.slot_pens = []
+        self.player = self.top = self.feedback = self.pager = None
+        self.slots = []
+        
+        # STATIC LABELS - Drawn once per build
+        pen = self.pens["static"]
+        pen.color("black")
+        pen.goto(0, 260)
+        pen.write("Current Card in Play:", align="center", font=("Arial", 14, "bold"))
+        pen.goto(0, 30)
+        pen.write("Your Hand:", align="center", font=("Arial", 14, "bold"))
+        pen.goto(0, -300)
+        pen.write("Enter your card choice below, or 'draw/d' to draw a card ('p' toggles playable card highlights)", align="center", font=("Arial", 10, "italic"))
+        pen.goto(0, -320)
+        pen.color("gray")
+        pen.write("(Type 'h' for help or 'q' to quit)", align="center", font=("Arial", 8, "italic"))
+    
+    def draw_player(self, current_player):
+        """Redraws the current player indicator and window title."""
+        turtle.Screen().title(f"Tres - Player {current_player}'s Turn")
+        pen = self.pens["player"]
+        pen.clear()
+        pen.color("black")
+        pen.goto(0, 320)
+        pen.write(f"Player {current_player}'s Turn", align="center", font=("Arial", 20, "bold"))
+    
+    def draw_top(self, top):
+        """Redraws the card on top of the discard pile."""
+        pen = self.pens["top"]
+        pen.clear()
+        draw_uno_card(0, 170, top, width=70, height=100, pen=pen)
+    
+    def draw_feedback(self, feedback_message):
+        """Redraws the feedback message (multi-line support)."""
+        pen = self.pens["feedback"]
+        pen.clear()
+        pen.color("blue")
         start_y = 80
-        for i, line in enumerate(lines):
+        for i, line in enumerate(feedback_message.split('\n')):
             if line.strip():  # Only display non-empty lines
-                turtle.goto(0, start_y - (i * 15))
-                turtle.write(line, align="center", font=("Arial", 10, "normal"))
+                pen.goto(0, start_y - (i * 15))
+                pen.write(line, align="center", font=("Arial", 10, "normal"))
+    
+    def draw_slot(self, slot, card, highlight=False):
+        """Redraws one hand slot, or empties it when card is None."""
+        while len(self.slot_pens) <= slot:
+            self.slot_pens.append(new_pen())
+        pen = self.slot_pens[slot]
+        pen.clear()
+        if card is not None:
+            x, y = hand_slot_position(slot)
+            draw_uno_card(x, y, card, width=HAND_CARD_WIDTH, height=HAND_CARD_HEIGHT, pen=pen, highlight=highlight)
+    
+    def draw_pager(self, first, total):
+        """Redraws the hand page indicator, or clears it when the whole hand fits."""
+        pen = self.pens["pager"]
+        pen.clear()
+        if total > HAND_PAGE_SIZE:
+            pen.color("black")
+            pen.goto(0, -260)
+            last = min(first + HAND_PAGE_SIZE, total)
+            pen.write(f"Showing cards {first + 1}-{last} of {total} - type '<' or '>' to scroll",
+                      align="center", font=("Arial", 10, "bold"))
+    
+    def scroll(self, pages):
+        """
+        Moves the visible hand page; render() clamps the position to the hand.
+        
+        Args:
+            pages (int): Pages to move (1 for next, -1 for previous)
+        """
+        self.first = max(0, self.first + pages * HAND_PAGE_SIZE)
+    
+    def render(self, current_player, top, hand, feedback_message="", playable=()):
+        """
+        Brings the table up to date, redrawing only the regions that changed.
+        
+        Args:
+            current_player (int): Player number shown in the title
+            top (str): Card on top of the discard pile
+            hand (list): Cards in the current player's hand
+            feedback_message (str): Message shown above the hand
+            playable (collection): Cards to outline as playable
+        """
+        if not self.is_built():
+            self.build()
+        
+        if current_player != self.player:
+            self.draw_player(current_player)
+            self.player = current_player
+            self.first = 0
+        if top != self.top:
+            self.draw_top(top)
+            self.top = top
+        if feedback_message != self.feedback:
+            self.draw_feedback(feedback_message)
+            self.feedback = feedback_message
+        
+        # VISIBLE PAGE - Clamp the scroll position so the last page is never empty
+        self.first = min(self.first, max(len(hand) - 1, 0) // HAND_PAGE_SIZE * HAND_PAGE_SIZE)
+        visible = hand[self.first:self.first + HAND_PAGE_SIZE]
+        pager = (self.first, len(hand))
+        if pager != self.pager:
+            self.draw_pager(*pager)
+            self.pager = pager
+        
+        # HAND SLOTS - Redraw only slots whose card or highlight changed, empty the ones past the end
+        visible = [(card, card in playable) for card in visible]
+        for slot in range(max(len(visible), len(self.slots))):
+            card = visible[slot] if slot < len(visible) else None
+            shown = self.slots[slot] if slot < len(self.slots) else None
+            if card != shown:
+                name, highlight = card or (None, False)
+                self.draw_slot(slot, name, highlight)
+        self.slots = visible
+        
+        turtle.update()
 
-    # Display current player's hand label
-    turtle.color("black")
-    turtle.goto(0, 30)
-    turtle.write("Your Hand:", align="center", font=("Arial", 14, "bold"))
-    
-    # Draw cards in player's hand
-    hand = player_hands[current_player - 1]
-    num_cards = len(hand)
-    
-    # Calculate spacing and starting position
-    card_width = 60
-    card_spacing = 70
-    total_width = num_cards * card_spacing
-    start_x = -total_width / 2 + card_spacing / 2
-    card_y = -60
-    
-    for i, card in enumerate(hand):
-        card_x = start_x + i * card_spacing
-        draw_uno_card(card_x, card_y, card, width=card_width, height=90)
-    
-    # Instructions
-    turtle.goto(0, -180)
-    turtle.write("Enter your card choice below, or 'draw/d' to draw a card", align="center", font=("Arial", 10, "italic"))
-    
-    # Help text
-    turtle.goto(0, -200)
-    turtle.color("gray")
-    turtle.write("(Type 'h' for help or 'q' to quit)", align="center", font=("Arial", 8, "italic"))
-    
-    turtle.update()
+table_view = TableView()  # SHARED TABLE VIEW: Survives between calls so unchanged regions are kept
+
+def card_visuals(current_player, feedback_message=""):
+    """
+    Displays current player's hand and the top card using turtle graphics.
+    Only the regions that changed since the last call are redrawn.
+    In highlight mode the cards playable on the top card are outlined.
+    """
+    hand = game.hands[current_player - 1]
+    playable = legal_moves(hand, game.top) if highlight_playable and game.phase == PHASE_PLAY else ()
+    table_view.render(current_player, game.top, hand, feedback_message, playable)
     
     # Ask user which card they want to play
     card_input = turtle.textinput(f"Player {current_player}'s Turn", "Which card would you like to play? Or 'draw/d' to draw a card from the deck:")
 
     return card_input
 
-def draw_card():
-    """
-    Draws a card from deck; reshuffles discard pile if deck is empty.
-    
-    Returns drawn card or None if no cards available.
-    """
-    global deck, played_cards, current_card
-    
-    if deck:
-        return deck.pop(0)
-    
-    # DECK EXHAUSTION HANDLING - Reshuffle discard pile when deck is empty
-    if len(played_cards) > 1:
-        print("The deck is empty! Reshuffling the discard pile...")
-        cards_to_reshuffle = played_cards.copy()
-        if current_card in cards_to_reshuffle:
-            cards_to_reshuffle.remove(current_card)
-        
-        if cards_to_reshuffle:
-            random.shuffle(cards_to_reshuffle)
-            deck = cards_to_reshuffle
-            played_cards = [current_card]
-            return deck.pop(0)
-    
-    # ERROR CONDITION - No cards available in deck or discard pile
-    hand_display = player1_hand if 'player1_hand' in globals() else "unknown"
-    print(f"Error: No cards left to draw. There is no way this should happen. Please play a card if you can.\nReminder your hand is: {hand_display}\nThe current card in play is: {current_card}\n\n")
-    return None
-
 def tres_menu():
     """Displays welcome message and game rules."""
     welcome_message = """
@@ -353,98 +434,111 @@ Card Shortcuts (lower case accepted):
 - W4 for WILD+4
 - [Color]D2 for Draw Two (e.g., RD2, GD2, BD2, YD2)
 - [Color]S for SKIP (e.g., RS, GS, BS, YS)
-- [Color]R for REVERSE (e.g., RR, GR, BR, YR)"""
+- [Color]R for REVERSE (e.g., RR, GR, BR, YR)
+
+House rules (chosen at setup): jump_in, seven_zero,
+draw_until_playable and no_stacking.
+
+Very large hands are split into pages: type '<' or '>' to scroll.
+Type 'p' on your turn to highlight the cards you can play.
+Type 's' to save the game; quitting saves it automatically."""
     
     show_game_message("Welcome to Tres!", welcome_message, wait_for_ok=False)
 
-def draw_cards_and_display(current_player, num_cards, show_each=True, reason=None):
+def draw_cards_and_display(current_player, drawn_cards, reason=None):
     """
-    Draws multiple cards for a player and displays updated hand.
+    Displays cards a player just drew and their updated hand.
     
     Args:
-        current_player (int): The player drawing cards
-        num_cards (int): Number of cards to draw
-        show_each (bool): Whether to print each card as it's drawn
+        current_player (int): The player who drew the cards
+        drawn_cards (list): Cards drawn by the rules engine
         reason (str): Optional reason for drawing (e.g., "WILD+4 Attack", "Draw Two Attack")
     """
-    drawn_cards_list = []
-    
-    for _ in range(num_cards):
-        drawn_card = draw_card()
-        if drawn_card:
-            player_hands[current_player - 1].append(drawn_card)
-            drawn_cards_list.append(drawn_card)
-            if show_each:
-                print(f"You drew: {drawn_card}")
+    num_cards = len(drawn_cards)
+    hand = game.hands[current_player - 1]
     
     # Create feedback message with all drawn cards
-    if drawn_cards_list:
-        cards_str = ", ".join(drawn_cards_list)
+    if drawn_cards:
+        cards_str = ", ".join(drawn_cards)
         
         if reason:
             # Show reason along with drawn cards
-            feedback_message = f"{reason}\n\nYou drew {num_cards} card{'s' if num_cards > 1 else ''}:\n\n{cards_str}\n\nYour new hand has {len(player_hands[current_player - 1])} cards"
+            feedback_message = f"{reason}\n\nYou drew {num_cards} card{'s' if num_cards > 1 else ''}:\n\n{cards_str}\n\nYour new hand has {len(hand)} cards"
         else:
-            feedback_message = f"You drew {num_cards} card{'s' if num_cards > 1 else ''}:\n{cards_str}\n\nYour new hand has {len(player_hands[current_player - 1])} cards"
+            feedback_message = f"You drew {num_cards} card{'s' if num_cards > 1 else ''}:\n{cards_str}\n\nYour new hand has {len(hand)} cards"
         
         # Show the drawn cards in turtle graphics
         show_game_message(f"Player {current_player} - Cards Drawn", feedback_message)
         
-        print(f"Your new hand is: {player_hands[current_player - 1]}")
+        print(f"Your new hand is: {hand}")
 
-def advance_turn(player_sequence, current_index, clear_screen=True):
+def wait_for_continue(clear_screen=True):
     """
-    Advances to next player with pause and optional screen clear.
+    Pauses before the next player with optional screen clear.
     """
-    next_index = (current_index + 1) % len(player_sequence)
     turtle.textinput("Continue", "Press Enter when ready to continue...")
     if clear_screen:
         print(SCREEN_CLEAR)
-    return next_index
+
+def show_turn_events(events):
+    """
+    Displays rules engine events the acting player did not see directly.
+    Handles skipped turns, discard pile reshuffles and deck exhaustion.
+    
+    Args:
+        events (list): Events returned by game.apply()
+    """
+    for event in events:
+        if event[0] == EVENT_SKIP:
+            # SKIP EFFECT DISPLAY - Tell the skipped player their turn is gone
+            skipped_player = event[1] + 1
+            print(SCREEN_CLEAR)
+            skip_message = f"Player {skipped_player}'s turn is being SKIPPED!\n\nA SKIP card was played against you."
+            show_game_message(f"Player {skipped_player} - Turn Skipped!", skip_message)
+            wait_for_continue(clear_screen=False)
+        elif event[0] == EVENT_ROTATE:
+            # ZERO EFFECT DISPLAY - Every hand moved one seat along
+            rotate_message = f"A 0 was played!\n\nEvery player passed their hand to the {'next' if event[1] == 1 else 'previous'} player."
+            show_game_message("Hands Rotated!", rotate_message)
+        elif event[0] == EVENT_RESHUFFLE:
+            print("The deck is empty! Reshuffling the discard pile...")
+        elif event[0] == EVENT_EXHAUSTED:
+            # ERROR CONDITION - No cards available in deck or discard pile
+            print(f"Error: No cards left to draw. There is no way this should happen. Please play a card if you can.\nReminder your hand is: {game.hands[event[1]]}\nThe current card in play is: {game.top}\n\n")
+
+def drawn_cards_from(events, seat):
+    """Returns the cards a seat drew during one engine step."""
+    drawn = []
+    for event in events:
+        if event[0] == EVENT_DRAW and event[1] == seat:
+            drawn.extend(event[2])
+    return drawn
 
 # ============================================================
 # TRES PUNISHMENT MECHANIC - Special 3-card punishment system
 # ============================================================
 
-def check_and_execute_tres(current_player, player_sequence):
+def check_and_execute_tres(current_player):
     """
-    Checks for Tres condition (3 cards) and offers optional punishment.
+    Offers the optional Tres punishment to a player holding exactly 3 cards.
     
     Returns True if punishment executed, False otherwise.
     """
-    if len(player_hands[current_player - 1]) == 3:
-        tres_msg = f"Player {current_player} has exactly THREE cards!\n\nTRES!"
-        show_game_message("TRES!", tres_msg, wait_for_ok=False)
-        response = turtle.textinput("Tres Punishment", "Would you like to trigger the Tres punishment mechanic? (Y/Yes or N/No):")
-        if response is None:
-            print("No input provided. Tres punishment mechanic skipped.")
-            turtle.textinput("Continue", "Press Enter when ready to continue...")
-            return False
-        response = response.lower()
-        if response in ["y", "yes"]:
-            execute_tres_punishment(current_player, player_sequence)
-            return True
-        print("Tres punishment mechanic skipped.")
-        turtle.textinput("Continue", "Press Enter when ready to continue...")
-        return False
-    return False
-
-def check_win_and_tres(current_player, player_sequence):
-    """
-    Checks for win (0 cards) or Tres (3 cards) conditions.
-    
-    Returns True if player won, False otherwise.
-    """
-    hand_size = len(player_hands[current_player - 1])
-    if hand_size == 0:
-        win_msg = f"Congratulations!\n\nPlayer {current_player} WINS!"
-        show_game_message("WINNER!", win_msg)
+    tres_msg = f"Player {current_player} has exactly THREE cards!\n\nTRES!"
+    show_game_message("TRES!", tres_msg, wait_for_ok=False)
+    response = turtle.textinput("Tres Punishment", "Would you like to trigger the Tres punishment mechanic? (Y/Yes or N/No):")
+    if response is None:
+        print("No input provided. Tres punishment mechanic skipped.")
+    elif response.lower() in ["y", "yes"]:
+        execute_tres_punishment(current_player)
         return True
-    if hand_size == 3:
-        check_and_execute_tres(current_player, player_sequence)
+    else:
+        print("Tres punishment mechanic skipped.")
+    wait_for_continue(clear_screen=False)
+    show_turn_events(game.apply((DECLINE,)))
     return False
 
-def execute_tres_punishment(current_player, player_sequence):
+def execute_tres_punishment(current_player):
     """
     Executes Tres punishment: guess 1-100, others draw if you're close, you draw if not.
     
@@ -453,7 +547,6 @@ def execute_tres_punishment(current_player, player_sequence):
     - Outside 40: You draw punishment
     """
     print("Tres punishment mechanic activated!")
-    secret_number = random.randint(1, 100)
     
     while True:
         try:
@@ -468,71 +561,63 @@ def execute_tres_punishment(current_player, player_sequence):
         except ValueError:
             print("\n\nInvalid input. Please enter a valid integer between 1 and 100.\n\n")
     
-    # PUNISHMENT CALCULATION - Determine who draws cards and how many
-    others = [p for p in player_sequence if p != current_player]
+    # PUNISHMENT CALCULATION - Rules engine rolls the secret number and punishment amount
+    seat = current_player - 1
+    events = game.apply((PUNISH, guess))
+    _, _, _, secret_number, punishment_amount, targets = next(e for e in events if e[0] == EVENT_PUNISH)
     if guess == secret_number:
         result_msg = f"Incredible! You guessed the EXACT number!\n\nThe secret number was {secret_number}!\n\nEveryone else will be punished DOUBLE!"
-        punishment_amount, targets = random.randint(1, 10) * 2, others
-    elif abs(guess - secret_number) <= PUNISHMENT_THRESHOLD:
-        result_msg = f"Good guess! You were within {PUNISHMENT_THRESHOLD}!\n\nThe secret number was {secret_number}!\nYour guess was {guess}!\n\nEveryone else will be punished!"
-        punishment_amount, targets = random.randint(1, 10), others
+    elif seat not in targets:
+        result_msg = f"Good guess! You were within {game.punishment_threshold}!\n\nThe secret number was {secret_number}!\nYour guess was {guess}!\n\nEveryone else will be punished!"
     else:
-        result_msg = f"You failed! Your guess was not within {PUNISHMENT_THRESHOLD}!\n\nThe secret number was {secret_number}!\nYour guess was {guess}!\n\nYOU will be punished!"
-        punishment_amount, targets = random.randint(1, 10), [current_player]
+        result_msg = f"You failed! Your guess was not within {game.punishment_threshold}!\n\nThe secret number was {secret_number}!\nYour guess was {guess}!\n\nYOU will be punished!"
     
     # Show result message
     show_game_message("Tres Punishment Result", result_msg)
     
-    # PUNISHMENT APPLICATION - Draw cards for targeted players
+    # PUNISHMENT SUMMARY - Report the cards drawn by each targeted player
     drawn_cards_msg = []
-    for p in targets:
-        cards_drawn = []
-        for _ in range(punishment_amount):
-            drawn_card = draw_card()
-            if drawn_card:
-                player_hands[p - 1].append(drawn_card)
-                cards_drawn.append(drawn_card)
-                if p == current_player:
-                    print(f"You drew: {drawn_card}")
-        
-        if p == current_player:
-            drawn_cards_msg.append(f"You drew {punishment_amount} cards: {', '.join(cards_drawn)}")
-        else:
-            drawn_cards_msg.append(f"Player {p} drew {punishment_amount} cards")
+    if seat in targets:
+        cards_drawn = drawn_cards_from(events, seat)
+        for drawn_card in cards_drawn:
+            print(f"You drew: {drawn_card}")
+        drawn_cards_msg.append(f"You drew {punishment_amount} cards: {', '.join(cards_drawn)}")
+    else:
+        # One line for every other player, so big tables still fit in the message box
+        others = ", ".join(str(target + 1) for target in targets)
+        drawn_cards_msg.append(f"Player{'s' if len(targets) > 1 else ''} {others} drew {punishment_amount} cards each")
     
     # Show punishment summary
-    punishment_summary = f"{'Everyone else' if current_player not in targets else 'You'} must draw {punishment_amount} cards!\n\n" + "\n".join(drawn_cards_msg)
-    if current_player in targets:
-        punishment_summary += f"\n\nYour new hand has {len(player_hands[current_player - 1])} cards"
+    punishment_summary = f"{'Everyone else' if seat not in targets else 'You'} must draw {punishment_amount} cards!\n\n" + "\n".join(drawn_cards_msg)
+    if seat in targets:
+        punishment_summary += f"\n\nYour new hand has {len(game.hands[seat])} cards"
     
     show_game_message("Punishment Applied", punishment_summary)
+    show_turn_events(events)
 
 # ============================================================
 # TURN HANDLING FUNCTIONS - Player turn processing and validation
 # ============================================================
 
-def handle_player_turn(current_player, player_sequence):
+def handle_player_turn(current_player):
     """
-    Processes one player's turn: display hand, accept card/draw input, validate play, check win.
+    Processes one player's normal turn: display hand, accept card/draw input, play a legal card.
     
-    Returns: (game_over, player_sequence, reverse_played)
+    Returns True if the player won, False otherwise.
     """
-    global current_card, played_cards, skip_in_effect, drawtwo_in_effect
-    global wild_plus_4_in_effect, drawtwo_accum, wild_plus_4_accum, reverse_order
-    global player1_hand, player2_hand, player3_hand, player4_hand
+    global highlight_playable
+    seat = current_player - 1
+    hand = game.hands[seat]
     
     # PLAYER VERIFICATION - Show blank screen to prevent hand peeking
     verify_player_turn(current_player)
     
     print(SCREEN_CLEAR)
-    print(f"It is Player {current_player}'s turn.\nCurrent card on top: {current_card}\nYour hand is currently: {player_hands[current_player - 1]}\n\n")
+    print(f"It is Player {current_player}'s turn.\nCurrent card on top: {game.top}\nYour hand is currently: {hand}\n\n")
 
-    valid_move = False
-    game_over = False
-    reverse_played = False
     feedback_message = ""
     
-    while not valid_move:
+    while True:
         card_input = card_visuals(current_player, feedback_message)  # Display current player's hand and the top card using turtle graphics
         feedback_message = ""  # Clear feedback after displaying
         
@@ -545,96 +630,323 @@ def handle_player_turn(current_player, player_sequence):
 
         # DRAW CARD OPTION - Player chooses to draw instead of playing
         if card_input in ("DRAW", "D"):
-            drawn_card = draw_card()
-            if drawn_card:
-                player_hands[current_player - 1].append(drawn_card)
-                feedback_message = f"You drew: {drawn_card}"
-                print(f"\n\nYou drew: {drawn_card}\nYour new hand is: {player_hands[current_player - 1]}\nRemember, the card on top is still: {current_card}\n\n")
+            if not game.can_draw():
+                # DECK EXHAUSTION - Nothing left to draw, the turn passes
+                print(f"Error: No cards left to draw.\nReminder your hand is: {hand}\nThe current card in play is: {game.top}\n\n")
+                show_game_message("No Cards Left", "There are no cards left to draw!\n\nYour turn passes to the next player.")
+                show_turn_events(game.apply((PASS,)))
+                return False
+            events = game.apply((DRAW,))
+            drawn_cards = ", ".join(drawn_cards_from(events, seat))  # Several cards under draw_until_playable
+            feedback_message = f"You drew: {drawn_cards}"
+            print(f"\n\nYou drew: {drawn_cards}\nYour new hand is: {hand}\nRemember, the card on top is still: {game.top}\n\n")
+            show_turn_events(events)
             continue
 
-        # MENU NAVIGATION OPTIONS - Quit or help during turn
+        # MENU NAVIGATION OPTIONS - Save, quit or help during turn
+        if card_input in ("S", "SAVE"):
+            save_current_game()
+            feedback_message = f"Game saved to {SAVE_FILE}. Start Tres again to resume it."
+            continue
         if card_input in ("Q", "QUIT"):
+            save_current_game()  # AUTOSAVE: Quitting never loses the game
             quit_menu.quit_menu()
             continue
         if card_input in ("H", "HELP"):
             help_menu.help_menu()
             continue
         
+        # HAND SCROLLING - Show the next or previous page of a large hand
+        if card_input in SCROLL_COMMANDS:
+            table_view.scroll(SCROLL_COMMANDS[card_input])
+            continue
+        
+        # HIGHLIGHT TOGGLE - Outline (or stop outlining) the playable cards
+        if card_input == "P":
+            highlight_playable = not highlight_playable
+            feedback_message = f"Playable card highlights {'on' if highlight_playable else 'off'}"
+            continue
+        
         # CARD INPUT PROCESSING - Convert shortcuts and validate card play
         card_input = CARD_SHORTCUTS.get(card_input, card_input)
 
-        if card_input in player_hands[current_player - 1]:
-            is_valid, updated_card = is_valid_play(card_input, current_card)
-            if is_valid:
-                player_hands[current_player - 1].remove(card_input)
-                
-                # CARD PLAY EXECUTION - Update game state with played card
-                current_card = updated_card if card_input in ("WILD", "WILD+4") else card_input
-                played_cards.append(card_input)
-
-                # SPECIAL CARD EFFECTS - Activate card-specific effects
-                if card_input.endswith("SKIP"):
-                    skip_in_effect = True
-                elif card_input.endswith("DRAWTWO"):
-                    drawtwo_in_effect = True
-                    drawtwo_accum += 2
-                elif card_input.endswith("WILD+4"):
-                    wild_plus_4_in_effect = True
-                    wild_plus_4_accum += 4
-                elif card_input.endswith("REVERSE"):
-                    reverse_order = not reverse_order
-                    player_sequence = player_order()
-                    reverse_played = True
-                
-                valid_move = True
-
-                # WIN AND TRES CONDITION CHECKS - Check for game end or punishment
-                if len(player_hands[current_player - 1]) == 0:
-                    print(f"Player {current_player} wins!")
-                    game_over = True
-                    break
-                check_and_execute_tres(current_player, player_sequence)
+        if card_input in hand and is_valid_play(card_input, game.top):
+            color = prompt_wild_color(card_input) if card_input in WILDS else None
+            events = game.apply((PLAY, card_input, color))
+            
+            # WIN CONDITION CHECK - Rules engine ends the game on an empty hand
+            if game.is_over:
+                print(f"Player {current_player} wins!")
+                return True
+            show_turn_events(events)
+            return False
         
         # INVALID MOVE ERROR - Display error message for illegal plays
-        if not valid_move:
-            feedback_message = f"Invalid move! Card must match color, number, or type and must be in your hand. Try again. Card on top: {current_card}"
-            print(f"\n\nInvalid move! Try again.\nRemember, the card on top is still: {current_card}\nRemember your hand is currently: {player_hands[current_player - 1]}\n\n")
+        feedback_message = f"Invalid move! Card must match color, number, or type and must be in your hand. Try again. Card on top: {game.top}"
+        print(f"\n\nInvalid move! Try again.\nRemember, the card on top is still: {game.top}\nRemember your hand is currently: {hand}\n\n")
+
+def handle_penalty_turn(current_player):
+    """
+    Processes a turn with a pending DRAWTWO or WILD+4: stack another one or draw the penalty.
     
-    update_player_hands()
-    return game_over, player_sequence, reverse_played
+    Returns True if the player won by stacking their last card, False otherwise.
+    """
+    seat = current_player - 1
+    hand = game.hands[seat]
+    is_wild4 = game.phase == PHASE_WILD4
+    card_type = "WILD+4" if is_wild4 else "DRAW TWO"
+    penalty = game.wild_plus_4_accum if is_wild4 else game.drawtwo_accum
+    
+    print(SCREEN_CLEAR)
+    verify_player_turn(current_player)
+    
+    # STACKING OPTION - Check if player can counter with the same card type
+    stack_cards = list(dict.fromkeys(action[1] for action in game.legal_actions() if action[0] == PLAY))
+    if stack_cards:
+        print(f"Your current hand is: {hand}")
+        if is_wild4:
+            stack_input = turtle.textinput(f"Player {current_player}'s Turn", "You have a WILD+4. Would you like to play it now? (Y/Yes or N/No):")
+        else:
+            print(f"You have DRAWTWO card(s): {stack_cards}")
+            stack_input = turtle.textinput(f"Player {current_player}'s Turn", "Someone has played a DRAWTWO! You have a DRAWTWO card would you like to play one? (Y/Yes or N/No):")
+        if stack_input is None:
+            print("No input provided. Defaulting to No.")
+            stack_choice = "no"
+        else:
+            stack_choice = stack_input.lower()
+        
+        if stack_choice in ["y", "yes"]:
+            # STACKING EXECUTION - Player picks the card (and color for WILD+4) to stack
+            if is_wild4:
+                card_choice, color = "WILD+4", prompt_wild_color("WILD+4")
+            else:
+                card_choice, color = prompt_drawtwo_choice(current_player, stack_cards), None
+            events = game.apply((PLAY, card_choice, color))
+            print(f"You stacked {game.top}!")
+            if game.is_over:
+                return True
+            show_turn_events(events)
+            return False
+        if stack_choice not in ["n", "no"]:
+            print("\n\nInvalid input. Please respond with Y/Yes or N/No.\n\n")
+            return False
+        reason_msg = f"A {card_type} was played against you!\nYou chose not to counter! You must draw {penalty} cards."
+    else:
+        reason_msg = f"A {card_type} was played against you!\nYou don't have a {card_type} to counter! You must draw {penalty} cards."
+    
+    # PENALTY ACCEPTANCE - Draw the stacked penalty and pass the turn on
+    events = game.apply((ACCEPT,))
+    draw_cards_and_display(current_player, drawn_cards_from(events, seat), reason=reason_msg)
+    show_turn_events(events)
+    if game.phase != PHASE_TRES:
+        wait_for_continue(clear_screen=False)
+    return False
+
+def prompt_drawtwo_choice(current_player, drawtwo_cards):
+    """
+    Prompts player to pick which of their DRAWTWO cards to stack.
+    
+    Returns the chosen card (e.g., "RDRAWTWO").
+    """
+    while True:
+        card_choice = turtle.textinput(f"Player {current_player}'s Turn", f"Which DRAWTWO card would you like to play? {drawtwo_cards}")
+        if card_choice is None:
+            print("No input provided. Please try again.")
+            continue
+        card_choice = card_choice.upper()
+        # SHORTCUT CONVERSION - Convert shortcuts like RD2 to RDRAWTWO
+        card_choice = CARD_SHORTCUTS.get(card_choice, card_choice)
+        if card_choice in drawtwo_cards:
+            return card_choice
+        print(f"Invalid choice. Please choose from your DRAWTWO cards: {drawtwo_cards}")
+
+def handle_swap_turn(current_player):
+    """
+    Asks a player who just played a 7 (seven_zero house rule) whose hand to take.
+    """
+    seat = current_player - 1
+    hand_sizes = ", ".join(f"Player {other + 1}: {len(hand)}" for other, hand in enumerate(game.hands) if other != seat)
+    while True:
+        swap_input = turtle.textinput("Seven Played - Swap Hands", f"Which player do you want to swap hands with?\nCards held: {hand_sizes}")
+        if swap_input is None:
+            print("\n\nNo input provided. Please try again.\n\n")
+            continue
+        swap_input = swap_input.strip()
+        if swap_input.isdigit() and (SWAP, int(swap_input) - 1) in game.legal_actions():
+            break
+        print("\n\nInvalid choice. Please enter the number of another player.\n\n")
+    
+    target = int(swap_input) - 1
+    events = game.apply((SWAP, target))
+    print(SCREEN_CLEAR)
+    show_game_message("Hands Swapped!", f"You swapped hands with Player {target + 1}!\n\nYou now have {len(game.hands[seat])} cards.")
+    show_turn_events(events)
 
 # ============================================================
-# PLAYER SETUP FUNCTIONS - Player count and hand management
+# BOT TURN FUNCTIONS - Computer player moves
 # ============================================================
 
-def get_real_player_count():
+def describe_bot_action(current_player, action, events):
+    """
+    Builds a table-visible description of one bot action without revealing its hand.
+    
+    Returns a short message line.
+    """
+    name = f"Player {current_player} (Bot)"
+    if action[0] == PLAY:
+        return f"{name} played {game.top if action[1] in WILDS else action[1]}"
+    if action[0] == DRAW:
+        return f"{name} drew a card"
+    if action[0] == ACCEPT:
+        return f"{name} drew {len(drawn_cards_from(events, current_player - 1))} penalty cards"
+    if action[0] == PUNISH:
+        _, _, guess, secret_number, punishment_amount, targets = next(e for e in events if e[0] == EVENT_PUNISH)
+        victims = "everyone else" if current_player - 1 not in targets else "themselves"
+        return f"{name} triggered the Tres punishment!\nGuess {guess}, secret number {secret_number}: {victims} must draw {punishment_amount} cards"
+    if action[0] == SWAP:
+        return f"{name} swapped hands with Player {action[1] + 1}"
+    if action[0] == DECLINE:
+        return f"{name} has three cards but skipped the Tres punishment"
+    if action[0] == CHOOSE_COLOR:
+        return f"{name} chose {game.top} as the starting color"
+    return f"{name} has nothing to play and passes"
+
+def play_bot_turn(current_player):
     """
-    Prompts for and validates player count (2-4).
+    Lets a bot make every decision of its turn and shows what it did in one message.
+    
+    Returns True if the bot won, False otherwise.
     """
-    global real_player_count, t
-    while t:
+    from tres_bots import choose_action
+    seat = current_player - 1
+    lines = []
+    turn_events = []
+    while not game.is_over and game.turn == seat:
+        action = choose_action(game, bot_difficulty)
+        events = game.apply(action)
+        turn_events.extend(events)
+        lines.append(describe_bot_action(current_player, action, events))
+        if any(event[0] == EVENT_SKIP for event in events):
+            break
+    lines.append(f"\nPlayer {current_player} has {len(game.hands[seat])} cards left")
+    print(SCREEN_CLEAR)
+    show_game_message(f"Player {current_player} (Bot) - {bot_difficulty.title()}", "\n".join(lines))
+    show_turn_events(turn_events)
+    return game.is_over
+
+def bot_jump_in():
+    """
+    Lets the first bot holding the exact top card jump in (jump_in house rule).
+    Human players are not offered jump-ins, since their hands stay hidden between turns.
+    
+    Returns True if a bot jumped in.
+    """
+    for action in game.jump_in_actions():
+        if is_bot(action[1]):
+            events = game.apply(action)
+            print(SCREEN_CLEAR)
+            show_game_message("Jump In!", f"Player {action[1] + 1} (Bot) jumped in with a matching {action[2]}!")
+            show_turn_events(events)
+            return True
+    return False
+
+# ============================================================
+# PLAYER SETUP FUNCTIONS - Human and bot player counts
+# ============================================================
+
+def prompt_count(title, prompt, low, high):
+    """
+    Prompts until the player enters a whole number between low and high.
+    
+    Returns the validated number.
+    """
+    while True:
         try:
-            player_count_input = turtle.textinput("Player Count", "Enter the number of players (2-4):")
-            if player_count_input is None:
+            count_input = turtle.textinput(title, f"{prompt} ({low}-{high}):")
+            if count_input is None:
                 print("\n\nNo input provided. Please try again.\n\n")
                 continue
-            real_player_count = int(player_count_input)
-            if 2 <= real_player_count <= 4:
-                break
-            print("\n\nInvalid input. Please enter a number between 2 and 4.\n\n")
+            count = int(count_input)
+            if low <= count <= high:
+                return count
+            print(f"\n\nInvalid input. Please enter a number between {low} and {high}.\n\n")
         except ValueError:
-            print("\n\nInvalid input. Please enter a valid number between 2 and 4.\n\n")
+            print(f"\n\nInvalid input. Please enter a valid number between {low} and {high}.\n\n")
 
-def update_player_hands():
+def get_real_player_count():
     """
-    Syncs individual player_hand variables with player_hands list.
+    Prompts for and validates the number of human players (1-MAX_PLAYERS).
+    
+    Returns the validated player count.
     """
-    global player1_hand, player2_hand, player3_hand, player4_hand
-    player1_hand, player2_hand = player_hands[0], player_hands[1]
-    if real_player_count >= 3:
-        player3_hand = player_hands[2]
-    if real_player_count == 4:
-        player4_hand = player_hands[3]
+    global real_player_count
+    real_player_count = prompt_count("Player Count", "Enter the number of human players", 1, MAX_PLAYERS)
+    return real_player_count
+
+def get_bot_player_count():
+    """
+    Prompts for the number of bot players that fill the remaining seats.
+    Asks only when there is a choice; a lone human always gets at least one bot.
+    
+    Returns the validated bot count.
+    """
+    global bot_player_count
+    fewest = max(0, MIN_PLAYERS - real_player_count)
+    most = MAX_PLAYERS - real_player_count
+    if fewest == most:
+        bot_player_count = most
+    else:
+        bot_player_count = prompt_count("Bot Count", "Enter the number of bot players", fewest, most)
+    return bot_player_count
+
+def get_bot_difficulty():
+    """
+    Prompts for bot difficulty, which sets how long each bot searches per move.
+    
+    Returns the chosen difficulty name.
+    """
+    global bot_difficulty
+    from tres_bots import DIFFICULTY_BUDGETS, DEFAULT_DIFFICULTY
+    difficulties = list(DIFFICULTY_BUDGETS)
+    options = ", ".join(f"{i}: {name.title()}" for i, name in enumerate(difficulties, 1))
+    while True:
+        choice = turtle.textinput("Bot Difficulty", f"Choose bot difficulty ({options}):")
+        if choice is None:
+            print(f"No input provided. Defaulting to {DEFAULT_DIFFICULTY}.")
+            bot_difficulty = DEFAULT_DIFFICULTY
+            return bot_difficulty
+        choice = choice.strip().lower()
+        if choice.isdigit() and 1 <= int(choice) <= len(difficulties):
+            choice = difficulties[int(choice) - 1]
+        if choice in DIFFICULTY_BUDGETS:
+            bot_difficulty = choice
+            return bot_difficulty
+        print(f"\n\nInvalid choice. Please choose {options}.\n\n")
+
+def get_rule_variants():
+    """
+    Prompts for optional house rules (HOUSE_RULES names, comma separated).
+    Blank input keeps the standard rules.
+    
+    Returns the rule variant overrides for the engine.
+    """
+    global rule_variants
+    options = ", ".join(HOUSE_RULES)
+    while True:
+        rules_input = turtle.textinput("House Rules", f"Optional house rules, comma separated ({options}).\nLeave blank for standard rules:")
+        names = [name.strip().lower() for name in (rules_input or "").split(",") if name.strip()]
+        unknown = [name for name in names if name not in HOUSE_RULES]
+        if not unknown:
+            break
+        print(f"\n\nUnknown house rule(s): {', '.join(unknown)}. Choose from {options}.\n\n")
+    rule_variants = {}
+    for name in names:
+        rule_variants.update(HOUSE_RULES[name])
+    return rule_variants
+
+def is_bot(seat):
+    """True if a seat is played by a bot (bots sit after the human players)."""
+    return seat >= real_player_count
 
 # ============================================================
 # CARD VALIDATION FUNCTIONS - Play legality and wild card handling
@@ -644,7 +956,7 @@ def prompt_wild_color(card):
     """
     Prompts player to choose color for wild card (R/G/B/Y).
     
-    Returns color-prefixed card (e.g., "RWILD", "GWILD+4").
+    Returns the chosen color letter (e.g., "R").
     """
     while True:
         choice = turtle.textinput("Wild Card Color", f"You played {card}! What color do you want to choose? (R, G, B, Y):")
@@ -652,282 +964,79 @@ def prompt_wild_color(card):
             print("\n\nNo input provided. Please try again.\n\n")
             continue
         choice = choice.upper()
-        if choice in ["R", "G", "B", "Y"]:
-            updated_card = choice + card
-            color_names = {"R": "RED", "G": "GREEN", "B": "BLUE", "Y": "YELLOW"}
-            print(f"You chose {choice} as the new color.\nThe card on top is now: {updated_card}")
-            return updated_card
+        if choice in COLOR_SET:
+            print(f"You chose {choice} as the new color.\nThe card on top is now: {choice + card}")
+            return choice
         print("\n\nInvalid color choice. Please choose R, G, B, or Y.\n\n")
 
 def is_valid_play(card, current_card):
     """
     Determines if a proposed card play is legal according to Tres rules.
-    Handles color matching, number matching, and wild card logic.
-    
-    Validation Rules:
-    - Colors must match (first character): R, G, B, Y
-    - Numbers must match (remaining characters): 0-9
-    - Wild cards (Wild) are always playable and change color
-    - Wild cards prompt for new color selection
+    Thin wrapper over the rules engine that explains rejected plays on the console.
     
     Args:
         card (str): Card player wants to play (e.g., "R5", "WILD")
         current_card (str): Current card on top of play pile
         
     Returns:
-        tuple: (is_valid_boolean, updated_current_card)
-               For wild cards, updated_card includes chosen color
+        bool: True if the play is legal
     """
-    card = card.upper()  # INPUT NORMALIZATION - Convert to uppercase for matching
-
-    # SPECIAL CARD ON TOP VALIDATION - SKIP, DRAWTWO, REVERSE card rules
+    if is_playable(card, current_card):
+        return True
+    
+    # INVALID PLAY ERROR MESSAGE - Generate specific error for card type on top
     if current_card.endswith(("SKIP", "DRAWTWO", "REVERSE")):
-        # WILD CARD EXCEPTION - Wild cards can be played on any card
-        if card in ("WILD", "WILD+4"):
-            return True, prompt_wild_color(card)
-        # COLOR MATCH RULE - Same color cards are valid
-        if card[0] == current_card[0]:
-            return True, current_card
-        # DRAWTWO STACKING RULE - Any DRAWTWO can stack on another DRAWTWO
-        if current_card.endswith("DRAWTWO") and card.endswith("DRAWTWO"):
-            return True, current_card
-        # INVALID PLAY ERROR MESSAGE - Generate specific error for card type
         card_type = "SKIP" if current_card.endswith("SKIP") else "DRAWTWO" if current_card.endswith("DRAWTWO") else "REVERSE"
-        rules = "a SKIP card of the same color, a card of the same color" if card_type == "SKIP" else "any DRAWTWO card, a card of the same color" if card_type == "DRAWTWO" else "a REVERSE card of the same color, a card of the same color"
+        rules = "a card of the same color" if card_type != "DRAWTWO" else "any DRAWTWO card, a card of the same color"
         print(f"\n\nInvalid play. When a {card_type} is on top you must play {rules}, or a WILD card.\n\n")
-        return False, current_card
-    
-    # WILD PLUS FOUR ON TOP VALIDATION - WILD+4 specific play rules
-    if current_card.endswith("WILD+4"):
-        if card == "WILD+4" or card == "WILD":
-            return True, prompt_wild_color(card)
-        if card[0] == current_card[0]:
-            return True, current_card
+    elif current_card.endswith("WILD+4"):
         print("\n\nInvalid play. When a WILD+4 is on top you must play the same color or another WILD+4.\n\n")
-        return False, current_card
-
-    # REGULAR WILD ON TOP VALIDATION - WILD card (not WILD+4) play rules
-    if current_card.endswith("WILD") and not current_card.endswith("WILD+4"):
-        if card[0] == current_card[0] or card in ("WILD", "WILD+4"):
-            return (True, prompt_wild_color(card)) if card in ("WILD", "WILD+4") else (True, current_card)
+    elif current_card.endswith("WILD"):
         print("\n\nInvalid play. When a WILD is on top you must play the same color or another WILD card.\n\n")
-        return False, current_card
-
-    # STANDARD COLOR OR WILD MATCH - Basic matching rules for numbered cards
-    if card in ("WILD", "WILD+4") or card[0] == current_card[0]:
-        return (True, prompt_wild_color(card)) if card in ("WILD", "WILD+4") else (True, current_card)
-
-    # NUMBER MATCHING RULE - Cards with same number are valid regardless of color
-    if card[1:].isdigit() and current_card[1:].isdigit() and card[1:] == current_card[1:]:
-        return True, current_card
-
-    return False, current_card
+    return False
 
 # ============================================================
-# MAIN GAME LOOP - Core turn management and special card effects
+# MAIN GAME LOOP - Routes each engine decision to its turtle prompt
 # ============================================================
 
-def game_loop(starting_player=1):
+def game_loop():
     """
-    Main game loop: manages turns, handles special card effects (SKIP/DRAWTWO/WILD+4), checks win conditions.
+    Main game loop: asks the player at game.turn for each decision the rules engine needs until someone wins.
+    If a turn fails with an error, the game's replay log is saved to CRASH_LOG_FILE first.
     """
-    global player1_hand, player2_hand, player3_hand, player4_hand, played_cards, current_card, skip_in_effect, drawtwo_in_effect, wild_plus_4_in_effect, drawtwo_accum, wild_plus_4_accum, reverse_order
-    
-    game_over = False
-    
-    # TURN ORDER INITIALIZATION - Set up player sequence and starting position
-    player_sequence = player_order()
-    
-    # STARTING PLAYER INDEX - Find position of starting player in sequence
-    current_index = player_sequence.index(starting_player)
-    
-    while not game_over:
-        current_player = player_sequence[current_index]
-        
-        # WILD PLUS FOUR EFFECT PROCESSING - Handle pending WILD+4 draw penalty
-        if wild_plus_4_in_effect:
-            verify_player_turn(current_player)
-            print(SCREEN_CLEAR)
-            
-            # WILD PLUS FOUR STACKING OPTION - Check if player can counter with their own WILD+4
-            if "WILD+4" in player_hands[current_player - 1]:
-                play_W4_input = turtle.textinput(f"Player {current_player}'s Turn", "You have a WILD+4. Would you like to play it now? (Y/Yes or N/No):")
-                if play_W4_input is None:
-                    print("No input provided. Defaulting to No.")
-                    play_W4 = "no"
-                else:
-                    play_W4 = play_W4_input.lower()
-                if play_W4 in ["y", "yes"]:
-                    # WILD PLUS FOUR STACKING EXECUTION - Player chooses to stack their WILD+4
-                    print(f"Your current hand is: {player_hands[current_player - 1]}")
-                    card_input = turtle.textinput(f"Player {current_player}'s Turn", "What color WILD+4 card would you like to play? (R, G, B, Y):")
-                    if card_input is None:
-                        print("No input provided. Please try again.")
-                        continue
-                    card_input = card_input.upper()
-                    while card_input not in ["R", "G", "B", "Y"]:
-                        card_input = turtle.textinput(f"Player {current_player}'s Turn", "Invalid color choice. Please choose R, G, B, or Y:")
-                        if card_input is None:
-                            print("No input provided. Please try again.")
-                            break
-                        card_input = card_input.upper()
-                    
-                    # Check if card_input is valid before proceeding
-                    if card_input is None or card_input not in ["R", "G", "B", "Y"]:
-                        print("Invalid input. Please try again.")
-                        continue
-                    
-                    colored_card = card_input + "WILD+4"
-
-                    # WILD PLUS FOUR VALIDATION - Verify player has uncolored WILD+4 in hand
-                    if "WILD+4" in player_hands[current_player - 1]:
-                        player_hands[current_player - 1].remove("WILD+4")
-                        current_card = colored_card
-                        played_cards.append("WILD+4")  # DISCARD PILE UPDATE - Store uncolored version
-                        wild_plus_4_in_effect = True
-                        wild_plus_4_accum += 4  # ACCUMULATOR INCREMENT - Stack 4 more cards to penalty
-                        print(f"You played {colored_card}!")
-
-                        # WIN AND TRES CHECKS AFTER STACKING - Check game end conditions
-                        game_over = check_win_and_tres(current_player, player_sequence)
-
-                        # TURN ADVANCEMENT AFTER STACKING - Pass effect to next player
-                        if not game_over:
-                            current_index = (current_index + 1) % len(player_sequence)
-                        continue
-                    else:
-                        print("\n\n Invalid card. Please play a WILD+4 card. Please try again.\n\n")
-                        continue
-
-                elif play_W4 in ["n", "no"]:
-                    # WILD PLUS FOUR PENALTY ACCEPTANCE - Player accepts draw penalty
-                    reason_msg = f"A WILD+4 was played against you!\nYou chose not to counter! You must draw {wild_plus_4_accum} cards."
-                    draw_cards_and_display(current_player, wild_plus_4_accum, reason=reason_msg)
-                    
-                    # TRES CHECK AFTER DRAWING - Check if drawing cards triggered Tres
-                    check_and_execute_tres(current_player, player_sequence)
-                    
-                    # WILD PLUS FOUR EFFECT RESET - Clear effect flags and accumulator
-                    wild_plus_4_in_effect = False
-                    wild_plus_4_accum = 0
-                    current_index = advance_turn(player_sequence, current_index, clear_screen=False)
-                    print("\n" *1)
-                    continue
-                else:
-                    print("Invalid input. Please respond with Y/Yes or N/No.")
-                    continue
-
-            # WILD PLUS FOUR FORCED DRAW - Player has no WILD+4 to counter with
-            reason_msg = f"A WILD+4 was played against you!\nYou don't have a WILD+4 to counter! You must draw {wild_plus_4_accum} cards."
-            draw_cards_and_display(current_player, wild_plus_4_accum, reason=reason_msg)
-
-            # TRES CHECK AFTER FORCED DRAW - Check if drawing cards triggered Tres
-            check_and_execute_tres(current_player, player_sequence)
-
-            # WILD PLUS FOUR EFFECT CLEANUP - Reset flags after penalty applied
-            wild_plus_4_in_effect = False
-            wild_plus_4_accum = 0
-            current_index = advance_turn(player_sequence, current_index, clear_screen=False)
-            continue
-        
-        # SKIP EFFECT PROCESSING - Handle pending SKIP card effect
-        if skip_in_effect:
-            print(SCREEN_CLEAR)
-            skip_message = f"Player {current_player}'s turn is being SKIPPED!\n\nA SKIP card was played against you."
-            show_game_message(f"Player {current_player} - Turn Skipped!", skip_message)
-            # SKIP EFFECT RESET - Clear skip flag after consuming
-            skip_in_effect = False
-            # SKIP TURN ADVANCEMENT - Move to next player
-            current_index = advance_turn(player_sequence, current_index, clear_screen=False)
-            continue
-
-        # DRAW TWO EFFECT PROCESSING - Handle pending DRAWTWO draw penalty
-        if drawtwo_in_effect:
-            print(SCREEN_CLEAR)
-            verify_player_turn(current_player)
+    try:
+        while not game.is_over:
+            current_player = game.turn + 1
             
-            # DRAW TWO STACKING OPTION - Check if player has any DRAWTWO to counter
-            player_drawtwo_cards = [card for card in player_hands[current_player - 1] if card.endswith("DRAWTWO")]
-            if player_drawtwo_cards:
-                print(f"Your current hand is: {player_hands[current_player - 1]}")
-                print(f"You have DRAWTWO card(s): {player_drawtwo_cards}")
-                play_D2_input = turtle.textinput(f"Player {current_player}'s Turn", "Someone has played a DRAWTWO! You have a DRAWTWO card would you like to play one? (Y/Yes or N/No):")
-                if play_D2_input is None:
-                    print("No input provided. Defaulting to No.")
-                    play_D2 = "no"
-                else:
-                    play_D2 = play_D2_input.lower()
-                if play_D2 in ["y", "yes"]:
-                    # DRAW TWO STACKING EXECUTION - Player chooses which DRAWTWO to play
-                    valid_choice = False
-                    while not valid_choice:
-                        card_choice = turtle.textinput(f"Player {current_player}'s Turn", f"Which DRAWTWO card would you like to play? {player_drawtwo_cards}")
-                        if card_choice is None:
-                            print("No input provided. Please try again.")
-                            continue
-                        card_choice = card_choice.upper()
-                        # SHORTCUT CONVERSION - Convert shortcuts like RD2 to RDRAWTWO
-                        card_choice = CARD_SHORTCUTS.get(card_choice, card_choice)
-                        
-                        if card_choice in player_drawtwo_cards:
-                            # DRAW TWO CARD REMOVAL - Remove played card from hand
-                            player_hands[current_player - 1].remove(card_choice)
-                            played_cards.append(card_choice)
-                            current_card = card_choice
-                            # DRAW TWO ACCUMULATION - Stack 2 more cards to penalty
-                            drawtwo_in_effect = True
-                            drawtwo_accum += 2
-                            print(f"You stacked {card_choice}!")
-                            valid_choice = True
-                        else:
-                            print(f"Invalid choice. Please choose from your DRAWTWO cards: {player_drawtwo_cards}")
-                    
-                    # WIN AND TRES CHECKS AFTER DRAW TWO - Check game end conditions
-                    game_over = check_win_and_tres(current_player, player_sequence)
-                    
-                    # TURN ADVANCEMENT AFTER DRAW TWO STACK - Pass effect to next player
-                    if not game_over:
-                        current_index = (current_index + 1) % len(player_sequence)
-                    continue
-                elif play_D2 in ["n", "no"]:
-                    # DRAW TWO PENALTY ACCEPTANCE - Player accepts draw penalty
-                    reason_msg = f"A DRAW TWO was played against you!\nYou chose not to counter! You must draw {drawtwo_accum} cards."
-                    draw_cards_and_display(current_player, drawtwo_accum, reason=reason_msg)
-                    
-                    # TRES CHECK AFTER DRAWING - Check if drawing cards triggered Tres
-                    check_and_execute_tres(current_player, player_sequence)
-                    
-                    # DRAW TWO EFFECT RESET - Clear effect flags and accumulator
-                    drawtwo_in_effect = False
-                    drawtwo_accum = 0
-                    current_index = advance_turn(player_sequence, current_index, clear_screen=False)
-                    continue
-                else:
-                    print("\n\nInvalid input. Please respond with Y/Yes or N/No.\n\n")
-                    continue
-
-            # DRAW TWO FORCED DRAW - Player has no DRAWTWO to counter with
-            reason_msg = f"A DRAW TWO was played against you!\nYou don't have a DRAW TWO to counter! You must draw {drawtwo_accum} cards."
-            draw_cards_and_display(current_player, drawtwo_accum, reason=reason_msg)
-
-            # TRES CHECK AFTER FORCED DRAW - Check if drawing cards triggered Tres
-            check_and_execute_tres(current_player, player_sequence)
-
-            # DRAW TWO EFFECT CLEANUP - Reset flags after penalty applied
-            drawtwo_in_effect = False
-            drawtwo_accum = 0
-            current_index = advance_turn(player_sequence, current_index, clear_screen=False)
-            continue
-
-        # NORMAL TURN PROCESSING - No special effects active, handle regular turn
-        game_over, player_sequence, reverse_played = handle_player_turn(current_player, player_sequence)
-        
-        if not game_over:
-            # REVERSE EFFECT HANDLING - Recalculate player position after reverse
-            if reverse_played:
-                current_index = player_sequence.index(current_player)
-            # TURN ADVANCEMENT - Move to next player in sequence
-            current_index = (current_index + 1) % len(player_sequence)
+            if bot_jump_in():
+                # JUMP IN PROCESSING - A bot played the exact top card out of turn
+                continue
+            if is_bot(game.turn):
+                # BOT TURN PROCESSING - Bot searches for its move, then it is shown to the table
+                play_bot_turn(current_player)
+            elif game.phase in (PHASE_WILD4, PHASE_DRAWTWO):
+                # PENALTY PROCESSING - Handle pending WILD+4 or DRAWTWO draw penalty
+                handle_penalty_turn(current_player)
+            elif game.phase == PHASE_TRES:
+                # TRES PROCESSING - Player reached exactly three cards
+                check_and_execute_tres(current_player)
+            elif game.phase == PHASE_SWAP:
+                # SEVEN SWAP PROCESSING - Player who played a 7 picks whose hand to take
+                handle_swap_turn(current_player)
+            else:
+                # NORMAL TURN PROCESSING - No special effects active, handle regular turn
+                handle_player_turn(current_player)
+    except turtle.Terminator:
+        raise  # WINDOW CLOSED: Not a bug, nothing to save
+    except Exception:
+        # CRASH LOG - Everything needed to replay the game up to the failing turn
+        save_log(game, CRASH_LOG_FILE)
+        print(f"Tres stopped on an error. The game log was saved to {CRASH_LOG_FILE}")
+        raise
+    
+    delete_save()  # FINISHED GAME: Nothing left to resume
+    win_msg = f"Congratulations!\n\nPlayer {game.winner + 1} WINS!"
+    show_game_message("WINNER!", win_msg)
 
     # PLAY AGAIN MENU - Prompt for game restart or return to main menu
     while True:        
@@ -957,6 +1066,50 @@ def game_loop(starting_player=1):
         else:
             print("\n\nInvalid choice. Please try again. Enter y/yes or n/no.")
 
+# ============================================================
+# SAVE AND RESUME - Suspended games in SAVE_FILE
+# ============================================================
+
+def save_current_game():
+    """Saves the game in progress and the table settings to SAVE_FILE."""
+    settings = {"humans": real_player_count, "bots": bot_player_count,
+                "difficulty": bot_difficulty, "rules": rule_variants}
+    save_game(game, settings)
+    print(f"Game saved to {SAVE_FILE}")
+
+def resume_saved_game():
+    """
+    Offers to resume the suspended game in SAVE_FILE.
+    
+    Returns True if a saved game was loaded into the game state variables,
+    False to start a new game, or None if the dialog was cancelled. The save
+    is only deleted on an explicit no; cancelling keeps it for later.
+    """
+    global game, real_player_count, bot_player_count, bot_difficulty, rule_variants
+    if not has_save():
+        return False
+    while True:
+        resume_input = turtle.textinput("Saved Game Found", "Resume your saved Tres game? (Y/Yes, or N/No to discard it):")
+        if resume_input is None:
+            return None  # CANCELLED: Keep the save on disk and go back to the menu
+        answer = resume_input.strip().lower()
+        if answer in ("n", "no"):
+            delete_save()  # EXPLICIT NO: Only a clear answer discards the save
+            return False
+        if answer in ("y", "yes"):
+            break
+        print("\n\nInvalid input. Please respond with Y/Yes or N/No.\n\n")
+    try:
+        game, settings = load_game()
+        real_player_count, bot_player_count = settings["humans"], settings["bots"]
+        bot_difficulty, rule_variants = settings["difficulty"], settings["rules"]
+    except (OSError, ValueError, KeyError) as error:
+        print(f"Could not load {SAVE_FILE}: {error}")
+        show_game_message("Save Not Loaded", "The saved game could not be loaded.\n\nStarting a new game instead.")
+        return False
+    show_game_message("Game Resumed!", f"Welcome back!\n\nThe card on top is {game.top}.\nIt is Player {game.turn + 1}'s turn.")
+    return True
+
 # ============================================================
 # GAME INITIALIZATION - Main entry point and setup
 # ============================================================
@@ -967,81 +1120,76 @@ def tres_main():
     Handles complete game setup, execution, and cleanup.
     
     Initialization Sequence:
-    1. Reset all game state variables for clean start
-    2. Generate and shuffle new deck
-    3. Display rules and get player count
-    4. Deal starting hands and set up first card
-    5. Launch main game loop
-    6. Handle post-game replay options
+    0. Offer to resume a saved game (goes straight to the game loop, cancel returns to the menu)
+    1. Display rules and get human/bot player counts and bot difficulty
+    2. Create a fresh TresGame (shuffled deck, starting hands, first card)
+    3. Handle first card effects that need player input or a message
+    4. Launch main game loop
+    5. Handle post-game replay options
+    6. Shut down the bot worker pool
     
     Global Variables Reset:
-        deck, played_cards, player_hands: Clean slate for new game
-        Individual player hand references: Reset to empty lists
+        game: New rules engine state for a clean start
     """
-    global deck, played_cards, player_hands, player1_hand, player2_hand, player3_hand, player4_hand, skip_in_effect, drawtwo_in_effect, wild_plus_4_in_effect, current_card, drawtwo_accum, wild_plus_4_accum, current_player, reverse_order, t
-    
-    # DECK RESET - Generate fresh shuffled deck for new game
-    deck = gen_deck()
-    played_cards = []
-    player_hands = [[], [], [], []]  # PLAYER HANDS RESET - Clear all player hands
-    
-    # INDIVIDUAL HAND GLOBALS RESET - Clear direct player hand references
-    player1_hand = player2_hand = player3_hand = player4_hand = []
-    
-    # GAME STATE FLAGS RESET - Clear all special card effects
-    skip_in_effect = drawtwo_in_effect = wild_plus_4_in_effect = False
-    drawtwo_accum = wild_plus_4_accum = 0
-    reverse_order = False
-    t = True  # LOOP CONTROL RESET - Enable game loop
+    global game
+    # BOT IMPORTS - Loaded on the first Tres game so launching the arcade skips the process pool modules
+    from tres_bots import shutdown_pool
+    
+    # RESUME CHECK - Continue a suspended game straight into the game loop
+    resumed = resume_saved_game()
+    if resumed is None:
+        return  # RESUME CANCELLED: Back to the arcade menu with the save kept
+    if resumed:
+        try:
+            game_loop()
+        finally:
+            shutdown_pool()  # BOT WORKERS: Stop the search processes when Tres ends or the arcade exits
+        return
     
     tres_menu()
-    starting_hands()
-    update_player_hands()
-    setup_first_card()
+    get_real_player_count()
+    if get_bot_player_count():
+        get_bot_difficulty()
+    get_rule_variants()
+    game = TresGame(real_player_count + bot_player_count, record=True, rules=rule_variants)
+    game_starting()
     
     starting_player = 1  # STARTING PLAYER DEFAULT - Player 1 begins unless first card changes it
     
-    # STARTING CARD EFFECT HANDLING - Apply effects if first card is special
-    if isinstance(current_card, str) and current_card.endswith("SKIP"):
-        card_visuals(starting_player)
-        skip_in_effect = True
-    if isinstance(current_card, str) and current_card.endswith("DRAWTWO"):
+    # STARTING CARD EFFECT HANDLING - Show effects if first card is special
+    if game.top.endswith(("SKIP", "DRAWTWO")):
         card_visuals(starting_player)
-        drawtwo_in_effect = True
-        drawtwo_accum = 2
+        show_turn_events(game.events)
     
     # WILD CARD STARTING COLOR - Player 1 chooses color if wild is first card
-    if current_card in ("WILD", "WILD+4"):
+    if game.phase == PHASE_COLOR:
         card_visuals(starting_player)
-        is_wild4 = current_card == "WILD+4"
+        is_wild4 = game.top == "WILD+4"
         print(f"{'WILD+4' if is_wild4 else 'Wild'} card {'drawn as first card! Player 1,' if is_wild4 else 'played!'} what color do you want to choose? (R, G, B, Y): ")
         while True:
-            card_input = turtle.textinput("Wild Card Starting Color", f"Choose color for {current_card}: (R, G, B, Y)")
+            card_input = turtle.textinput("Wild Card Starting Color", f"Choose color for {game.top}: (R, G, B, Y)")
             if card_input is None:
                 print("\n\nNo input provided. Please try again.\n\n")
                 continue
             card_input = card_input.upper()
-            if card_input in ["R", "G", "B", "Y"]:
-                current_card = card_input + current_card
-                print(f"You chose {card_input} as the new color. \n\nThe card on top is now: {current_card}")
-                if is_wild4:
-                    # WILD PLUS FOUR STARTING EFFECT - Apply draw 4 penalty and start at player 2
-                    wild_plus_4_in_effect = True
-                    wild_plus_4_accum = 4
-                    starting_player = 2
-                else:
-                    print(f"Reminder your hand is currently: {player1_hand}\n\n")
+            if card_input in COLOR_SET:
+                game.apply((CHOOSE_COLOR, card_input))
+                print(f"You chose {card_input} as the new color. \n\nThe card on top is now: {game.top}")
+                if not is_wild4:
+                    print(f"Reminder your hand is currently: {game.hands[0]}\n\n")
                 break
             print("\n\nInvalid color choice. Please choose R, G, B, or Y.\n\n")
     
-    # REVERSE STARTING EFFECT - Reverse turn order if reverse is first card
-    if current_card.endswith("REVERSE"):
+    # REVERSE STARTING EFFECT - Rules engine already reversed the turn order
+    if game.top.endswith("REVERSE"):
         card_visuals(starting_player)
-        reverse_order = True
         reverse_msg = "A REVERSE card was drawn as the first card!\n\nThe play order has been REVERSED!"
         show_game_message("REVERSE Card!", reverse_msg)
         print("REVERSE drawn as first card! Play order has been reversed!")
         print(SCREEN_CLEAR)
     
-    # GAME LOOP EXECUTION - Start main game with determined starting player
-    game_loop(starting_player)
\ No newline at end of file
+    # GAME LOOP EXECUTION - Start main game with the engine's starting player
+    try:
+        game_loop()
+    finally:
+        shutdown_pool()  # BOT WORKERS: Stop the search processes when Tres ends or the arcade exits
@@ -0,0 +1,260 @@
+# ============================================================
+# TRES BOTS - Computer players for CtrlUno Arcade Tres
+# ============================================================
+# Bots pick moves with information-set Monte Carlo tree search (ISMCTS):
+# every iteration samples a determinization of the hidden cards (opponents'
+# hands and the draw pile), walks a shared search tree, and finishes the game
+# with a fast greedy rollout. Searches run for a fixed time budget per move
+# and are spread over a process pool on multi-core machines.
+
+# EXTERNAL LIBRARY IMPORTS - Search math, randomness, timing and the worker pool
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# RULES ENGINE IMPORTS - Game state and action vocabulary
+from tres_engine import (
+    TresDeck, TresHand, PackedTres, COLORS, WILDS, legal_moves,
+    PHASE_COLOR, PHASE_PLAY, PHASE_DRAWTWO, PHASE_WILD4, PHASE_TRES, PHASE_SWAP,
+    PLAY, DRAW, PASS, ACCEPT, PUNISH, DECLINE, CHOOSE_COLOR, SWAP,
+)
+
+# ============================================================
+# BOT CONSTANTS SECTION - Difficulty budgets and search tuning
+# ============================================================
+
+DIFFICULTY_BUDGETS = {"easy": 0.05, "medium": 0.2, "hard": 0.6}  # SECONDS OF SEARCH PER MOVE
+DEFAULT_DIFFICULTY = "medium"
+EXPLORATION = 0.7  # UCB EXPLORATION CONSTANT
+ROLLOUT_LIMIT = 80  # MAX ROLLOUT STEPS: Longer rollouts are scored by hand size
+TRES_GUESS = 50  # PUNISHMENT GUESS: Lands within PUNISHMENT_THRESHOLD of the most secret numbers
+WORKERS = os.cpu_count() or 1  # SEARCH PROCESSES: One root-parallel search per core
+
+_pool = None  # SHARED PROCESS POOL: Created on the first multi-core search
+
+# ============================================================
+# MOVE GENERATION AND ROLLOUT POLICY
+# ============================================================
+
+def bot_actions(game):
+    """
+    Lists the actions a bot considers: game.legal_actions() with the 100
+    possible punishment guesses narrowed to the single best guess, and
+    drawing left out whenever a card can be played.
+    """
+    if game.phase == PHASE_TRES:
+        return [(PUNISH, TRES_GUESS), (DECLINE,)]
+    actions = game.legal_actions()
+    if game.phase == PHASE_PLAY and len(actions) > 1:
+        actions.pop()
+    return actions
+
+def favorite_color(hand):
+    """Returns the color held most often in a hand (red if the hand has only wilds)."""
+    counts = [0] * len(COLORS)
+    for card in hand:
+        if card not in WILDS:
+            counts[COLORS.index(card[0])] += 1
+    return COLORS[counts.index(max(counts))]
+
+def greedy_action(game, rng):
+    """
+    Fast rollout policy: play a random legal card, stack penalties when possible,
+    always trigger the Tres punishment, name the color held most for wilds,
+    and swap hands with the seat holding the fewest cards.
+
+    Args:
+        game (TresGame): State to move in
+        rng (random.Random): Random source for tie breaking
+
+    Returns:
+        tuple: A legal action for the seat at game.turn
+    """
+    phase = game.phase
+    hand = game.hands[game.turn]
+    if phase == PHASE_PLAY:
+        playable = legal_moves(hand, game.top)
+        if playable:
+            card = rng.choice(playable)
+            return (PLAY, card, favorite_color(hand) if card in WILDS else None)
+        return (DRAW,) if game.can_draw() else (PASS,)
+    if phase == PHASE_DRAWTWO:
+        stackable = legal_moves(hand, game.top, PHASE_DRAWTWO) if game.rules.stacking else []
+        return (PLAY, stackable[0], None) if stackable else (ACCEPT,)
+    if phase == PHASE_WILD4:
+        return (PLAY, "WILD+4", favorite_color(hand)) if game.rules.stacking and "WILD+4" in hand else (ACCEPT,)
+    if phase == PHASE_SWAP:
+        sizes = [(len(other), seat) for seat, other in enumerate(game.hands) if seat != game.turn]
+        return (SWAP, min(sizes)[1])
+    if phase == PHASE_TRES:
+        return (PUNISH, TRES_GUESS)
+    if phase == PHASE_COLOR:
+        return (CHOOSE_COLOR, favorite_color(hand))
+    raise ValueError(f"No moves during {phase} phase")
+
+def determinize(game, seat, rng):
+    """
+    Samples one full state consistent with what a seat can see.
+
+    Opponents' hands and the draw pile are pooled, shuffled and dealt back out
+    with the same sizes; the seat's own hand and the discard pile are kept.
+
+    Args:
+        game (TresGame): Observed game state
+        seat (int): Seat whose point of view is sampled
+        rng (random.Random): Random source for the shuffle
+
+    Returns:
+        TresGame: Independent copy with the hidden cards resampled
+    """
+    state = game.copy(random.Random(rng.getrandbits(64)))
+    hidden = list(state.deck)
+    for other, hand in enumerate(state.hands):
+        if other != seat:
+            hidden.extend(hand)
+    rng.shuffle(hidden)
+    start = 0
+    for other, hand in enumerate(state.hands):
+        if other != seat:
+            state.hands[other] = TresHand(hidden[start:start + len(hand)])
+            start += len(hand)
+    state.deck = TresDeck(hidden[start:])
+    return state
+
+def rollout(state, rng):
+    """
+    Plays a state out with the greedy policy and returns the winning seat.
+
+    Games still running after ROLLOUT_LIMIT steps go to the smallest hand.
+    """
+    for _ in range(ROLLOUT_LIMIT):
+        if state.is_over:
+            return state.winner
+        state.apply(greedy_action(state, rng))
+    if state.is_over:
+        return state.winner
+    sizes = [len(hand) for hand in state.hands]
+    return sizes.index(min(sizes))
+
+# ============================================================
+# INFORMATION-SET MONTE CARLO TREE SEARCH
+# ============================================================
+
+class _Node:
+    """One action in the ISMCTS tree, shared across determinizations."""
+    __slots__ = ("action", "parent", "seat", "children", "visits", "wins", "avails")
+
+    def __init__(self, action=None, parent=None, seat=None):
+        self.action = action
+        self.parent = parent
+        self.seat = seat  # SEAT THAT TOOK THIS ACTION: Rewards are counted for this seat
+        self.children = {}
+        self.visits = 0
+        self.wins = 0
+        self.avails = 0  # TIMES THIS ACTION WAS LEGAL WHEN ITS PARENT WAS VISITED
+
+    def ucb(self):
+        return self.wins / self.visits + EXPLORATION * math.sqrt(math.log(self.avails) / self.visits)
+
+def _iterate(root, state, rng):
+    """Runs one select / expand / rollout / backpropagate pass on a determinization."""
+    node = root
+
+    # SELECTION - Descend while every action legal in this determinization has a child
+    while not state.is_over:
+        actions = bot_actions(state)
+        untried = [action for action in actions if action not in node.children]
+        for action in actions:
+            if action in node.children:
+                node.children[action].avails += 1
+        if untried:
+            # EXPANSION - Add one untried action
+            action = rng.choice(untried)
+            child = _Node(action, node, state.turn)
+            child.avails = 1
+            node.children[action] = child
+            state.apply(action)
+            node = child
+            break
+        node = max((node.children[action] for action in actions), key=_Node.ucb)
+        state.apply(node.action)
+
+    # SIMULATION AND BACKPROPAGATION - Credit the winner at every node they chose
+    winner = rollout(state, rng)
+    while node is not None:
+        node.visits += 1
+        if node.seat == winner:
+            node.wins += 1
+        node = node.parent
+
+def search(game, seat, budget, seed=None):
+    """
+    Runs ISMCTS from one seat's point of view for a time budget.
+
+    Args:
+        game (TresGame): Observed game state with game.turn == seat (or its PackedTres)
+        seat (int): Seat choosing a move
+        budget (float): Seconds to search
+        seed: Optional seed for the search's random source
+
+    Returns:
+        dict: Root visit count per action
+    """
+    if isinstance(game, PackedTres):
+        game = game.unpack()
+    rng = random.Random(seed)
+    root = _Node()
+    deadline = time.perf_counter() + budget
+    while not root.visits or time.perf_counter() < deadline:
+        _iterate(root, determinize(game, seat, rng), rng)
+    return {action: child.visits for action, child in root.children.items()}
+
+def _get_pool():
+    """Returns the shared worker pool, or None on a single-core machine."""
+    global _pool
+    if _pool is None and WORKERS > 1:
+        _pool = ProcessPoolExecutor(max_workers=WORKERS)
+    return _pool
+
+def shutdown_pool():
+    """Stops the shared worker pool if one was started."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+def choose_action(game, difficulty=DEFAULT_DIFFICULTY, seed=None, parallel=True):
+    """
+    Picks a move for the seat at game.turn within the difficulty's time budget.
+
+    Each worker process searches its own tree from a different seed; the
+    root visit counts are summed and the most visited action is played.
+
+    Args:
+        game (TresGame): Current game state
+        difficulty (str): Key of DIFFICULTY_BUDGETS
+        seed: Optional seed for reproducible searches
+        parallel (bool): False searches in this process only (e.g. inside simulation workers)
+
+    Returns:
+        tuple: Action to pass to game.apply()
+    """
+    actions = bot_actions(game)
+    if len(actions) == 1:
+        return actions[0]
+    seat = game.turn
+    budget = DIFFICULTY_BUDGETS[difficulty]
+    rng = random.Random(seed)
+    pool = _get_pool() if parallel else None
+    if pool is None:
+        visits = search(game, seat, budget, rng.getrandbits(64))
+    else:
+        packed = game.pack()  # SMALLER PICKLES: Workers get the compact snapshot
+        futures = [pool.submit(search, packed, seat, budget, rng.getrandbits(64)) for _ in range(WORKERS)]
+        visits = {}
+        for future in futures:
+            for action, count in future.result().items():
+                visits[action] = visits.get(action, 0) + count
+    return max(actions, key=lambda action: visits.get(action, 0))
@@ -0,0 +1,134 @@
+# ============================================================
+# TRES CARD DEFINITIONS - Card names, integer ids and playability table
+# ============================================================
+# Every card face gets a small integer id so rule checks are table lookups
+# instead of string parsing. Uncolored faces (the ones that live in hands and
+# the deck) come first, followed by the colored wilds that only ever appear
+# as the card on top of the discard pile.
+
+# ============================================================
+# CARD TYPE DEFINITIONS - All card types in the Tres deck
+# ============================================================
+
+COLORS = "RGBY"  # CARD COLORS: Red, Green, Blue, Yellow
+
+# NUMBERED CARDS - Standard playing cards with colors and values
+COLOR_CARDS = [f"{c}{n}" for c in COLORS for n in range(1, 10)]  # NUMBERED CARDS 1-9: R/G/B/Y colors (72 total - 2 of each)
+ZERO_CARDS = [f"{c}0" for c in COLORS]  # ZERO CARDS: Special cards with value 0, one per color (4 total)
+
+# ACTION CARDS - Special effect cards that modify gameplay
+SKIP_CARDS = [f"{c}SKIP" for c in COLORS]  # SKIP CARDS: Skip next player's turn (8 total - 2 per color)
+DRAWTWO_CARDS = [f"{c}DRAWTWO" for c in COLORS]  # DRAW TWO CARDS: Force next player to draw 2 cards (8 total - 2 per color, stackable)
+REVERSE_CARDS = [f"{c}REVERSE" for c in COLORS]  # REVERSE CARDS: Reverse turn order direction (8 total - 2 per color)
+
+# WILD CARDS - Color-changing cards with special powers
+WILD_CARDS = ["WILD"]  # WILD CARDS: Change color to any choice (4 total in deck)
+WILD_DRAW4_CARDS = ["WILD+4"]  # WILD DRAW FOUR CARDS: Change color and force next player to draw 4 (4 total, stackable)
+
+# CARD COLLECTIONS - Grouped card types for deck generation
+WILDS = WILD_CARDS + WILD_DRAW4_CARDS  # ALL WILD CARDS: Combined wild and wild+4 types
+SPECIAL_CARDS = SKIP_CARDS + DRAWTWO_CARDS + REVERSE_CARDS  # ALL SPECIAL ACTION CARDS
+CARDS = COLOR_CARDS + ZERO_CARDS + SPECIAL_CARDS + WILDS  # COMPLETE CARD TYPE LIST: All possible card types
+
+# COLORED WILD TOPS - How a wild reads on top of the pile once its color is chosen
+COLORED_WILDS = [f"{c}{wild}" for wild in WILDS for c in COLORS]
+
+# ============================================================
+# INTEGER CARD ENCODING - Small ids for every card name
+# ============================================================
+
+CARD_NAMES = CARDS + COLORED_WILDS  # ID TO NAME: Index is the card id
+CARD_IDS = {name: card_id for card_id, name in enumerate(CARD_NAMES)}  # NAME TO ID
+NUM_FACES = len(CARDS)  # HAND CARD IDS: 0 .. NUM_FACES - 1 (54 uncolored faces)
+NUM_CARD_IDS = len(CARD_NAMES)  # ALL CARD IDS: Faces plus the 8 colored wild tops
+
+# CARD RANKS - Numbered cards use their value, action and wild cards follow
+RANK_SKIP = 10
+RANK_DRAWTWO = 11
+RANK_REVERSE = 12
+RANK_WILD = 13
+RANK_WILD4 = 14
+NO_COLOR = len(COLORS)  # COLOR INDEX FOR UNCOLORED WILDS
+
+_RANK_SUFFIXES = {"SKIP": RANK_SKIP, "DRAWTWO": RANK_DRAWTWO, "REVERSE": RANK_REVERSE,
+                  "WILD": RANK_WILD, "WILD+4": RANK_WILD4}
+
+def _split_card(name):
+    """Returns (color_index, rank) parsed from a card name."""
+    if name in WILDS:
+        return NO_COLOR, _RANK_SUFFIXES[name]
+    suffix = name[1:]
+    rank = int(suffix) if suffix.isdigit() else _RANK_SUFFIXES[suffix]
+    return COLORS.index(name[0]), rank
+
+CARD_COLOR = bytes(_split_card(name)[0] for name in CARD_NAMES)  # COLOR INDEX PER ID (NO_COLOR for uncolored wilds)
+CARD_RANK = bytes(_split_card(name)[1] for name in CARD_NAMES)  # RANK PER ID
+WILD_IDS = frozenset(CARD_IDS[name] for name in WILDS)  # UNCOLORED WILD FACE IDS
+
+def card_id(name):
+    """Returns the integer id of a card name (e.g., "R5" -> 4)."""
+    return CARD_IDS[name]
+
+def card_name(card_id):
+    """Returns the card name for an integer id."""
+    return CARD_NAMES[card_id]
+
+def color_wild(card_id, color_index):
+    """Returns the id of a wild face once a color (index into COLORS) is chosen for it."""
+    return CARD_IDS[COLORS[color_index] + CARD_NAMES[card_id]]
+
+# ============================================================
+# PLAYABILITY TABLE - Precomputed top card x candidate legality
+# ============================================================
+
+def _rule_allows(card, top):
+    """
+    Tres matching rules on integer ids, used once to build the lookup tables.
+
+    - Wild cards are always playable
+    - Same color is always playable
+    - Any DRAWTWO may go on a DRAWTWO
+    - Numbered cards match numbered cards of the same value
+    """
+    card_rank, top_rank = CARD_RANK[card], CARD_RANK[top]
+    if card_rank >= RANK_WILD:
+        return True
+    if CARD_COLOR[card] == CARD_COLOR[top]:
+        return True
+    if top_rank == RANK_DRAWTWO:
+        return card_rank == RANK_DRAWTWO
+    return card_rank <= 9 and card_rank == top_rank
+
+# FLAT LOOKUP TABLE - PLAYABLE[top_id * NUM_FACES + card_id] is 1 when the play is legal
+PLAYABLE = bytes(_rule_allows(card, top) for top in range(NUM_CARD_IDS) for card in range(NUM_FACES))
+
+# BITMASKS - PLAYABLE_MASKS[top_id] has bit card_id set for every legal candidate
+PLAYABLE_MASKS = tuple(
+    sum(1 << card for card in range(NUM_FACES) if PLAYABLE[top * NUM_FACES + card])
+    for top in range(NUM_CARD_IDS)
+)
+
+# BUCKET MASKS - Face ids grouped by color index (NO_COLOR for wilds) and by rank
+COLOR_MASKS = tuple(
+    sum(1 << card for card in range(NUM_FACES) if CARD_COLOR[card] == color)
+    for color in range(NO_COLOR + 1)
+)
+RANK_MASKS = tuple(
+    sum(1 << card for card in range(NUM_FACES) if CARD_RANK[card] == rank)
+    for rank in range(RANK_WILD4 + 1)
+)
+ACTION_MASK = RANK_MASKS[RANK_SKIP] | RANK_MASKS[RANK_DRAWTWO] | RANK_MASKS[RANK_REVERSE]  # SKIP/DRAWTWO/REVERSE FACES
+WILD_MASK = RANK_MASKS[RANK_WILD] | RANK_MASKS[RANK_WILD4]  # UNCOLORED WILD FACES
+
+def is_playable_id(card, top):
+    """
+    Determines if a card id may be played on a top card id.
+
+    Args:
+        card (int): Uncolored face id from a hand
+        top (int): Id of the card on top of the discard pile
+
+    Returns:
+        bool: True if the play is legal
+    """
+    return PLAYABLE[top * NUM_FACES + card] == 1
@@ -0,0 +1,892 @@
+# ============================================================
+# TRES RULES ENGINE - Headless game state for CtrlUno Arcade Tres
+# ============================================================
+# Pure rules engine with no turtle or console I/O. The turtle UI in tres.py,
+# bots and simulations all drive the same TresGame object through apply().
+
+# EXTERNAL LIBRARY IMPORTS - Random number generation for shuffling and punishment rolls, packed buffers
+import random
+from array import array
+
+# CARD DEFINITION IMPORTS - Card names, integer ids and the precomputed playability table
+from tres_cards import (
+    COLORS, COLOR_CARDS, ZERO_CARDS, SKIP_CARDS, DRAWTWO_CARDS, REVERSE_CARDS,
+    WILD_CARDS, WILD_DRAW4_CARDS, WILDS,
+    CARD_IDS, CARD_NAMES, NUM_FACES, PLAYABLE, PLAYABLE_MASKS,
+    RANK_DRAWTWO, RANK_WILD4, RANK_MASKS,
+)
+
+# ============================================================
+# GAME CONSTANTS SECTION - Configuration values
+# ============================================================
+
+PUNISHMENT_THRESHOLD = 40  # TRES PUNISHMENT THRESHOLD - Maximum distance for successful punishment guess (1-100 range)
+HAND_SIZE = 7  # STARTING HAND SIZE: Cards dealt to each player
+TRES_HAND_SIZE = 3  # TRES HAND SIZE: Hand size that offers the punishment mechanic
+SECRET_MAX = 100  # PUNISHMENT SECRET NUMBER: Guesses and the secret are 1-SECRET_MAX
+PUNISHMENT_MAX_DRAW = 10  # PUNISHMENT SIZE: Cards drawn are 1-PUNISHMENT_MAX_DRAW, doubled on an exact guess
+MIN_PLAYERS = 2  # MINIMUM PLAYER COUNT
+MAX_PLAYERS = 16  # MAXIMUM PLAYER COUNT
+PLAYERS_PER_DECK = 4  # DECK MERGING: One more full deck is shuffled in for every PLAYERS_PER_DECK seats
+
+# DECK COMPOSITION - Copies of each card group in one deck
+DECK_COUNTS = {
+    "numbers": 2,  # R/G/B/Y 1-9
+    "zeros": 1,  # R/G/B/Y 0
+    "actions": 2,  # SKIP, DRAWTWO and REVERSE in every color
+    "wilds": 4,  # WILD and WILD+4
+}
+
+# ============================================================
+# ENGINE PHASES, ACTIONS AND EVENTS - Vocabulary shared with the UI and bots
+# ============================================================
+
+# GAME PHASES - What kind of decision the player at game.turn must make
+PHASE_COLOR = "color"  # FIRST CARD WAS A WILD: Player 1 chooses its color
+PHASE_PLAY = "play"  # NORMAL TURN: Play a matching card, or draw
+PHASE_DRAWTWO = "drawtwo"  # DRAW TWO PENDING: Stack another DRAWTWO or accept the penalty
+PHASE_WILD4 = "wild4"  # WILD+4 PENDING: Stack another WILD+4 or accept the penalty
+PHASE_TRES = "tres"  # TRES: Player has exactly three cards and may trigger the punishment
+PHASE_SWAP = "swap"  # SEVEN PLAYED (seven_zero variant): Player picks whose hand to swap with
+PHASE_OVER = "over"  # GAME OVER: game.winner holds the winning seat
+
+COLOR_SET = frozenset(COLORS)  # VALID WILD COLORS: Single color letters only, so "RG" or "" never pass a substring check
+
+# ACTIONS - Tuples passed to TresGame.apply(), first element is the kind
+PLAY = "play"  # (PLAY, card, color) - color is only used for wild cards, else None
+DRAW = "draw"  # (DRAW,) - draw one card, turn continues
+PASS = "pass"  # (PASS,) - only legal when no card can be drawn
+ACCEPT = "accept"  # (ACCEPT,) - take the pending DRAWTWO/WILD+4 penalty
+PUNISH = "punish"  # (PUNISH, guess) - trigger the Tres punishment with a 1-100 guess
+DECLINE = "decline"  # (DECLINE,) - skip the Tres punishment
+CHOOSE_COLOR = "choose_color"  # (CHOOSE_COLOR, color) - color for a wild first card
+SWAP = "swap"  # (SWAP, target) - swap hands with another seat after playing a 7 (seven_zero variant)
+JUMP_IN = "jump_in"  # (JUMP_IN, seat, card) - out of turn play of the exact top card (jump_in variant)
+
+# EVENTS - Tuples reported back by apply(), first element is the kind
+EVENT_PLAY = "play"  # (EVENT_PLAY, seat, card, new_top)
+EVENT_DRAW = "draw"  # (EVENT_DRAW, seat, cards, reason) - reason is "draw", a penalty phase, or "punish"
+EVENT_SKIP = "skip"  # (EVENT_SKIP, seat)
+EVENT_RESHUFFLE = "reshuffle"  # (EVENT_RESHUFFLE,)
+EVENT_EXHAUSTED = "exhausted"  # (EVENT_EXHAUSTED, seat) - no cards left in deck or discard pile
+EVENT_PUNISH = "punish"  # (EVENT_PUNISH, seat, guess, secret, amount, targets)
+EVENT_WIN = "win"  # (EVENT_WIN, seat)
+EVENT_JUMP_IN = "jump_in"  # (EVENT_JUMP_IN, seat, card) - followed by the EVENT_PLAY of that card
+EVENT_SWAP = "swap"  # (EVENT_SWAP, seat, target)
+EVENT_ROTATE = "rotate"  # (EVENT_ROTATE, direction) - every hand moved one seat in this direction
+
+# ============================================================
+# CORE DECK AND RULE FUNCTIONS
+# ============================================================
+
+def decks_needed(num_players):
+    """Returns how many full decks a table of num_players is dealt from (one per PLAYERS_PER_DECK seats)."""
+    return -(-num_players // PLAYERS_PER_DECK)
+
+def gen_deck(rng=random, counts=DECK_COUNTS, decks=1):
+    """
+    Creates and shuffles a complete Tres deck, merging several decks for large tables.
+
+    Default deck: 72 color cards, 4 zeros, 24 skips/draw-twos/reverses, 8 wilds (108 total per deck)
+
+    Args:
+        rng: Random source with a shuffle() method (module random by default)
+        counts (dict): Copies per card group, same keys as DECK_COUNTS
+        decks (int): Number of full decks shuffled together
+    """
+    deck = (
+        [card for card in COLOR_CARDS for _ in range(counts["numbers"])] +
+        [card for card in ZERO_CARDS for _ in range(counts["zeros"])] +
+        [card for card in SKIP_CARDS + DRAWTWO_CARDS + REVERSE_CARDS for _ in range(counts["actions"])] +
+        [card for card in WILD_CARDS + WILD_DRAW4_CARDS for _ in range(counts["wilds"])]
+    ) * decks
+    rng.shuffle(deck)
+    return deck
+
+def is_playable(card, top):
+    """
+    Determines if a card may be played on the top card according to Tres rules.
+
+    Validation Rules:
+    - Wild cards are always playable
+    - On SKIP/DRAWTWO/REVERSE: same color, or any DRAWTWO on a DRAWTWO
+    - On a colored WILD/WILD+4: same color only
+    - On numbered cards: same color or same number
+
+    The rules are evaluated once into tres_cards.PLAYABLE, so this is two
+    dictionary lookups and a table index.
+
+    Args:
+        card (str): Uncolored card from a hand (e.g., "R5", "WILD")
+        top (str): Card on top of the discard pile, wilds carry their chosen color (e.g., "GWILD")
+
+    Returns:
+        bool: True if the play is legal
+    """
+    return PLAYABLE[CARD_IDS[top] * NUM_FACES + CARD_IDS[card]] == 1
+
+# ============================================================
+# DRAW PILE CLASS - O(1) draws over a shuffled card list
+# ============================================================
+
+class TresDeck:
+    """
+    Draw pile backed by a list and a read pointer.
+
+    Drawing moves the pointer instead of popping from the front of a list,
+    so a single draw is O(1) and draw_n() deals a whole punishment in one
+    slice. Refilling adopts the recycled list as-is rather than copying it.
+
+    Attributes:
+        cards (list): Shuffled cards; only cards[pos:] are still in the pile
+        pos (int): Index of the next card to draw
+    """
+    __slots__ = ("cards", "pos")
+
+    def __init__(self, cards=()):
+        self.cards = list(cards)
+        self.pos = 0
+
+    def __len__(self):
+        return len(self.cards) - self.pos
+
+    def __iter__(self):
+        return iter(self.cards[self.pos:])
+
+    def draw(self):
+        """Returns the next card, or None if the pile is empty."""
+        if self.pos >= len(self.cards):
+            return None
+        card = self.cards[self.pos]
+        self.pos += 1
+        return card
+
+    def draw_n(self, count):
+        """Returns up to count cards from the top of the pile as one slice."""
+        start = self.pos
+        self.pos = min(start + count, len(self.cards))
+        return self.cards[start:self.pos]
+
+    def refill(self, cards, rng):
+        """
+        Replaces the (empty) pile with a list of cards, shuffled in place.
+
+        Args:
+            cards (list): Cards to adopt; the list object itself becomes the pile
+            rng: Random source with a shuffle() method
+        """
+        rng.shuffle(cards)
+        self.cards = cards
+        self.pos = 0
+
+    def copy(self):
+        """Returns an independent pile holding only the cards not yet drawn."""
+        new = TresDeck.__new__(TresDeck)
+        new.cards = self.cards[self.pos:]
+        new.pos = 0
+        return new
+
+# ============================================================
+# HAND CLASS - Card list with a live index of the faces it holds
+# ============================================================
+
+class TresHand(list):
+    """
+    A player's hand: a plain list of card strings that also keeps an index.
+
+    Every mutation updates a count per face id and a bitmask with bit
+    card_id set for each face held at least once. Membership and count
+    checks become lookups, and "which of my cards match this bucket?"
+    (a color, a rank, or everything playable on a top card) is one AND
+    against the masks in tres_cards.
+
+    Attributes:
+        counts (list): Copies held of each face id
+        mask (int): Bit card_id set for every face id with a nonzero count
+    """
+    __slots__ = ("counts", "mask")
+
+    def __init__(self, cards=()):
+        super().__init__(cards)
+        self._reindex()
+
+    def _reindex(self):
+        """Rebuilds the index from the list contents."""
+        self.counts = [0] * NUM_FACES
+        self.mask = 0
+        for card in self:
+            self._add(card)
+
+    def _add(self, card):
+        card_id = CARD_IDS[card]
+        self.counts[card_id] += 1
+        self.mask |= 1 << card_id
+
+    def _discard(self, card):
+        card_id = CARD_IDS[card]
+        self.counts[card_id] -= 1
+        if not self.counts[card_id]:
+            self.mask &= ~(1 << card_id)
+
+    # LIST MUTATORS - Keep the index in step with the cards
+    def append(self, card):
+        super().append(card)
+        self._add(card)
+
+    def extend(self, cards):
+        cards = list(cards)
+        super().extend(cards)
+        for card in cards:
+            self._add(card)
+
+    def __iadd__(self, cards):
+        self.extend(cards)
+        return self
+
+    def insert(self, index, card):
+        super().insert(index, card)
+        self._add(card)
+
+    def remove(self, card):
+        super().remove(card)
+        self._discard(card)
+
+    def pop(self, index=-1):
+        card = super().pop(index)
+        self._discard(card)
+        return card
+
+    def clear(self):
+        super().clear()
+        self._reindex()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._reindex()
+
+    # INDEXED QUERIES
+    def __contains__(self, card):
+        card_id = CARD_IDS.get(card, NUM_FACES)
+        return card_id < NUM_FACES and self.counts[card_id] > 0
+
+    def count(self, card):
+        card_id = CARD_IDS.get(card, NUM_FACES)
+        return self.counts[card_id] if card_id < NUM_FACES else 0
+
+    def faces(self, mask=-1):
+        """
+        Lists the distinct faces held whose ids are set in a bucket mask.
+
+        Args:
+            mask (int): Bucket from tres_cards (e.g., COLOR_MASKS[0], RANK_MASKS[RANK_SKIP]); all faces by default
+
+        Returns:
+            list: Card names in id order, one entry per face however many copies are held
+        """
+        bits = self.mask & mask
+        faces = []
+        while bits:
+            low = bits & -bits
+            faces.append(CARD_NAMES[low.bit_length() - 1])
+            bits ^= low
+        return faces
+
+    def copy(self):
+        """Returns an independent hand, copying the index instead of rebuilding it."""
+        new = TresHand.__new__(TresHand)
+        list.extend(new, self)
+        new.counts = self.counts[:]
+        new.mask = self.mask
+        return new
+
+    def __reduce__(self):
+        return TresHand, (list(self),)
+
+def legal_moves(hand, top, pending_draw=None):
+    """
+    Lists the distinct cards in a hand that may be played right now.
+
+    Args:
+        hand (TresHand): Hand to query (plain lists are indexed on the fly)
+        top (str): Card on top of the discard pile
+        pending_draw (str): PHASE_DRAWTWO or PHASE_WILD4 while a draw penalty
+            is waiting to be stacked or accepted, else None
+
+    Returns:
+        list: Playable card names in id order
+    """
+    if not isinstance(hand, TresHand):
+        hand = TresHand(hand)
+    if pending_draw == PHASE_DRAWTWO:
+        return hand.faces(RANK_MASKS[RANK_DRAWTWO])
+    if pending_draw == PHASE_WILD4:
+        return hand.faces(RANK_MASKS[RANK_WILD4])
+    return hand.faces(PLAYABLE_MASKS[CARD_IDS[top]])
+
+# ============================================================
+# RULE VARIANTS - Declarative options compiled into per-card effect tables
+# ============================================================
+
+RULE_VARIANTS = {
+    "stacking": True,  # DRAWTWO/WILD+4 penalties may be passed on by stacking another one
+    "jump_in": False,  # A player holding the exact top card may play it out of turn
+    "seven_zero": False,  # A 7 swaps hands with a chosen player, a 0 passes every hand along
+    "draw_until_playable": False,  # Drawing keeps going until a playable card comes up
+}
+
+# CARD EFFECT HANDLERS - Called as effect(game, seat) after a card is played;
+# a True result means the same seat has another decision to make
+def _effect_none(game, seat):
+    return False
+
+def _effect_skip(game, seat):
+    game.pending_skip = True
+    return False
+
+def _effect_drawtwo(game, seat):
+    game.drawtwo_accum += 2
+    return False
+
+def _effect_wild4(game, seat):
+    game.wild_plus_4_accum += 4
+    return False
+
+def _effect_reverse(game, seat):
+    game.direction = -game.direction
+    return False
+
+def _effect_seven(game, seat):
+    game.phase = PHASE_SWAP
+    return True
+
+def _effect_zero(game, seat):
+    step = game.direction
+    game.hands = game.hands[-step:] + game.hands[:-step]
+    game.events.append((EVENT_ROTATE, step))
+    return False
+
+class TresRules:
+    """
+    A set of rule variants compiled for the per-turn hot path.
+
+    Flags the engine checks become plain attributes, and the special card
+    logic becomes one effect handler per card face id, so playing a card
+    is a table lookup whatever variants are on.
+
+    Attributes:
+        variants (dict): Full variant settings, same keys as RULE_VARIANTS
+        effects (tuple): Effect handler per face id
+    """
+    __slots__ = ("variants", "stacking", "jump_in", "seven_zero", "draw_until_playable", "effects")
+
+    def __init__(self, variants, effects):
+        self.variants = variants
+        self.stacking = variants["stacking"]
+        self.jump_in = variants["jump_in"]
+        self.seven_zero = variants["seven_zero"]
+        self.draw_until_playable = variants["draw_until_playable"]
+        self.effects = effects
+
+    def __reduce__(self):
+        return compile_rules, (self.variants,)
+
+_compiled_rules = {}  # COMPILED RULE CACHE: Variant settings -> TresRules shared by every game
+
+def compile_rules(variants=None):
+    """
+    Compiles rule variants into a TresRules, reusing earlier compilations.
+
+    Args:
+        variants (dict): Overrides for RULE_VARIANTS (missing keys keep their defaults)
+
+    Returns:
+        TresRules: Compiled rules
+
+    Raises:
+        ValueError: If a variant name is unknown
+    """
+    settings = dict(RULE_VARIANTS)
+    for name, value in (variants or {}).items():
+        if name not in settings:
+            raise ValueError(f"Unknown rule variant {name!r}, choose from {', '.join(RULE_VARIANTS)}")
+        settings[name] = bool(value)
+    key = tuple(settings.items())
+    if key not in _compiled_rules:
+        effects = [_effect_none] * NUM_FACES
+        for cards, effect in ((SKIP_CARDS, _effect_skip), (DRAWTWO_CARDS, _effect_drawtwo),
+                              (REVERSE_CARDS, _effect_reverse), (WILD_DRAW4_CARDS, _effect_wild4)):
+            for card in cards:
+                effects[CARD_IDS[card]] = effect
+        if settings["seven_zero"]:
+            for color in COLORS:
+                effects[CARD_IDS[color + "7"]] = _effect_seven
+                effects[CARD_IDS[color + "0"]] = _effect_zero
+        _compiled_rules[key] = TresRules(settings, tuple(effects))
+    return _compiled_rules[key]
+
+# ============================================================
+# GAME STATE CLASS - Complete Tres table state with a step function
+# ============================================================
+
+class TresGame:
+    """
+    Complete state of one Tres game with no I/O.
+
+    Seats are numbered from 0; the UI shows seat + 1 as the player number.
+    Every decision goes through apply(action), which validates the action,
+    updates the state and returns the list of events it caused. Randomness
+    comes only from the game's own rng, so a seed reproduces a whole game.
+
+    Attributes:
+        hands (list): One TresHand per seat
+        deck (TresDeck): Draw pile
+        discard (list): Played cards, top card last (wilds stored uncolored)
+        top (str): Current card in play, wilds carry their chosen color
+        turn (int): Seat whose decision is pending
+        direction (int): 1 for normal order, -1 after an odd number of REVERSEs
+        phase (str): One of the PHASE_* constants
+        winner (int): Winning seat once phase is PHASE_OVER, else None
+        events (list): Events produced by the most recent step
+        rules (TresRules): Compiled rule variants
+        seed: Seed of the game's random source (chosen at random when not given)
+        history (list): Every applied action in order when recording, else None
+    """
+    __slots__ = (
+        "hands", "deck", "discard", "top", "turn", "direction", "phase",
+        "pending_skip", "drawtwo_accum", "wild_plus_4_accum",
+        "winner", "turn_count", "punishment_threshold", "rng", "events",
+        "seed", "deck_counts", "decks", "history", "rules",
+    )
+
+    def __init__(self, num_players=2, seed=None, punishment_threshold=PUNISHMENT_THRESHOLD, deck_counts=DECK_COUNTS,
+                 record=False, decks=None, rules=None):
+        """
+        Shuffles a new deck, deals starting hands and resolves the first card.
+
+        Args:
+            num_players (int): Number of seats (MIN_PLAYERS-MAX_PLAYERS)
+            seed: Optional seed for the game's random source
+            punishment_threshold (int): Guess distance that still punishes the other players
+            deck_counts (dict): Copies per card group passed to gen_deck()
+            record (bool): Keep every applied action in game.history so the game can be replayed
+            decks (int): Full decks to merge (defaults to decks_needed(num_players))
+            rules (dict): Rule variant overrides passed to compile_rules()
+        """
+        if not MIN_PLAYERS <= num_players <= MAX_PLAYERS:
+            raise ValueError(f"Tres needs {MIN_PLAYERS}-{MAX_PLAYERS} players, got {num_players}")
+        if seed is None:
+            seed = random.randrange(1 << 64)  # RECORDED SEED: Lets an unseeded game be replayed later
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.punishment_threshold = punishment_threshold
+        self.rules = compile_rules(rules)
+        self.deck_counts = dict(deck_counts)
+        self.decks = decks or decks_needed(num_players)
+        self.history = [] if record else None
+        self.deck = TresDeck(gen_deck(self.rng, deck_counts, self.decks))
+        self.hands = [TresHand(self.deck.draw_n(HAND_SIZE)) for _ in range(num_players)]
+        self.discard = []
+        self.turn = 0
+        self.direction = 1
+        self.pending_skip = False
+        self.drawtwo_accum = 0
+        self.wild_plus_4_accum = 0
+        self.winner = None
+        self.turn_count = 0
+        self.events = []
+
+        # STARTING CARD EFFECT HANDLING - Apply effects if first card is special
+        self.top = self.deck.draw()
+        self.discard.append(self.top)
+        if self.top in WILDS:
+            self.phase = PHASE_COLOR
+            return
+        if self.top.endswith("SKIP"):
+            self.pending_skip = True
+        elif self.top.endswith("DRAWTWO"):
+            self.drawtwo_accum = 2
+        elif self.top.endswith("REVERSE"):
+            self.direction = -1
+        self._begin_turn(0)
+
+    def copy(self, rng=None):
+        """
+        Returns an independent copy of the game, including its random state.
+
+        The copy does not record; search copies never need their own history.
+
+        Args:
+            rng (random.Random): Random source for the copy; by default it
+                continues this game's random stream
+        """
+        new = TresGame.__new__(TresGame)
+        new.hands = [hand.copy() for hand in self.hands]
+        new.deck = self.deck.copy()
+        new.discard = self.discard[:]
+        new.top = self.top
+        new.turn = self.turn
+        new.direction = self.direction
+        new.phase = self.phase
+        new.pending_skip = self.pending_skip
+        new.drawtwo_accum = self.drawtwo_accum
+        new.wild_plus_4_accum = self.wild_plus_4_accum
+        new.winner = self.winner
+        new.turn_count = self.turn_count
+        new.punishment_threshold = self.punishment_threshold
+        new.seed = self.seed
+        new.deck_counts = self.deck_counts
+        new.decks = self.decks
+        new.rules = self.rules
+        new.history = None
+        if rng is None:
+            rng = random.Random.__new__(random.Random)  # SKIP SEEDING: The state is overwritten anyway
+            rng.setstate(self.rng.getstate())
+        new.rng = rng
+        new.events = []
+        return new
+
+    __copy__ = copy
+
+    def pack(self):
+        """Returns a compact immutable snapshot of the game (see PackedTres)."""
+        return PackedTres.from_game(self)
+
+    # ------------------------------------------------------------
+    # STATE QUERIES
+    # ------------------------------------------------------------
+
+    @property
+    def num_players(self):
+        """Number of seats at the table."""
+        return len(self.hands)
+
+    @property
+    def is_over(self):
+        """True once a player has emptied their hand."""
+        return self.phase == PHASE_OVER
+
+    def next_seat(self, seat):
+        """
+        Returns the seat that plays after the given seat in the current direction.
+
+        Seats form a ring: advancing, skipping and reversing are all O(1)
+        updates of game.turn and game.direction, whatever the table size.
+        """
+        return (seat + self.direction) % len(self.hands)
+
+    def can_draw(self):
+        """True if the deck or the discard pile (below the top card) has cards left."""
+        return bool(self.deck) or len(self.discard) > 1
+
+    def legal_actions(self):
+        """
+        Lists every legal action for the seat at game.turn.
+
+        Returns:
+            list: Action tuples accepted by apply()
+        """
+        phase = self.phase
+        hand = self.hands[self.turn]
+        if phase == PHASE_PLAY:
+            actions = []
+            for card in legal_moves(hand, self.top):
+                if card in WILDS:
+                    actions.extend((PLAY, card, color) for color in COLORS)
+                else:
+                    actions.append((PLAY, card, None))
+            actions.append((DRAW,) if self.can_draw() else (PASS,))
+            return actions
+        if phase == PHASE_DRAWTWO:
+            actions = [(PLAY, card, None) for card in legal_moves(hand, self.top, PHASE_DRAWTWO)] if self.rules.stacking else []
+            actions.append((ACCEPT,))
+            return actions
+        if phase == PHASE_WILD4:
+            actions = [(PLAY, "WILD+4", color) for color in COLORS] if self.rules.stacking and "WILD+4" in hand else []
+            actions.append((ACCEPT,))
+            return actions
+        if phase == PHASE_SWAP:
+            return [(SWAP, other) for other in range(len(self.hands)) if other != self.turn]
+        if phase == PHASE_TRES:
+            return [(PUNISH, guess) for guess in range(1, SECRET_MAX + 1)] + [(DECLINE,)]
+        if phase == PHASE_COLOR:
+            return [(CHOOSE_COLOR, color) for color in COLORS]
+        return []
+
+    def jump_in_actions(self):
+        """
+        Lists the out of turn plays open to the other seats (jump_in variant only).
+
+        Returns:
+            list: (JUMP_IN, seat, card) actions for every seat holding the exact top card
+        """
+        if not self.rules.jump_in or self.phase != PHASE_PLAY:
+            return []
+        return [(JUMP_IN, other, self.top) for other, hand in enumerate(self.hands)
+                if other != self.turn and self.top in hand]
+
+    # ------------------------------------------------------------
+    # STEP FUNCTION
+    # ------------------------------------------------------------
+
+    def apply(self, action):
+        """
+        Applies one action for the seat at game.turn.
+
+        Args:
+            action (tuple): One of the action tuples described at the top of this module
+
+        Returns:
+            list: Events caused by the action (also kept in game.events)
+
+        Raises:
+            ValueError: If the action is not legal in the current state
+        """
+        self.events = []
+        kind = action[0]
+        phase = self.phase
+        seat = self.turn
+
+        if kind == PLAY and phase in (PHASE_PLAY, PHASE_DRAWTWO, PHASE_WILD4):
+            card = action[1]
+            color = action[2] if len(action) > 2 else None
+            if card not in self.hands[seat]:
+                raise ValueError(f"{card} is not in player {seat + 1}'s hand")
+            if phase == PHASE_PLAY:
+                legal = is_playable(card, self.top)
+            elif phase == PHASE_DRAWTWO:
+                legal = self.rules.stacking and card.endswith("DRAWTWO")
+            else:
+                legal = self.rules.stacking and card == "WILD+4"
+            if not legal:
+                raise ValueError(f"{card} cannot be played on {self.top}")
+            if card in WILDS and color not in COLOR_SET:
+                raise ValueError(f"{card} needs a color from {COLORS}")
+            self._play(seat, card, color)
+        elif kind == DRAW and phase == PHASE_PLAY:
+            cards = self._deal(seat, 1)
+            if not cards:
+                raise ValueError("No cards left to draw")
+            if self.rules.draw_until_playable:
+                # DRAW UNTIL PLAYABLE - Keep drawing while the newest card cannot be played
+                while not is_playable(cards[-1], self.top):
+                    more = self._deal(seat, 1)
+                    if not more:
+                        break
+                    cards += more
+            self.events.append((EVENT_DRAW, seat, cards, "draw"))
+        elif kind == PASS and phase == PHASE_PLAY and not self.can_draw():
+            self._begin_turn(self.next_seat(seat))
+        elif kind == ACCEPT and phase in (PHASE_DRAWTWO, PHASE_WILD4):
+            if phase == PHASE_DRAWTWO:
+                amount, self.drawtwo_accum = self.drawtwo_accum, 0
+            else:
+                amount, self.wild_plus_4_accum = self.wild_plus_4_accum, 0
+            self.events.append((EVENT_DRAW, seat, self._deal(seat, amount), phase))
+            self._end_turn(seat)
+        elif kind == PUNISH and phase == PHASE_TRES and 1 <= action[1] <= SECRET_MAX:
+            self._punish(seat, action[1])
+            self._begin_turn(self.next_seat(seat))
+        elif kind == DECLINE and phase == PHASE_TRES:
+            self._begin_turn(self.next_seat(seat))
+        elif kind == SWAP and phase == PHASE_SWAP and action[1] != seat and 0 <= action[1] < len(self.hands):
+            target = action[1]
+            self.hands[seat], self.hands[target] = self.hands[target], self.hands[seat]
+            self.events.append((EVENT_SWAP, seat, target))
+            self._end_turn(seat)
+        elif kind == JUMP_IN and action in self.jump_in_actions():
+            seat = self.turn = action[1]
+            self.events.append((EVENT_JUMP_IN, seat, action[2]))
+            self._play(seat, action[2], None)
+        elif kind == CHOOSE_COLOR and phase == PHASE_COLOR and action[1] in COLOR_SET:
+            self.top = action[1] + self.top
+            if self.top.endswith("WILD+4"):
+                # WILD PLUS FOUR STARTING EFFECT - Apply draw 4 penalty and start at player 2
+                self.wild_plus_4_accum = 4
+                self._begin_turn(self.next_seat(0))
+            else:
+                self._begin_turn(0)
+        else:
+            raise ValueError(f"Illegal action {action!r} during {phase} phase")
+
+        self.turn_count += 1
+        if self.history is not None:
+            self.history.append(action)
+        return self.events
+
+    # ------------------------------------------------------------
+    # INTERNAL RULE STEPS
+    # ------------------------------------------------------------
+
+    def _play(self, seat, card, color):
+        """Moves a card from the hand to the discard pile and applies its effect."""
+        hand = self.hands[seat]
+        hand.remove(card)
+        self.discard.append(card)
+        self.top = color + card if card in WILDS else card
+        self.events.append((EVENT_PLAY, seat, card, self.top))
+
+        # WIN CONDITION CHECK - Empty hand ends the game before any effect
+        if not hand:
+            self.winner = seat
+            self.phase = PHASE_OVER
+            self.events.append((EVENT_WIN, seat))
+            return
+
+        # SPECIAL CARD EFFECTS - Compiled handler for this card under the game's rule variants
+        if self.rules.effects[CARD_IDS[card]](self, seat):
+            return  # EFFECT NEEDS ANOTHER DECISION: e.g. picking a seven swap target
+        self._end_turn(seat)
+
+    def _end_turn(self, seat):
+        """Offers the Tres punishment at exactly three cards, otherwise passes the turn on."""
+        if len(self.hands[seat]) == TRES_HAND_SIZE:
+            self.phase = PHASE_TRES
+            return
+        self._begin_turn(self.next_seat(seat))
+
+    def _begin_turn(self, seat):
+        """Hands the turn to a seat, consuming a pending SKIP and setting the phase."""
+        if self.pending_skip:
+            self.pending_skip = False
+            self.events.append((EVENT_SKIP, seat))
+            seat = self.next_seat(seat)
+        self.turn = seat
+        if self.drawtwo_accum:
+            self.phase = PHASE_DRAWTWO
+        elif self.wild_plus_4_accum:
+            self.phase = PHASE_WILD4
+        else:
+            self.phase = PHASE_PLAY
+
+    def _punish(self, seat, guess):
+        """
+        Executes Tres punishment: others draw if the guess is close, the guesser draws if not.
+
+        - Exact match: Others draw 2x punishment
+        - Within game.punishment_threshold: Others draw normal punishment
+        - Outside game.punishment_threshold: Guesser draws punishment
+        """
+        secret = self.rng.randint(1, SECRET_MAX)
+        others = tuple(p for p in range(len(self.hands)) if p != seat)
+        if guess == secret:
+            amount, targets = self.rng.randint(1, PUNISHMENT_MAX_DRAW) * 2, others
+        elif abs(guess - secret) <= self.punishment_threshold:
+            amount, targets = self.rng.randint(1, PUNISHMENT_MAX_DRAW), others
+        else:
+            amount, targets = self.rng.randint(1, PUNISHMENT_MAX_DRAW), (seat,)
+        self.events.append((EVENT_PUNISH, seat, guess, secret, amount, targets))
+        for target in targets:
+            self.events.append((EVENT_DRAW, target, self._deal(target, amount), "punish"))
+
+    def _deal(self, seat, count):
+        """
+        Draws up to count cards into a hand and returns the cards drawn.
+
+        Deals in bulk slices from the pile and reshuffles the discard pile
+        whenever the pile runs out part way through.
+        """
+        cards = self.deck.draw_n(count)
+        while len(cards) < count:
+            # DECK EXHAUSTION HANDLING - Reshuffle discard pile except the top card
+            if len(self.discard) < 2:
+                self.events.append((EVENT_EXHAUSTED, seat))
+                break
+            recycled = self.discard
+            self.discard = [recycled.pop()]
+            self.deck.refill(recycled, self.rng)
+            self.events.append((EVENT_RESHUFFLE,))
+            cards += self.deck.draw_n(count - len(cards))
+        self.hands[seat].extend(cards)
+        return cards
+
+# ============================================================
+# PACKED STATE - Compact immutable snapshots over integer card ids
+# ============================================================
+
+class PackedTres:
+    """
+    Compact, immutable snapshot of a TresGame.
+
+    Each hand, the draw pile and the discard pile are stored as bytes with
+    one integer card id per card (order kept), and the random state as one
+    packed buffer, so a snapshot is a few small buffers whatever happened in
+    the game. Nothing in it can change, so a clone is the same object;
+    unpack() builds a playable TresGame with the usual list-of-strings hands.
+
+    Attributes:
+        hands (tuple): bytes of card ids per seat
+        deck (bytes): Card ids still in the draw pile, next card first
+        discard (bytes): Card ids in the discard pile, top card last
+        top (int): Id of the card in play (colored wild ids included)
+        fields (tuple): turn, direction, phase, pending_skip, drawtwo_accum,
+            wild_plus_4_accum, winner, turn_count
+        config (tuple): punishment_threshold, seed, deck_counts (sorted (group, copies)
+            pairs, so no caller's dict is shared), decks, rules
+        rng_state (tuple): (version, packed Mersenne Twister words, gauss_next)
+    """
+    __slots__ = ("hands", "deck", "discard", "top", "fields", "config", "rng_state")
+
+    def __init__(self, hands, deck, discard, top, fields, config, rng_state):
+        self.hands = hands
+        self.deck = deck
+        self.discard = discard
+        self.top = top
+        self.fields = fields
+        self.config = config
+        self.rng_state = rng_state
+
+    @classmethod
+    def from_game(cls, game):
+        """Packs a TresGame (its history and last events are not kept)."""
+        encode = CARD_IDS.__getitem__
+        version, words, gauss = game.rng.getstate()
+        return cls(
+            tuple(bytes(map(encode, hand)) for hand in game.hands),
+            bytes(map(encode, game.deck)),
+            bytes(map(encode, game.discard)),
+            CARD_IDS[game.top],
+            (game.turn, game.direction, game.phase, game.pending_skip, game.drawtwo_accum,
+             game.wild_plus_4_accum, game.winner, game.turn_count),
+            (game.punishment_threshold, game.seed, tuple(sorted(game.deck_counts.items())), game.decks, game.rules),
+            (version, array("I", words).tobytes(), gauss),
+        )
+
+    def copy(self):
+        """Immutable, so the clone is the snapshot itself."""
+        return self
+
+    __copy__ = copy
+
+    def unpack(self):
+        """Returns a new, independent TresGame equal to the packed one."""
+        decode = CARD_NAMES.__getitem__
+        game = TresGame.__new__(TresGame)
+        game.hands = [TresHand(map(decode, hand)) for hand in self.hands]
+        game.deck = TresDeck(map(decode, self.deck))
+        game.discard = list(map(decode, self.discard))
+        game.top = CARD_NAMES[self.top]
+        (game.turn, game.direction, game.phase, game.pending_skip, game.drawtwo_accum,
+         game.wild_plus_4_accum, game.winner, game.turn_count) = self.fields
+        game.punishment_threshold, game.seed, deck_counts, game.decks, game.rules = self.config
+        game.deck_counts = dict(deck_counts)
+        version, words, gauss = self.rng_state
+        game.rng = random.Random.__new__(random.Random)
+        game.rng.setstate((version, tuple(array("I", words)), gauss))
+        game.history = None
+        game.events = []
+        return game
+
+    def hand_names(self, seat):
+        """Returns one seat's hand as the list-of-strings view used by the turtle UI."""
+        return [CARD_NAMES[card] for card in self.hands[seat]]
+
+    def hand_counts(self, seat):
+        """Returns one seat's hand as a count per face id."""
+        counts = [0] * NUM_FACES
+        for card in self.hands[seat]:
+            counts[card] += 1
+        return counts
@@ -0,0 +1,188 @@
+# ============================================================
+# TRES PUNISHMENT ANALYSIS - Vectorized odds of the Tres punishment mechanic
+# ============================================================
+# The punishment compares a 1-SECRET_MAX guess with a secret number: an exact
+# hit makes every other player draw double, a guess within the threshold makes
+# them draw 1-PUNISHMENT_MAX_DRAW cards, anything else makes the guesser draw.
+# This tool computes the exact expected cards drawn for several guessing
+# strategies and checks them with a NumPy Monte Carlo run over millions of
+# trials, for every threshold in a sweep.
+#
+# Example:
+#     python tres_punish_analysis.py
+#     python tres_punish_analysis.py --thresholds 0,10,20,30,40,50 --players 6 --trials 5000000
+
+# EXTERNAL LIBRARY IMPORTS - Command line parsing and timing
+import argparse
+import time
+
+# OPTIONAL NUMPY IMPORT - Only this analysis tool needs NumPy, the games never do
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# RULES ENGINE IMPORTS - The numbers the punishment is built from
+from tres_engine import PUNISHMENT_THRESHOLD, SECRET_MAX, PUNISHMENT_MAX_DRAW
+from tres_bots import TRES_GUESS
+
+# ============================================================
+# ANALYSIS CONSTANTS SECTION
+# ============================================================
+
+DEFAULT_TRIALS = 2_000_000  # MONTE CARLO TRIALS PER STRATEGY
+DEFAULT_THRESHOLDS = "0,10,20,30,40,50,60"
+MEAN_DRAW = (1 + PUNISHMENT_MAX_DRAW) / 2  # EXPECTED CARDS IN ONE NORMAL PUNISHMENT
+
+# ============================================================
+# GUESSING STRATEGIES - Probability of each guess 1..SECRET_MAX
+# ============================================================
+
+def fixed_guess(guess):
+    """Returns the strategy that always guesses the same number."""
+    strategy = np.zeros(SECRET_MAX)
+    strategy[guess - 1] = 1.0
+    return strategy
+
+def guessing_strategies():
+    """Returns the named strategies compared in the report."""
+    return {
+        f"bot ({TRES_GUESS})": fixed_guess(TRES_GUESS),
+        "uniform": np.full(SECRET_MAX, 1 / SECRET_MAX),
+        "edge (1)": fixed_guess(1),
+    }
+
+# ============================================================
+# EXACT EXPECTATIONS - Closed form over the uniform secret number
+# ============================================================
+
+def outcome_odds(threshold):
+    """
+    Returns the chance of each punishment outcome for every possible guess.
+
+    Args:
+        threshold (int): Guess distance that still punishes the other players
+
+    Returns:
+        tuple: (exact, close, miss) arrays indexed by guess - 1
+    """
+    values = np.arange(1, SECRET_MAX + 1)
+    within = np.abs(values[:, None] - values[None, :]) <= threshold  # [guess, secret]
+    exact = np.full(SECRET_MAX, 1 / SECRET_MAX)
+    close = within.mean(axis=1) - exact
+    return exact, close, 1 - exact - close
+
+def expected_cards(strategy, threshold):
+    """
+    Exact expected cards drawn in one punishment.
+
+    Args:
+        strategy (ndarray): Probability of each guess 1..SECRET_MAX
+        threshold (int): Punishment threshold
+
+    Returns:
+        tuple: (success chance, cards drawn by the guesser, cards drawn by each other player)
+    """
+    exact, close, miss = outcome_odds(threshold)
+    success = strategy @ (exact + close)
+    self_cards = strategy @ miss * MEAN_DRAW
+    opponent_cards = strategy @ (2 * exact + close) * MEAN_DRAW
+    return success, self_cards, opponent_cards
+
+def best_guess(threshold, opponents):
+    """Returns the fixed guess with the largest expected card advantage over the table."""
+    exact, close, miss = outcome_odds(threshold)
+    advantage = opponents * (2 * exact + close) - miss
+    return int(np.argmax(advantage)) + 1
+
+# ============================================================
+# MONTE CARLO CHECK - Millions of punishments at once
+# ============================================================
+
+def draw_trials(strategy, trials, rng):
+    """
+    Samples guesses, secret numbers and punishment sizes for many punishments.
+
+    The same samples are reused for every threshold in a sweep, so
+    differences between thresholds are not hidden by sampling noise.
+    """
+    guesses = rng.choice(SECRET_MAX, size=trials, p=strategy) + 1
+    secrets = rng.integers(1, SECRET_MAX + 1, size=trials)
+    amounts = rng.integers(1, PUNISHMENT_MAX_DRAW + 1, size=trials)
+    return np.abs(guesses - secrets), amounts
+
+def simulate(distance, amounts, threshold):
+    """
+    Mirrors TresGame._punish on arrays of samples.
+
+    Returns:
+        tuple: (success rate, mean cards drawn by the guesser, mean cards drawn by each other player)
+    """
+    hit = distance <= threshold
+    self_cards = np.where(hit, 0, amounts)
+    opponent_cards = np.where(distance == 0, 2 * amounts, np.where(hit, amounts, 0))
+    return hit.mean(), self_cards.mean(), opponent_cards.mean()
+
+# ============================================================
+# REPORT
+# ============================================================
+
+def analyze(thresholds, players, trials, seed=0):
+    """
+    Builds the report for a threshold sweep.
+
+    Args:
+        thresholds (list): Punishment thresholds to compare
+        players (int): Seats at the table (the guesser plus players - 1 opponents)
+        trials (int): Monte Carlo trials per strategy
+        seed: Seed for the NumPy random generator
+
+    Returns:
+        str: Printable report
+    """
+    rng = np.random.default_rng(seed)
+    opponents = players - 1
+    strategies = guessing_strategies()
+    samples = {name: draw_trials(strategy, trials, rng) for name, strategy in strategies.items()}
+
+    lines = [f"Tres punishment, {players} players, {trials:,} Monte Carlo trials per strategy "
+             f"(exact value / simulated value)"]
+    for threshold in thresholds:
+        guess = best_guess(threshold, opponents)
+        rows = dict(strategies)
+        rows[f"best ({guess})"] = fixed_guess(guess)
+        marker = "  <- current" if threshold == PUNISHMENT_THRESHOLD else ""
+        lines.append(f"\nThreshold {threshold}{marker}")
+        lines.append(f"  {'strategy':<12} {'success':>17} {'self draws':>15} {'each other':>15} {'net advantage':>15}")
+        for name, strategy in rows.items():
+            success, self_cards, opponent_cards = expected_cards(strategy, threshold)
+            if name in samples:
+                sim_success, sim_self, sim_opponent = simulate(*samples[name], threshold)
+            else:
+                sim_success, sim_self, sim_opponent = simulate(*draw_trials(strategy, trials, rng), threshold)
+            net = opponents * opponent_cards - self_cards
+            lines.append(f"  {name:<12} {success:7.2%} / {sim_success:7.2%} {self_cards:6.3f} / {sim_self:6.3f}"
+                         f" {opponent_cards:6.3f} / {sim_opponent:6.3f} {net:+15.3f}")
+    return "\n".join(lines)
+
+def parse_thresholds(text):
+    """Parses a comma separated list of thresholds."""
+    return [int(value) for value in text.split(",") if value.strip()]
+
+def main(argv=None):
+    """Command line entry point for the punishment analysis."""
+    parser = argparse.ArgumentParser(description="Expected cards drawn by the Tres punishment mechanic.")
+    parser.add_argument("--thresholds", type=parse_thresholds, default=parse_thresholds(DEFAULT_THRESHOLDS))
+    parser.add_argument("--players", type=int, default=4, help="seats at the table")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS, help="Monte Carlo trials per strategy")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    if np is None:
+        parser.exit(1, "The punishment analysis needs NumPy: pip install numpy\n")
+
+    start = time.perf_counter()
+    print(analyze(args.thresholds, args.players, args.trials, args.seed))
+    print(f"\nComputed in {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# ============================================================
+# TRES REPLAY - Seeded game logs, headless replay and fast seeking
+# ============================================================
+# A Tres game is fully determined by its seed, its table settings and the
+# actions applied to it, so a log only stores those. Replaying re-runs the
+# actions through the rules engine at full speed; a TresReplay keeps a state
+# snapshot every SNAPSHOT_INTERVAL actions so it can jump to any turn.
+#
+# Example:
+#     python tres_replay.py tres_crash_log.json              # replay to the end
+#     python tres_replay.py tres_crash_log.json --turn 120   # show the state before action 120
+
+# EXTERNAL LIBRARY IMPORTS - Log files and command line parsing
+import argparse
+import json
+
+# RULES ENGINE IMPORTS - Game state
+from tres_engine import TresGame
+
+# ============================================================
+# REPLAY CONSTANTS SECTION
+# ============================================================
+
+LOG_VERSION = 1  # LOG FORMAT VERSION: Bumped if the stored fields change
+SNAPSHOT_INTERVAL = 64  # SNAPSHOT SPACING: Actions between stored states while replaying
+
+# ============================================================
+# LOG FUNCTIONS - Game <-> compact JSON log
+# ============================================================
+
+def game_log(game):
+    """
+    Builds the log of a recorded game.
+
+    Args:
+        game (TresGame): Game created with record=True
+
+    Returns:
+        dict: JSON-ready log with the seed, table settings and every action
+    """
+    if game.history is None:
+        raise ValueError("Game was not created with record=True")
+    return {
+        "version": LOG_VERSION,
+        "seed": game.seed,
+        "players": game.num_players,
+        "threshold": game.punishment_threshold,
+        "deck": game.deck_counts,
+        "decks": game.decks,
+        "rules": game.rules.variants,
+        "actions": [list(action) for action in game.history],
+    }
+
+def save_log(game, path):
+    """Writes the log of a recorded game to a JSON file."""
+    with open(path, "w") as file:
+        json.dump(game_log(game), file, separators=(",", ":"))
+
+def load_log(path):
+    """Reads a log written by save_log()."""
+    with open(path) as file:
+        log = json.load(file)
+    if log.get("version") != LOG_VERSION:
+        raise ValueError(f"Unsupported Tres log version {log.get('version')!r}")
+    return log
+
+def new_game(log):
+    """Creates the starting state of a logged game (before any action)."""
+    return TresGame(log["players"], seed=log["seed"], punishment_threshold=log["threshold"],
+                    deck_counts=log["deck"], decks=log.get("decks"), rules=log.get("rules"))
+
+def replay(log):
+    """
+    Replays a whole log headlessly.
+
+    Returns:
+        TresGame: State after the last logged action
+
+    Raises:
+        ValueError: If a logged action is illegal, i.e. the rules changed since it was recorded
+    """
+    game = new_game(log)
+    for action in log["actions"]:
+        game.apply(tuple(action))
+    return game
+
+# ============================================================
+# REPLAY VIEWER STATE - Step and seek through a logged game
+# ============================================================
+
+class TresReplay:
+    """
+    Cursor over a logged game.
+
+    Stepping forward applies one logged action. Every SNAPSHOT_INTERVAL
+    actions the state is packed into a snapshot table (PackedTres, a few
+    kilobytes each), so seeking only replays from the nearest earlier
+    snapshot instead of from the start.
+
+    Attributes:
+        log (dict): Log being replayed
+        game (TresGame): State before action number game.turn_count
+        snapshots (dict): Action index -> PackedTres taken before that action
+    """
+
+    def __init__(self, log, snapshot_interval=SNAPSHOT_INTERVAL):
+        self.log = log
+        self.actions = [tuple(action) for action in log["actions"]]
+        self.snapshot_interval = snapshot_interval
+        self.game = new_game(log)
+        self.snapshots = {0: self.game.pack()}
+
+    def __len__(self):
+        """Number of logged actions."""
+        return len(self.actions)
+
+    @property
+    def position(self):
+        """Index of the next action to apply."""
+        return self.game.turn_count
+
+    def step(self):
+        """
+        Applies the next logged action.
+
+        Returns:
+            list: Events caused by the action, or None at the end of the log
+        """
+        position = self.position
+        if position >= len(self.actions):
+            return None
+        events = self.game.apply(self.actions[position])
+        if (position + 1) % self.snapshot_interval == 0 and position + 1 not in self.snapshots:
+            self.snapshots[position + 1] = self.game.pack()
+        return events
+
+    def seek(self, position):
+        """
+        Moves to the state before a given action index (clamped to the log).
+
+        Args:
+            position (int): 0 for the starting state, len(replay) for the final state
+
+        Returns:
+            TresGame: The current state (also kept in replay.game)
+        """
+        position = max(0, min(position, len(self.actions)))
+        # NEAREST SNAPSHOT - Restore it when seeking backwards or when it is ahead of the current state
+        start = max(index for index in self.snapshots if index <= position)
+        if position < self.position or start > self.position:
+            self.game = self.snapshots[start].unpack()
+        while self.position < position:
+            self.step()
+        return self.game
+
+# ============================================================
+# COMMAND LINE ENTRY POINT
+# ============================================================
+
+def describe(game):
+    """Builds a printable summary of a game state."""
+    lines = [
+        f"Action {game.turn_count}: phase {game.phase}, Player {game.turn + 1} to move, top card {game.top}",
+        f"  Deck {len(game.deck)} cards, discard {len(game.discard)} cards, direction {game.direction:+d}",
+        f"  Pending: DRAWTWO {game.drawtwo_accum}, WILD+4 {game.wild_plus_4_accum}, skip {game.pending_skip}",
+    ]
+    for seat, hand in enumerate(game.hands):
+        lines.append(f"  Player {seat + 1} ({len(hand)} cards): {' '.join(hand)}")
+    if game.is_over:
+        lines.append(f"  Player {game.winner + 1} won")
+    return "\n".join(lines)
+
+def main(argv=None):
+    """Command line entry point for replaying a Tres log."""
+    parser = argparse.ArgumentParser(description="Replay a recorded Tres game.")
+    parser.add_argument("log", help="log file written by save_log()")
+    parser.add_argument("--turn", type=int, default=None, help="show the state before this action (default: the end)")
+    args = parser.parse_args(argv)
+
+    log = load_log(args.log)
+    viewer = TresReplay(log)
+    print(f"{len(viewer)} actions, seed {log['seed']}, {log['players']} players")
+    print(describe(viewer.seek(len(viewer) if args.turn is None else args.turn)))
+
+if __name__ == "__main__":
+    main()
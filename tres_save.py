@@ -0,0 +1,146 @@
+# ============================================================
+# TRES SAVE FILES - Suspend a game to disk and resume it later
+# ============================================================
+# A save holds the packed game state (see PackedTres), the recorded action
+# history and the table settings from tres.py, as zlib-compressed JSON.
+# Card piles are stored as base64 strings of card ids, so even long games
+# with large discard piles save and load in milliseconds. Writes go to a
+# temporary file that replaces the old save in one step, so a crash never
+# leaves a half-written save behind.
+
+# EXTERNAL LIBRARY IMPORTS - Encoding, compression and atomic file replacement
+import base64
+import json
+import os
+import tempfile
+import zlib
+
+# RULES ENGINE IMPORTS - Packed game state
+from tres_engine import PackedTres, compile_rules
+
+# ============================================================
+# SAVE FILE CONSTANTS SECTION
+# ============================================================
+
+SAVE_VERSION = 1  # SAVE FORMAT VERSION: Bumped if the stored fields change
+SAVE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tres_save.tres")  # DEFAULT SAVE LOCATION: Next to the arcade, one suspended game at a time
+
+# ============================================================
+# GAME ENCODING - TresGame <-> JSON-ready dict
+# ============================================================
+
+def _encode_bytes(data):
+    return base64.b64encode(data).decode("ascii")
+
+def _decode_bytes(text):
+    return base64.b64decode(text)
+
+def encode_game(game):
+    """
+    Converts a game into a JSON-ready dict through its packed snapshot.
+
+    Args:
+        game (TresGame): Game to save
+
+    Returns:
+        dict: Card piles as base64 card ids plus the scalar state and history
+    """
+    packed = game.pack()
+    threshold, seed, deck_counts, decks, rules = packed.config
+    version, words, gauss = packed.rng_state
+    return {
+        "hands": [_encode_bytes(hand) for hand in packed.hands],
+        "deck": _encode_bytes(packed.deck),
+        "discard": _encode_bytes(packed.discard),
+        "top": packed.top,
+        "fields": list(packed.fields),
+        "threshold": threshold,
+        "seed": seed,
+        "deck_counts": dict(deck_counts),
+        "decks": decks,
+        "rules": rules.variants,
+        "rng": [version, _encode_bytes(words), gauss],
+        "history": None if game.history is None else [list(action) for action in game.history],
+    }
+
+def decode_game(data):
+    """Rebuilds the TresGame encoded by encode_game()."""
+    version, words, gauss = data["rng"]
+    packed = PackedTres(
+        tuple(_decode_bytes(hand) for hand in data["hands"]),
+        _decode_bytes(data["deck"]),
+        _decode_bytes(data["discard"]),
+        data["top"],
+        tuple(data["fields"]),
+        (data["threshold"], data["seed"], tuple(sorted(data["deck_counts"].items())), data["decks"],
+         compile_rules(data["rules"])),
+        (version, _decode_bytes(words), gauss),
+    )
+    game = packed.unpack()
+    if data["history"] is not None:
+        game.history = [tuple(action) for action in data["history"]]
+    return game
+
+# ============================================================
+# SAVE FILE FUNCTIONS - Atomic writes and loading
+# ============================================================
+
+def save_game(game, settings, path=SAVE_FILE):
+    """
+    Atomically writes a game and its table settings to a save file.
+
+    Args:
+        game (TresGame): Game to suspend
+        settings (dict): JSON-ready table settings from the UI (player counts, difficulty, ...)
+        path (str): Save file location
+    """
+    payload = json.dumps({"version": SAVE_VERSION, "settings": settings, "game": encode_game(game)},
+                         separators=(",", ":")).encode("utf-8")
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".tres_save_", suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(zlib.compress(payload))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)  # ATOMIC SWAP: Readers see the old save or the new one, never a mix
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def load_game(path=SAVE_FILE):
+    """
+    Reads a save file written by save_game().
+
+    Returns:
+        tuple: (TresGame, settings dict)
+
+    Raises:
+        ValueError: If the file is not a Tres save, has an unsupported version
+            or is truncated or malformed
+    """
+    with open(path, "rb") as file:
+        try:
+            data = json.loads(zlib.decompress(file.read()))
+        except (zlib.error, ValueError) as error:
+            raise ValueError(f"{path} is not a Tres save file") from error
+    if not isinstance(data, dict) or data.get("version") != SAVE_VERSION:
+        version = data.get("version") if isinstance(data, dict) else None
+        raise ValueError(f"Unsupported Tres save version {version!r}")
+    try:
+        game, settings = decode_game(data["game"]), data["settings"]
+    except (KeyError, TypeError, IndexError, AttributeError) as error:
+        # MALFORMED PAYLOAD: Report it like any other bad save so callers only catch ValueError
+        raise ValueError(f"{path} holds a damaged Tres save ({error!r})") from error
+    if not isinstance(settings, dict):
+        raise ValueError(f"{path} holds a damaged Tres save (settings are not a mapping)")
+    return game, settings
+
+def has_save(path=SAVE_FILE):
+    """True if a suspended game is waiting at path."""
+    return os.path.exists(path)
+
+def delete_save(path=SAVE_FILE):
+    """Removes a save file once its game has been resumed to the end."""
+    if os.path.exists(path):
+        os.remove(path)
@@ -0,0 +1,487 @@
+# ============================================================
+# TRES SERVER - Networked Tres tables over a simple line protocol
+# ============================================================
+# One asyncio process hosts many Tres tables at once. Each player connects
+# with their own client, so every screen shows only that seat's hand and
+# there is no hot-seat hiding. Clients send one text command per line and
+# receive one JSON object per line.
+#
+# Client commands (seats are numbered from 0):
+#     NEW <players> [variant ...]   open a table and sit at seat 0 (variants from RULE_VARIANTS)
+#     JOIN <table>                  take the next free seat; the game starts when the table is full
+#     PLAY <card> [color]           play a card (wilds need a color: R, G, B or Y)
+#     DRAW | PASS | ACCEPT | DECLINE
+#     PUNISH <guess>                trigger the Tres punishment with a 1-100 guess
+#     COLOR <color>                 color for a wild first card
+#     SWAP <seat>                   swap hands after a 7 (seven_zero variant)
+#     JUMP <card>                   play the exact top card out of turn (jump_in variant)
+#     QUIT                          leave the table
+#
+# Server messages: {"type": "joined" | "state" | "over" | "closed" | "error", ...}
+# A "state" message holds the seat's own hand, the other hand sizes, the
+# events of the last action (other players' drawn cards reduced to counts)
+# and "legal", the commands this seat may send right now.
+#
+# Example:
+#     python tres_server.py serve --port 8765
+#     python tres_server.py client --port 8765
+#     python tres_server.py bench --tables 200 --players 4
+
+# EXTERNAL LIBRARY IMPORTS - Networking, messages and command line parsing
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import statistics
+import time
+
+# RULES ENGINE IMPORTS - Game state and action/event vocabulary
+from tres_engine import (
+    TresGame, MIN_PLAYERS, MAX_PLAYERS, RULE_VARIANTS,
+    PLAY, DRAW, PASS, ACCEPT, PUNISH, DECLINE, CHOOSE_COLOR, SWAP, JUMP_IN,
+    COLOR_SET, EVENT_DRAW,
+)
+
+# ============================================================
+# SERVER CONSTANTS SECTION
+# ============================================================
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_LINE = 1024  # LONGEST ACCEPTED COMMAND LINE IN BYTES
+MAX_WRITE_BUFFER = 256 * 1024  # SLOW READER CAP: Unsent bytes a client may fall behind before it is dropped
+
+# COMMAND WORDS - Protocol verb -> engine action kind
+COMMANDS = {
+    "PLAY": PLAY, "DRAW": DRAW, "PASS": PASS, "ACCEPT": ACCEPT, "DECLINE": DECLINE,
+    "PUNISH": PUNISH, "COLOR": CHOOSE_COLOR, "SWAP": SWAP, "JUMP": JUMP_IN,
+}
+ACTION_WORDS = {kind: word for word, kind in COMMANDS.items()}
+
+# ============================================================
+# PROTOCOL HELPERS - Commands <-> engine actions, per-seat views
+# ============================================================
+
+def parse_action(words, seat):
+    """
+    Converts a split command line into an engine action tuple.
+
+    Args:
+        words (list): Upper-cased command words, e.g. ["PLAY", "WILD", "R"]
+        seat (int): Seat sending the command (used for JUMP)
+
+    Returns:
+        tuple: Action for TresGame.apply()
+
+    Raises:
+        ValueError: If the command is malformed
+    """
+    kind = COMMANDS[words[0]]
+    if kind == PLAY and len(words) == 2:
+        return (PLAY, words[1], None)
+    if kind == PLAY and len(words) == 3 and words[2] in COLOR_SET:
+        return (PLAY, words[1], words[2])
+    if kind in (DRAW, PASS, ACCEPT, DECLINE) and len(words) == 1:
+        return (kind,)
+    if kind in (PUNISH, SWAP) and len(words) == 2 and words[1].isdigit():
+        return (kind, int(words[1]))
+    if kind == CHOOSE_COLOR and len(words) == 2 and words[1] in COLOR_SET:
+        return (CHOOSE_COLOR, words[1])
+    if kind == JUMP_IN and len(words) == 2:
+        return (JUMP_IN, seat, words[1])
+    raise ValueError(f"Malformed command: {' '.join(words)}")
+
+def action_command(action):
+    """Converts an engine action back into the command line a client would send."""
+    kind = action[0]
+    if kind == PLAY:
+        return f"PLAY {action[1]}" + (f" {action[2]}" if action[2] else "")
+    if kind == JUMP_IN:
+        return f"JUMP {action[2]}"
+    return " ".join([ACTION_WORDS[kind], *map(str, action[1:])])
+
+def seat_events(events, seat):
+    """Returns the events a seat may see: other players' drawn cards become card counts."""
+    visible = []
+    for event in events:
+        if event[0] == EVENT_DRAW and event[1] != seat:
+            event = (EVENT_DRAW, event[1], len(event[2]), event[3])
+        visible.append(list(event))
+    return visible
+
+def seat_view(game, seat, events):
+    """
+    Builds the "state" message for one seat.
+
+    Only this seat's hand is included; other seats are shown as hand sizes.
+    """
+    if game.turn == seat:
+        legal = [action_command(action) for action in game.legal_actions()]
+    else:
+        legal = [action_command(action) for action in game.jump_in_actions() if action[1] == seat]
+    return {
+        "type": "state",
+        "seat": seat,
+        "hand": list(game.hands[seat]),
+        "hand_sizes": [len(hand) for hand in game.hands],
+        "top": game.top,
+        "turn": game.turn,
+        "phase": game.phase,
+        "direction": game.direction,
+        "deck": len(game.deck),
+        "events": seat_events(events, seat),
+        "legal": legal,
+    }
+
+# ============================================================
+# TABLES AND CONNECTIONS
+# ============================================================
+
+class Seat:
+    """One client connection and the table seat it holds."""
+    __slots__ = ("writer", "table", "seat")
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.table = None
+        self.seat = None
+
+    def send(self, message):
+        """
+        Queues one JSON message line (flushed by the event loop).
+
+        Broadcasts only drain the sender, so a client that stops reading is
+        dropped once MAX_WRITE_BUFFER bytes are waiting for it.
+        """
+        if self.writer.is_closing():
+            return
+        self.writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+        if self.writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self.writer.transport.abort()  # STALLED READER: Its read loop sees the reset and leaves the table
+
+class Table:
+    """
+    One Tres table: seated clients plus the game once every seat is taken.
+
+    Attributes:
+        table_id (int): Id clients use to JOIN
+        players (int): Seats at the table
+        rules (dict): Rule variant overrides for the game
+        seats (list): Seat per seat number, None while free
+        game (TresGame): Running game, None until the table is full
+    """
+
+    def __init__(self, table_id, players, rules):
+        self.table_id = table_id
+        self.players = players
+        self.rules = rules
+        self.seats = [None] * players
+        self.game = None
+
+    def sit(self, client):
+        """Seats a client at the first free seat and starts the game when the table is full."""
+        seat = self.seats.index(None)
+        self.seats[seat] = client
+        client.table, client.seat = self, seat
+        client.send({"type": "joined", "table": self.table_id, "seat": seat, "players": self.players})
+        if None not in self.seats:
+            self.game = TresGame(self.players, rules=self.rules)
+            self.broadcast(self.game.events)
+
+    def broadcast(self, events):
+        """Sends every seat its own view of the game after a change."""
+        for client in self.seats:
+            if client is not None:
+                client.send(seat_view(self.game, client.seat, events))
+
+    def close(self, message):
+        """Tells every seated client the table is gone and unseats them."""
+        for client in self.seats:
+            if client is not None:
+                client.send(message)
+                client.table = client.seat = None
+        self.seats = [None] * self.players
+
+class TresServer:
+    """
+    Hosts any number of Tres tables in one asyncio event loop.
+
+    Every command is handled to completion before the next one is read,
+    so table state needs no locks; a turn costs one engine step plus one
+    small JSON message per seat at that table.
+    """
+
+    def __init__(self):
+        self.tables = {}
+        self.table_ids = itertools.count(1)
+        self.server = None
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Starts listening; port 0 picks a free port (see self.port)."""
+        self.server = await asyncio.start_server(self.handle_client, host, port, limit=MAX_LINE)
+        return self
+
+    @property
+    def port(self):
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle_client(self, reader, writer):
+        """Reads command lines from one client until it disconnects."""
+        client = Seat(writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    break  # LINE TOO LONG OR CONNECTION RESET
+                if not line:
+                    break
+                words = line.decode(errors="replace").upper().split()
+                if words:
+                    self.handle_command(client, words)
+                    try:
+                        await writer.drain()
+                    except ConnectionError:
+                        break  # CLIENT WENT AWAY WHILE ITS REPLY WAS BEING SENT
+        finally:
+            self.leave(client)
+            writer.close()
+
+    def handle_command(self, client, words):
+        """
+        Runs one client command, answering errors to that client only.
+
+        Any exception from a command becomes an error reply, so one bad
+        command cannot drop the connection or break the table for other seats.
+        """
+        verb = words[0]
+        try:
+            if verb == "NEW":
+                self.new_table(client, words[1:])
+            elif verb == "JOIN":
+                self.join_table(client, words[1:])
+            elif verb == "QUIT":
+                self.leave(client)
+            elif verb in COMMANDS:
+                self.play(client, parse_action(words, client.seat))
+            else:
+                raise ValueError(f"Unknown command {verb}")
+        except (ValueError, IndexError) as error:
+            client.send({"type": "error", "message": str(error)})
+        except Exception as error:  # ENGINE FAULT: Report it instead of dropping the connection
+            client.send({"type": "error", "message": f"Command failed: {error!r}"})
+
+    def new_table(self, client, args):
+        if client.table is not None:
+            raise ValueError("Already seated at a table")
+        players = int(args[0])
+        if not MIN_PLAYERS <= players <= MAX_PLAYERS:
+            raise ValueError(f"Tables seat {MIN_PLAYERS}-{MAX_PLAYERS} players")
+        rules = {}
+        for name in args[1:]:
+            name = name.lower()
+            if name not in RULE_VARIANTS:
+                raise ValueError(f"Unknown rule variant {name}")
+            rules[name] = not RULE_VARIANTS[name]  # NAMING A VARIANT FLIPS ITS DEFAULT
+        table = Table(next(self.table_ids), players, rules)
+        self.tables[table.table_id] = table
+        table.sit(client)
+
+    def join_table(self, client, args):
+        if client.table is not None:
+            raise ValueError("Already seated at a table")
+        table = self.tables.get(int(args[0]))
+        if table is None or table.game is not None:
+            raise ValueError("No open table with that id")
+        table.sit(client)
+
+    def play(self, client, action):
+        table = client.table
+        if table is None or table.game is None:
+            raise ValueError("The game has not started")
+        game = table.game
+        if action[0] != JUMP_IN and game.turn != client.seat:
+            raise ValueError("It is not your turn")
+        events = game.apply(action)
+        table.broadcast(events)
+        if game.is_over:
+            del self.tables[table.table_id]
+            table.close({"type": "over", "winner": game.winner})
+
+    def leave(self, client):
+        """Removes a client from its table; a running game ends for everyone."""
+        table = client.table
+        if table is None:
+            return
+        if table.game is None:
+            table.seats[client.seat] = None
+            client.table = client.seat = None
+            if not any(table.seats):
+                self.tables.pop(table.table_id, None)
+            return
+        self.tables.pop(table.table_id, None)
+        table.close({"type": "closed", "reason": f"Seat {client.seat} left the table"})
+
+# ============================================================
+# CLIENTS - Loopback test clients and a console client
+# ============================================================
+
+class TresClient:
+    """Minimal asyncio client: send command lines, receive JSON messages."""
+
+    async def connect(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        return self
+
+    def send(self, line):
+        self.writer.write(line.encode() + b"\n")
+
+    async def receive(self):
+        """Returns the next server message, or None once the server hangs up."""
+        line = await self.reader.readline()
+        return json.loads(line) if line else None
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+async def random_player(client, rng, latencies, max_actions, think=0.0):
+    """
+    Plays random legal commands until the table ends, preferring any card
+    play over drawing or passing so games actually finish.
+
+    Records the time from each command to the next state message it gets back.
+    think (float) is the mean pause in seconds before each command, to mimic
+    people instead of clients firing as fast as the server answers.
+    """
+    sent_at = None
+    actions = 0
+    while True:
+        message = await client.receive()
+        if message is None or message["type"] in ("over", "closed"):
+            return
+        if message["type"] == "error":
+            sent_at = None
+            continue
+        if message["type"] != "state":
+            continue
+        if sent_at is not None:
+            latencies.append(time.perf_counter() - sent_at)
+            sent_at = None
+        if message["legal"] and (message["turn"] == message["seat"] or rng.random() < 0.5):
+            actions += 1
+            if actions > max_actions:
+                client.send("QUIT")
+                continue
+            plays = [command for command in message["legal"] if not command.startswith(("DRAW", "PASS"))]
+            command = rng.choice(plays or message["legal"])
+            if think:
+                await asyncio.sleep(rng.uniform(0, 2 * think))
+            sent_at = time.perf_counter()
+            client.send(command)
+
+async def run_bench(tables, players, seed=0, max_actions=2000, think=0.0):
+    """
+    Hosts tables on a loopback server and lets random clients play them out.
+
+    Returns:
+        dict: Tables, actions, elapsed seconds and latency percentiles
+    """
+    server = await TresServer().start(DEFAULT_HOST, 0)
+    rng = random.Random(seed)
+    latencies = []
+    clients = []
+    for table_id in range(1, tables + 1):
+        for seat in range(players):
+            client = await TresClient().connect(DEFAULT_HOST, server.port)
+            client.send(f"NEW {players}" if seat == 0 else f"JOIN {table_id}")
+            clients.append(client)
+    start = time.perf_counter()
+    await asyncio.gather(*(random_player(client, random.Random(rng.getrandbits(64)), latencies, max_actions, think)
+                           for client in clients))
+    elapsed = time.perf_counter() - start
+    for client in clients:
+        await client.close()
+    await server.close()
+    latencies.sort()
+    return {
+        "tables": tables,
+        "actions": len(latencies),
+        "elapsed": elapsed,
+        "median_ms": 1000 * statistics.median(latencies) if latencies else 0.0,
+        "p99_ms": 1000 * latencies[int(len(latencies) * 0.99)] if latencies else 0.0,
+    }
+
+def render_state(message):
+    """Formats a state message for the console client (only this seat's hand is known)."""
+    others = ", ".join(f"seat {seat}: {size}" for seat, size in enumerate(message["hand_sizes"])
+                       if seat != message["seat"])
+    lines = [f"Top card: {message['top']}   Turn: seat {message['turn']} ({message['phase']})   Cards held: {others}",
+             f"Your hand (seat {message['seat']}): {' '.join(message['hand'])}"]
+    if message["legal"]:
+        lines.append(f"You may send: {', '.join(message['legal'][:12])}{' ...' if len(message['legal']) > 12 else ''}")
+    return "\n".join(lines)
+
+async def console_client(host, port):
+    """Interactive client: type protocol commands, see your own view of the table."""
+    client = await TresClient().connect(host, port)
+    loop = asyncio.get_running_loop()
+
+    async def show_messages():
+        while True:
+            message = await client.receive()
+            if message is None:
+                print("Disconnected.")
+                return
+            print(render_state(message) if message["type"] == "state" else message)
+
+    printer = asyncio.ensure_future(show_messages())
+    print("Connected. Type NEW <players> or JOIN <table> to sit down, QUIT to leave.")
+    while not printer.done():
+        line = await loop.run_in_executor(None, input)
+        client.send(line)
+    await client.close()
+
+# ============================================================
+# COMMAND LINE ENTRY POINT
+# ============================================================
+
+def main(argv=None):
+    """Command line entry point: run a server, a console client, or a loopback benchmark."""
+    parser = argparse.ArgumentParser(description="Networked Tres tables over a line protocol.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="host tables")
+    serve.add_argument("--host", default=DEFAULT_HOST, help="use 0.0.0.0 to accept LAN players")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    client = commands.add_parser("client", help="join tables from this console")
+    client.add_argument("--host", default=DEFAULT_HOST)
+    client.add_argument("--port", type=int, default=DEFAULT_PORT)
+    bench = commands.add_parser("bench", help="play random games with in-process loopback clients")
+    bench.add_argument("--tables", type=int, default=100)
+    bench.add_argument("--players", type=int, default=4)
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--max-actions", type=int, default=2000, help="actions per client before it quits")
+    bench.add_argument("--think", type=float, default=0.0, help="mean seconds a client waits before each command")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        async def serve_forever():
+            server = await TresServer().start(args.host, args.port)
+            print(f"Tres server listening on {args.host}:{server.port}")
+            await server.server.serve_forever()
+        asyncio.run(serve_forever())
+    elif args.command == "client":
+        asyncio.run(console_client(args.host, args.port))
+    else:
+        result = asyncio.run(run_bench(args.tables, args.players, args.seed, args.max_actions, args.think))
+        print(f"{result['tables']} tables, {result['actions']} actions in {result['elapsed']:.1f}s "
+              f"({result['actions'] / max(result['elapsed'], 1e-9):.0f} actions/s), "
+              f"latency median {result['median_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms")
+
+if __name__ == "__main__":
+    main()
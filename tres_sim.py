@@ -0,0 +1,261 @@
+# ============================================================
+# TRES SIMULATION RUNNER - Headless bot tournaments for balancing
+# ============================================================
+# Plays many headless Tres games between bot policies on every core and
+# reports win rates, game length, punishment frequency and deck exhaustion.
+# Used to tune PUNISHMENT_THRESHOLD, the deck composition in gen_deck() and
+# the rule variants in RULE_VARIANTS.
+#
+# Example:
+#     python tres_sim.py --games 100000 --players 4 --policies greedy,random
+#     python tres_sim.py --games 20000 --thresholds 20,30,40,50 --deck wilds=2
+#     python tres_sim.py --games 20000 --variants "standard;seven_zero;jump_in,stacking=off"
+
+# EXTERNAL LIBRARY IMPORTS - Command line parsing, worker pool, randomness and timing
+import argparse
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter
+
+# RULES ENGINE AND BOT IMPORTS - Game state, event vocabulary and policies
+from tres_engine import (
+    TresGame, PUNISHMENT_THRESHOLD, DECK_COUNTS, MIN_PLAYERS, MAX_PLAYERS,
+    EVENT_PUNISH, EVENT_EXHAUSTED, EVENT_RESHUFFLE, EVENT_JUMP_IN, compile_rules,
+)
+from tres_bots import bot_actions, greedy_action, choose_action, DIFFICULTY_BUDGETS
+
+# ============================================================
+# SIMULATION CONSTANTS SECTION
+# ============================================================
+
+MAX_TURNS = 3000  # TURN CAP: Games still running after this many actions count as stalled
+GAMES_PER_CHUNK = 200  # CHUNK SIZE: Fixed, so a seed gives the same results for any worker count
+
+# ============================================================
+# BOT POLICIES - Name -> function(game, rng) returning an action
+# ============================================================
+
+def random_policy(game, rng):
+    """Plays a uniformly random bot action (draws only when nothing is playable)."""
+    return rng.choice(bot_actions(game))
+
+def _ismcts_policy(difficulty):
+    """Returns a policy that runs a single-process ISMCTS search at a difficulty's budget."""
+    def policy(game, rng):
+        return choose_action(game, difficulty, rng.getrandbits(64), parallel=False)
+    return policy
+
+POLICIES = {"random": random_policy, "greedy": greedy_action}
+POLICIES.update({f"ismcts-{difficulty}": _ismcts_policy(difficulty) for difficulty in DIFFICULTY_BUDGETS})
+
+# ============================================================
+# SIMULATION WORKER - Plays one independently seeded chunk of games
+# ============================================================
+
+def new_stats():
+    """Returns an empty statistics record; records from workers are merged with merge_stats()."""
+    return {
+        "games": 0,
+        "finished": 0,
+        "turns": 0,
+        "wins_by_policy": Counter(),
+        "seats_by_policy": Counter(),
+        "wins_by_seat": Counter(),
+        "punishments": 0,
+        "self_punishments": 0,
+        "games_with_punishment": 0,
+        "exhaustions": 0,
+        "games_with_exhaustion": 0,
+        "reshuffles": 0,
+        "jump_ins": 0,
+    }
+
+def merge_stats(total, stats):
+    """Adds one statistics record into another in place and returns it."""
+    for key, value in stats.items():
+        total[key] += value
+    return total
+
+def run_chunk(task):
+    """
+    Plays a chunk of games from its own seeded random stream.
+
+    Seats are assigned policies round robin, then rotated by a random offset
+    every game so no policy keeps the first-seat advantage. Under the jump_in
+    variant every seat jumps in whenever it can.
+
+    Args:
+        task (tuple): (chunk_index, games, config) where config is a dict with
+            seed, players, policies, threshold, deck_counts, rules and max_turns
+
+    Returns:
+        dict: Statistics record for the chunk
+    """
+    chunk, games, config = task
+    rng = random.Random(f"{config['seed']}:{chunk}")
+    names = config["policies"]
+    players = config["players"]
+    stats = new_stats()
+
+    for _ in range(games):
+        rotation = rng.randrange(players)
+        seat_policies = [names[(seat + rotation) % len(names)] for seat in range(players)]
+        game = TresGame(players, seed=rng.getrandbits(64), punishment_threshold=config["threshold"],
+                        deck_counts=config["deck_counts"], rules=config["rules"])
+        punishments = exhaustions = 0
+        while not game.is_over and game.turn_count < config["max_turns"]:
+            jumps = game.jump_in_actions()
+            action = rng.choice(jumps) if jumps else POLICIES[seat_policies[game.turn]](game, rng)
+            for event in game.apply(action):
+                if event[0] == EVENT_PUNISH:
+                    punishments += 1
+                    stats["self_punishments"] += event[5] == (event[1],)
+                elif event[0] == EVENT_EXHAUSTED:
+                    exhaustions += 1
+                elif event[0] == EVENT_RESHUFFLE:
+                    stats["reshuffles"] += 1
+                elif event[0] == EVENT_JUMP_IN:
+                    stats["jump_ins"] += 1
+
+        stats["games"] += 1
+        stats["turns"] += game.turn_count
+        stats["punishments"] += punishments
+        stats["games_with_punishment"] += punishments > 0
+        stats["exhaustions"] += exhaustions
+        stats["games_with_exhaustion"] += exhaustions > 0
+        stats["seats_by_policy"].update(seat_policies)
+        if game.is_over:
+            stats["finished"] += 1
+            stats["wins_by_policy"][seat_policies[game.winner]] += 1
+            stats["wins_by_seat"][game.winner] += 1
+    return stats
+
+# ============================================================
+# TOURNAMENT DRIVER - Splits games over worker processes
+# ============================================================
+
+def run_tournament(games, players=4, policies=("greedy",), seed=0, threshold=PUNISHMENT_THRESHOLD,
+                   deck_counts=DECK_COUNTS, workers=None, max_turns=MAX_TURNS, rules=None):
+    """
+    Plays games headlessly across a process pool and merges the statistics.
+
+    Args:
+        games (int): Number of games to play
+        players (int): Seats per game
+        policies (sequence): Policy names from POLICIES, assigned to seats round robin
+        seed: Base seed; chunk i draws from the stream seeded by f"{seed}:{i}"
+        threshold (int): Punishment threshold passed to every game
+        deck_counts (dict): Deck composition passed to every game
+        workers (int): Worker processes (defaults to every core)
+        max_turns (int): Turn cap per game
+        rules (dict): Rule variant overrides passed to every game
+
+    Returns:
+        dict: Merged statistics record
+    """
+    for name in policies:
+        if name not in POLICIES:
+            raise ValueError(f"Unknown policy {name!r}, choose from {', '.join(POLICIES)}")
+    workers = workers or os.cpu_count() or 1
+    config = {"seed": seed, "players": players, "policies": list(policies), "threshold": threshold,
+              "deck_counts": dict(deck_counts), "max_turns": max_turns,
+              "rules": compile_rules(rules).variants}
+
+    # CHUNKING - Chunk sizes depend only on the game count, never on the worker count
+    tasks = [(chunk, min(GAMES_PER_CHUNK, games - start), config)
+             for chunk, start in enumerate(range(0, games, GAMES_PER_CHUNK))]
+
+    total = new_stats()
+    if workers == 1:
+        for task in tasks:
+            merge_stats(total, run_chunk(task))
+        return total
+    with multiprocessing.Pool(workers) as pool:
+        for stats in pool.imap_unordered(run_chunk, tasks):
+            merge_stats(total, stats)
+    return total
+
+def format_report(stats, policies, threshold, elapsed, variant="standard"):
+    """Builds a printable summary of a statistics record."""
+    games = stats["games"] or 1
+    lines = [
+        f"Threshold {threshold}, {variant} rules: {stats['games']} games in {elapsed:.1f}s ({stats['games'] / max(elapsed, 1e-9):.0f} games/s)",
+        f"  Finished games:        {stats['finished']} ({stats['finished'] / games:.1%}, the rest hit the turn cap)",
+        f"  Mean game length:      {stats['turns'] / games:.1f} actions",
+        f"  Punishments per game:  {stats['punishments'] / games:.2f}"
+        f" ({stats['games_with_punishment'] / games:.1%} of games, {stats['self_punishments'] / max(stats['punishments'], 1):.1%} self-inflicted)",
+        f"  Deck reshuffles:       {stats['reshuffles'] / games:.2f} per game",
+        f"  Deck exhaustion:       {stats['exhaustions']} events in {stats['games_with_exhaustion']} games ({stats['games_with_exhaustion'] / games:.2%})",
+    ]
+    if stats["jump_ins"]:
+        lines.append(f"  Jump-ins per game:     {stats['jump_ins'] / games:.2f}")
+    for name in dict.fromkeys(policies):
+        seats = stats["seats_by_policy"][name]
+        lines.append(f"  Win rate {name:<14} {stats['wins_by_policy'][name] / max(seats, 1):.1%} of {seats} seats")
+    for seat in sorted(stats["wins_by_seat"]):
+        lines.append(f"  Wins from seat {seat + 1}:      {stats['wins_by_seat'][seat] / games:.1%}")
+    return "\n".join(lines)
+
+def parse_deck(text):
+    """Parses a deck override like "wilds=2,actions=3" into a full DECK_COUNTS dict."""
+    counts = dict(DECK_COUNTS)
+    for item in filter(None, text.split(",")):
+        key, _, value = item.partition("=")
+        if key not in counts:
+            raise argparse.ArgumentTypeError(f"Unknown deck group {key!r}, choose from {', '.join(counts)}")
+        counts[key] = int(value)
+    return counts
+
+def parse_variants(text):
+    """
+    Parses a variant sweep like "standard;seven_zero;jump_in,stacking=off".
+
+    Sets are separated by ";". Inside a set, a bare name turns a variant on and
+    name=on/off (or 1/0) sets it explicitly; "standard" is the default rules.
+
+    Returns:
+        list: (label, overrides dict) per variant set
+    """
+    sweep = []
+    for label in text.split(";"):
+        label = label.strip() or "standard"
+        overrides = {}
+        for item in filter(None, label.split(",")):
+            if item == "standard":
+                continue
+            name, _, value = item.partition("=")
+            overrides[name] = value.lower() not in ("0", "off", "false", "no")
+        try:
+            compile_rules(overrides)
+        except ValueError as error:
+            raise argparse.ArgumentTypeError(str(error))
+        sweep.append((label, overrides))
+    return sweep
+
+def main(argv=None):
+    """Command line entry point for the Tres simulation runner."""
+    parser = argparse.ArgumentParser(description="Run headless Tres games between bot policies.")
+    parser.add_argument("--games", type=int, default=10000, help="games to play per threshold")
+    parser.add_argument("--players", type=int, default=4, choices=range(MIN_PLAYERS, MAX_PLAYERS + 1))
+    parser.add_argument("--policies", default="greedy", help=f"comma separated seat policies: {', '.join(POLICIES)}")
+    parser.add_argument("--thresholds", default=str(PUNISHMENT_THRESHOLD), help="comma separated punishment thresholds to sweep")
+    parser.add_argument("--deck", type=parse_deck, default=DECK_COUNTS, help="deck overrides, e.g. wilds=2,actions=3")
+    parser.add_argument("--variants", type=parse_variants, default=[("standard", {})],
+                        help='rule variant sets to sweep, e.g. "standard;seven_zero;jump_in,stacking=off"')
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS)
+    args = parser.parse_args(argv)
+
+    policies = args.policies.split(",")
+    for label, rules in args.variants:
+        for threshold in (int(value) for value in args.thresholds.split(",")):
+            start = time.perf_counter()
+            stats = run_tournament(args.games, args.players, policies, args.seed, threshold,
+                                   args.deck, args.workers, args.max_turns, rules)
+            print(format_report(stats, policies, threshold, time.perf_counter() - start, label))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+# CtrlUno Arcade - Packed Word Lists
+# Word lists for Wordy and Hangman, stored in one packed data file and loaded lazily
+#
+# File layout (plain ASCII): one JSON header line, then the words of every list
+# packed in fixed-width buckets, one bucket per (list, word length). The header
+# maps each list to its buckets as [length, offset, count], offsets counted
+# from the end of the header line. The file is memory-mapped on first use and
+# words are decoded only when read, so lists cost nothing until a game needs them.
+#
+# Example:
+#     python word_store.py list                         # show every list and its word lengths
+#     python word_store.py export wordy_medium > medium.txt
+#     python word_store.py add wordy_medium medium.txt  # replace a list from a file, one word per line
+
+# Import argparse, bisect, json, mmap and os for the packed file and its command line
+import argparse
+import bisect
+import json
+import mmap
+import os
+
+#------------------------------------------------------
+# WORD STORE CONSTANTS
+#------------------------------------------------------
+
+WORD_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "arcade_words.dat")
+WORD_FILE_VERSION = 1
+
+#------------------------------------------------------
+# PACKED WORD LISTS
+#------------------------------------------------------
+
+class WordList:
+    """
+    Read-only sequence of words backed by the mapped word file.
+
+    Supports len(), indexing and iteration, so random.choice() works on it
+    directly; each word is decoded from its fixed-width slot when read.
+    """
+
+    def __init__(self, data, base, buckets):
+        """
+        Args:
+            data (mmap): Mapped word file
+            base (int): Position of the first byte after the header line
+            buckets (list): [length, offset, count] per word length
+        """
+        self.data = data
+        self.buckets = [(length, base + offset, count) for length, offset, count in buckets]
+        self.starts = []  # Index of the first word of each bucket
+        total = 0
+        for _, _, count in self.buckets:
+            self.starts.append(total)
+            total += count
+        self.total = total
+
+    def __len__(self):
+        return self.total
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.total
+        if not 0 <= index < self.total:
+            raise IndexError("word index out of range")
+        bucket = bisect.bisect_right(self.starts, index) - 1
+        length, offset, _ = self.buckets[bucket]
+        start = offset + (index - self.starts[bucket]) * length
+        return self.data[start:start + length].decode("ascii")
+
+    def __iter__(self):
+        for length in self.lengths():
+            yield from self.words(length)
+
+    def lengths(self):
+        """Returns the word lengths in the list."""
+        return [length for length, _, _ in self.buckets]
+
+    def words(self, length):
+        """Returns every word of one length as a list (empty if none)."""
+        for bucket_length, offset, count in self.buckets:
+            if bucket_length == length:
+                packed = self.data[offset:offset + length * count].decode("ascii")
+                return [packed[i:i + length] for i in range(0, len(packed), length)]
+        return []
+
+word_files = {}  # Path -> (header, mapped file, data start), filled on first use
+
+def open_word_file(path=WORD_FILE):
+    """Maps a word file and reads its header (once per path)."""
+    if path not in word_files:
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        base = mapped.find(b"\n") + 1
+        header = json.loads(mapped[:base])
+        if header.get("version") != WORD_FILE_VERSION:
+            mapped.close()
+            raise ValueError(f"Unsupported word file version {header.get('version')!r}")
+        word_files[path] = (header, mapped, base)
+    return word_files[path]
+
+def close_word_file(path=WORD_FILE):
+    """Unmaps a word file (lists loaded from it can no longer be read)."""
+    if path in word_files:
+        word_files.pop(path)[1].close()
+
+def load_words(name, path=WORD_FILE):
+    """
+    Returns a packed word list.
+
+    Args:
+        name (str): List name, e.g. "wordy_easy" or "hangman"
+        path (str): Word file
+
+    Raises:
+        KeyError: If the file has no list with that name
+    """
+    header, data, base = open_word_file(path)
+    return WordList(data, base, header["lists"][name])
+
+def list_names(path=WORD_FILE):
+    """Returns the names of the lists in a word file."""
+    return list(open_word_file(path)[0]["lists"])
+
+#------------------------------------------------------
+# PACKING - Writing the word file
+#------------------------------------------------------
+
+def pack_words(lists, path=WORD_FILE):
+    """
+    Writes word lists to a packed word file.
+
+    Words are lower-cased and de-duplicated, then grouped by length.
+
+    Args:
+        lists (dict): List name -> iterable of words
+        path (str): Word file to write
+    """
+    header = {"version": WORD_FILE_VERSION, "lists": {}}
+    chunks = []
+    offset = 0
+    for name, words in lists.items():
+        by_length = {}
+        for word in dict.fromkeys(word.strip().lower() for word in words if word.strip()):
+            by_length.setdefault(len(word), []).append(word)
+        header["lists"][name] = []
+        for length in sorted(by_length):
+            packed = "".join(by_length[length]).encode("ascii")
+            header["lists"][name].append([length, offset, len(by_length[length])])
+            chunks.append(packed)
+            offset += len(packed)
+    close_word_file(path)  # A mapped file cannot be replaced on every platform
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(json.dumps(header, separators=(",", ":")).encode("ascii") + b"\n")
+        file.writelines(chunks)
+    os.replace(temp_path, path)
+
+def main(argv=None):
+    """Command line entry point for inspecting and editing the packed word file."""
+    parser = argparse.ArgumentParser(description="Inspect or edit the packed arcade word lists.")
+    parser.add_argument("--file", default=WORD_FILE, help="word file (default: the arcade's)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="show every list and its word lengths")
+    export = commands.add_parser("export", help="print a list, one word per line")
+    export.add_argument("name")
+    add = commands.add_parser("add", help="add or replace a list from a text file")
+    add.add_argument("name")
+    add.add_argument("source", help="text file with one word per line")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name in list_names(args.file):
+            words = load_words(name, args.file)
+            sizes = ", ".join(f"{length}: {len(words.words(length))}" for length in words.lengths())
+            print(f"{name}: {len(words)} words ({sizes})")
+    elif args.command == "export":
+        for word in load_words(args.name, args.file):
+            print(word)
+    else:
+        lists = {name: list(load_words(name, args.file)) for name in list_names(args.file)} if os.path.exists(args.file) else {}
+        with open(args.source) as file:
+            lists[args.name] = file.read().split()
+        pack_words(lists, args.file)
+        print(f"Packed {len(lists)} lists into {args.file}")
+
+if __name__ == "__main__":
+    main()
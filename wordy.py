@@ -1,9 +1,6 @@
 # CtrlUno Arcade - Wordy Game
 # Word-guessing game with multiple difficulty levels and strategic feedback
 
-# Import random library for word selection
-import random
-
 # Import turtle for graphical text input
 import turtle
 
@@ -14,19 +11,21 @@ import help_menu
 # Import turtle graphics helper for message display
 from gui import show_help_message
 
+# Import word lists, word index and packed word storage for picking words and checking guesses
+from wordy_words import WORD_LISTS, DIFFICULTY_LENGTHS, MAX_GUESSES, RATING_BANDS, word_index
+from word_store import load_words
+
 #------------------------------------------------------
 # WORD LISTS - WORDY GAME
-# Three difficulty levels with carefully curated word lists
+# Three difficulty levels, packed in arcade_words.dat (see word_store.py)
+# and only loaded when Wordy first needs them (see wordy_words.word_index)
 #------------------------------------------------------
 
-# Easy difficulty: 4-letter words for beginners
-WORDY_EASY = ["able", "acid", "aged", "also", "area", "army", "away", "baby", "back", "ball", "band", "bank", "base", "bath", "bear", "beat", "been", "beer", "bell", "belt", "best", "bike", "bill", "bird", "blow", "blue", "boat", "body", "bone", "book", "born", "both", "boys", "busy", "call", "calm", "came", "camp", "card", "care", "cars", "case", "cash", "cast", "cats", "cell", "chat", "chip", "city", "club", "coal", "coat", "code", "cold", "come", "cook", "cool", "copy", "corn", "cost", "crew", "crop", "dark", "data", "date", "days", "dead", "deal", "dear", "deep", "desk", "diet", "dirt", "dish", "does", "done", "door", "down", "draw", "drew", "drop", "drug", "dual", "duck", "dust", "duty", "each", "earn", "east", "easy", "edge", "eggs", "else", "even", "ever", "evil", "exit", "eyes", "face", "fact", "fail", "fair", "fall", "fans", "farm", "fast", "fate", "fear", "feed", "feel", "feet", "fell", "felt", "file", "fill", "film", "find", "fine", "fire", "firm", "fish", "fist", "fits", "five", "flag", "flat", "flew", "flow", "folk", "food", "foot", "ford", "fork", "form", "fort", "four", "free", "from", "fuel", "full", "fund", "gain", "game", "gate", "gave", "gear", "gets", "gift", "girl", "give", "glad", "goal", "goes", "gold", "golf", "gone", "good", "grab", "grew", "grey", "grow", "guys", "hair", "half", "hall", "hand", "hang", "hard", "hate", "have", "head", "hear", "heat", "held", "help", "here", "hide", "high", "hill", "hint", "hire", "hits", "hold", "hole", "home", "hope", "host", "hour", "huge", "hung", "hunt", "hurt", "idea", "inch", "into", "iron", "item", "jail", "jane", "jazz", "join", "joke", "jump", "june", "jury", "just", "keep", "kept", "keys", "kick", "kids", "kill", "kind", "king", "knee", "knew", "know", "lack", "lady", "laid", "lake", "land", "lane", "last", "late", "lead", "left", "legs", "less", "lets", "life", "lift", "like", "line", "link", "list", "live", "load", "loan", "lock", "long", "look", "lord", "lose", "loss", "lost", "lots", "loud", "love", "luck", "made", "mail", "main", "make", "male", "mall", "many", "mark", "mass", "math", "meal", "mean", "meat", "meet", "melt", "menu", "mess", "mice", "mile", "milk", "mind", "mine", "miss", "mode", "mood", "moon", "more", "most", "move", "much", "must", "name", "navy", "near", "neck", "need", "news", "next", "nice", "nine", "none", "noon", "nose", "note", "nuts", "okay", "once", "only", "open", "oral", "over", "pace", "pack", "page", "paid", "pain", "pair", "palm", "park", "part", "pass", "past", "path", "peak", "pick", "pics", "pile", "pink", "pipe", "plan", "play", "plot", "plus", "poem", "pole", "poll", "pool", "poor", "pope", "port", "post", "pull", "pure", "push", "puts", "race", "rain", "rank", "rate", "read", "real", "rear", "rely", "rent", "rest", "rice", "rich", "ride", "ring", "rise", "risk", "road", "rock", "role", "roll", "roof", "room", "root", "rope", "rose", "rule", "runs", "safe", "said", "sail", "sale", "salt", "same", "sand", "save", "says", "seal", "seat", "seed", "seek", "seem", "seen", "self", "sell", "send", "sent", "ship", "shoe", "shop", "shot", "show", "shut", "sick", "side", "sign", "silk", "sing", "sink", "site", "size", "skin", "skip", "slip", "slow", "snap", "snow", "soap", "soft", "soil", "sold", "sole", "some", "song", "soon", "sort", "soul", "soup", "spot", "star", "stay", "step", "stir", "stop", "such", "suit", "sure", "swim", "take", "tale", "talk", "tall", "tank", "tape", "task", "team", "tell", "tend", "tent", "term", "test", "text", "than", "that", "them", "then", "they", "thin", "this", "thus", "tide", "tied", "ties", "time", "tiny", "tips", "tire", "told", "tone", "took", "tool", "tops", "torn", "tour", "town", "toys", "tree", "trim", "trip", "true", "tune", "turn", "twin", "type", "unit", "used", "user", "uses", "vary", "vast", "very", "view", "vote", "wait", "wake", "walk", "wall", "want", "warm", "warn", "wash", "wave", "ways", "weak", "wear", "week", "well", "went", "were", "west", "what", "when", "wide", "wife", "wild", "will", "wind", "wine", "wing", "wire", "wise", "wish", "with", "wood", "wool", "word", "wore", "work", "worn", "yard", "year", "your", "zero", "zone"]
-
-# Medium difficulty: 5-letter words for intermediate players
-WORDY_MEDIUM = ["about", "above", "abuse", "actor", "acute", "admit", "adopt", "adult", "after", "again", "agent", "agree", "ahead", "alarm", "album", "alert", "alien", "align", "alike", "alive", "allow", "alone", "along", "alter", "among", "anger", "angle", "angry", "apart", "apple", "apply", "arena", "argue", "arise", "array", "arrow", "aside", "asset", "avoid", "awake", "award", "aware", "badly", "baker", "bases", "basic", "beach", "began", "begin", "being", "below", "bench", "billy", "birth", "black", "blame", "blind", "block", "blood", "bloom", "blown", "blues", "blunt", "blush", "board", "boast", "bonds", "boost", "booth", "bound", "brain", "brand", "brass", "brave", "bread", "break", "breed", "brief", "bring", "broad", "broke", "brown", "brush", "build", "built", "burst", "buyer", "cable", "calif", "carry", "catch", "cause", "chain", "chair", "chaos", "charm", "chart", "chase", "cheap", "check", "chest", "chief", "child", "china", "chose", "civil", "claim", "class", "clean", "clear", "click", "climb", "clock", "close", "cloud", "clown", "clubs", "coach", "coast", "could", "count", "court", "cover", "craft", "crash", "crazy", "cream", "crime", "cross", "crowd", "crown", "crude", "curve", "cycle", "daily", "dance", "dated", "dealt", "death", "debut", "delay", "depth", "doing", "doubt", "dozen", "draft", "drama", "drank", "dream", "dress", "drill", "drink", "drive", "drove", "dying", "eager", "early", "earth", "eight", "elite", "empty", "enemy", "enjoy", "enter", "entry", "equal", "error", "event", "every", "exact", "exist", "extra", "faith", "false", "fault", "fiber", "field", "fifth", "fifty", "fight", "final", "first", "fixed", "flash", "fleet", "floor", "fluid", "focus", "force", "forth", "forty", "forum", "found", "frame", "frank", "fraud", "fresh", "front", "fruit", "fully", "funny", "giant", "given", "glass", "globe", "going", "grace", "grade", "grand", "grant", "grass", "grave", "great", "green", "gross", "group", "grown", "guard", "guess", "guest", "guide", "happy", "harry", "heart", "heavy", "hence", "henry", "horse", "hotel", "house", "human", "hurry", "image", "index", "inner", "input", "issue", "japan", "jimmy", "joint", "jones", "judge", "known", "label", "large", "laser", "later", "laugh", "layer", "learn", "lease", "least", "leave", "legal", "level", "lewis", "light", "limit", "links", "lives", "local", "loose", "lower", "lucky", "lunch", "lying", "magic", "major", "maker", "march", "maria", "match", "maybe", "mayor", "meant", "media", "metal", "might", "minor", "minus", "mixed", "model", "money", "month", "moral", "motor", "mount", "mouse", "mouth", "moved", "movie", "music", "needs", "never", "newly", "night", "noise", "north", "noted", "novel", "nurse", "occur", "ocean", "offer", "often", "order", "other", "ought", "paint", "panel", "paper", "party", "peace", "peter", "phase", "phone", "photo", "piano", "picked", "piece", "pilot", "pitch", "place", "plain", "plane", "plant", "plate", "plays", "plaza", "point", "pound", "power", "press", "price", "pride", "prime", "print", "prior", "prize", "proof", "proud", "prove", "queen", "quick", "quiet", "quite", "radio", "raise", "range", "rapid", "ratio", "reach", "ready", "realm", "rebel", "refer", "relax", "repay", "reply", "right", "rigid", "risky", "river", "robin", "roger", "roman", "rough", "round", "route", "royal", "rural", "salad", "sales", "sat", "sauce", "scale", "scare", "scene", "scope", "score", "sense", "serve", "seven", "shall", "shape", "share", "sharp", "sheet", "shelf", "shell", "shift", "shine", "shirt", "shock", "shoot", "short", "shown", "sides", "sight", "simon", "since", "sixth", "sixty", "sized", "skill", "sleep", "slide", "small", "smart", "smile", "smith", "smoke", "snake", "snow", "soapy", "social", "solar", "solid", "solve", "sorry", "sound", "south", "space", "spare", "speak", "speed", "spend", "spent", "split", "spoke", "sport", "staff", "stage", "stake", "stand", "start", "state", "stays", "steal", "steam", "steel", "steep", "steer", "stern", "stick", "still", "stock", "stone", "stood", "store", "storm", "story", "strip", "stuck", "study", "stuff", "style", "sugar", "suite", "super", "sweet", "swift", "swing", "swiss", "table", "taken", "taste", "taxes", "teach", "terms", "texas", "thank", "theft", "their", "theme", "there", "these", "thick", "thing", "think", "third", "those", "three", "threw", "throw", "thumb", "tiger", "tight", "timer", "title", "today", "topic", "total", "touch", "tough", "tower", "track", "trade", "train", "trait", "treat", "trend", "trial", "tribe", "trick", "tried", "tries", "truck", "truly", "trust", "truth", "twice", "twist", "tyler", "uncle", "under", "undue", "union", "unity", "until", "upper", "upset", "urban", "usage", "usual", "valid", "value", "video", "virus", "visit", "vital", "vocal", "voice", "waste", "watch", "water", "wave", "ways", "wealth", "weary", "weigh", "weird", "wheel", "where", "which", "while", "white", "whole", "whose", "wiped", "wired", "woman", "world", "worry", "worse", "worst", "worth", "would", "write", "wrong", "wrote", "young", "yours", "youth", "zones"]
-
-# Hard difficulty: 8-letter words for advanced players
-WORDY_HARD = ["absolute", "abstract", "academic", "accepted", "accident", "accuracy", "accurate", "achieved", "acquired", "activity", "actually", "addition", "adequate", "adjacent", "adjusted", "advanced", "advisory", "advocate", "affected", "aircraft", "although", "analysis", "annually", "answered", "anywhere", "apparent", "appeared", "approach", "approval", "approved", "argument", "arranged", "ArticleS", "assemble", "assembly", "assessed", "assigned", "assisted", "assuming", "attached", "attacked", "attempts", "attended", "attorney", "audience", "authored", "automate", "autonomy", "bathroom", "becoming", "behavior", "believed", "benefits", "birthday", "boundary", "breakfast", "bringing", "brothers", "building", "business", "calendar", "campaign", "capacity", "category", "chairman", "champion", "chapters", "chemical", "children", "choosing", "churches", "circular", "citation", "citizens", "civilian", "claiming", "cleaning", "clearing", "climbing", "clinical", "clothing", "coaching", "cocktail", "collapse", "collected", "colonial", "colorful", "combines", "commands", "commerce", "commonly", "communicate", "compared", "compiler", "complete", "composed", "compound", "computed", "computer", "concepts", "concrete", "confused", "congress", "connects", "consider", "consists", "constant", "contains", "contests", "contexts", "continue", "contract", "contrast", "controls", "convince", "creating", "creative", "criminal", "crossing", "crushing", "cultural", "customer", "database", "deadline", "deciding", "decision", "declared", "decrease", "delivery", "demands", "democrat", "depends", "describe", "designed", "designer", "detailed", "detected", "develop", "dialogue", "diamond", "differed", "digital", "directly", "director", "disabled", "disaster", "discount", "discover", "disguise", "disorder", "disposed", "distance", "distinct", "district", "dividend", "division", "document", "domestic", "dominant", "downtown", "dramatic", "drawings", "dropdown", "duration", "dynamics", "economic", "educated", "election", "electric", "eligible", "employee", "employer", "enabling", "encoding", "endorsed", "engaging", "engineer", "enhanced", "enormous", "entering", "entirely", "entitled", "envelope", "equality", "equation", "equipped", "estimate", "evaluate", "eventual", "everyone", "evidence", "exampled", "exchange", "exciting", "executed", "exercise", "existing", "expected", "expertise", "explains", "explored", "extended", "external", "facebook", "facility", "familiar", "families", "featured", "features", "feedback", "feelings", "festival", "filename", "filtered", "finished", "floating", "followed", "football", "forecast", "foreign", "formally", "formerly", "formulae", "fraction", "frequent", "friendly", "function", "funding", "gathered", "generate", "genetics", "geometry", "goldfish", "graduate", "graphics", "greatest", "handbook", "handling", "hardware", "headline", "heritage", "highway", "historic", "holidays", "hometown", "hospital", "hundreds", "husband", "identify", "identity", "illusion", "imagined", "immature", "imperial", "implicit", "imported", "improved", "incident", "includes", "increase", "indicate", "indirect", "industry", "infected", "infinite", "informed", "initiate", "injured", "innocent", "inserted", "inspired", "instance", "instinct", "intended", "interact", "interest", "internal", "internet", "interval", "intimate", "involved", "isolated", "keyboard", "knowledge", "language", "launched", "learning", "lectures", "leverage", "lifetime", "likewise", "limiting", "listened", "literacy", "literary", "location", "machines", "magnetic", "maintain", "majority", "managing", "marriage", "material", "meanings", "measured", "mechanic", "medicine", "meetings", "membrane", "memorial", "mentions", "merchant", "midnight", "military", "minimize", "ministry", "minority", "missiles", "missions", "mistakes", "modeling", "moderate", "modified", "molecule", "momentum", "monitors", "mortgage", "motivated", "mountain", "movement", "multiple", "national", "negative", "networks", "normally", "notebook", "noticein", "november", "numbered", "numerous", "observed", "obtained", "occasion", "occupied", "occurred", "offering", "official", "offshore", "operates", "operator", "opinions", "opponent", "optional", "ordinary", "organize", "oriental", "original", "outdated", "outlined", "outright", "overcome", "overhead", "overseas", "overview", "packages", "painting", "paradise", "parallel", "parental", "partners", "passport", "password", "patience", "patterns", "payments", "peaceful", "performs", "personal", "persuade", "petition", "physical", "pictures", "planning", "platform", "pleasure", "policies", "politics", "popular", "portrait", "position", "positive", "possible", "possibly", "practice", "precious", "prepared", "presence", "preserve", "pressure", "previous", "princess", "priority", "prisoner", "probably", "problems", "proceed", "products", "progress", "projects", "promises", "property", "proposal", "proposed", "prospect", "protocol", "provided", "provider", "province", "publicly", "purchase", "purposes", "pursuant", "quantity", "question", "quotient", "reaction", "readings", "realized", "reasoned", "received", "recently", "recorded", "recovery", "redirect", "reducing", "referred", "reflects", "regarded", "regional", "register", "regulate", "rejected", "relation", "relative", "released", "relevant", "reliable", "remained", "removing", "repeated", "replaced", "reported", "republic", "required", "research", "reserved", "resident", "resolved", "resource", "response", "resulted", "returned", "revealed", "reversed", "reviewed", "revision", "rewards", "sandwich", "schedule", "sciences", "security", "selected", "semester", "sequence", "services", "sessions", "settings", "shoulder", "siblings", "silently", "simulate", "situated", "slightly", "software", "solution", "somebody", "somewhat", "southern", "speaking", "specific", "specimen", "spelling", "spending", "sponsors", "standard", "standing", "stations", "sterling", "straight", "strategy", "strength", "striking", "strongly", "struggle", "students", "subjects", "subtitle", "suitable", "summoned", "supplies", "supposed", "supports", "surprise", "survived", "swimming", "symbolic", "symphony", "symptoms", "syndrome", "teachers", "teaching", "teamwork", "technics", "terminal", "textbook", "theories", "thinking", "thoughts", "thousand", "threatens", "thursday", "together", "tomorrow", "tracking", "training", "transfer", "traveled", "treasure", "triangle", "tropical", "troubled", "tumbling", "tutorial", "umbrella", "unbiased", "uncommon", "undefied", "underway", "unfunny", "universe", "unlikely", "unnotice", "unsigned", "username", "vacation", "validate", "variable", "vehicles", "verified", "versions", "vertical", "vicinity", "violence", "virginia", "visiting", "warranty", "watching", "weakness", "whatever", "wildlife", "withdraw", "wondered", "workflow", "workload", "workshop", "wrapping", "yourself"]
+def __getattr__(name):
+    """Keeps WORDY_EASY, WORDY_MEDIUM and WORDY_HARD importable; each loads its packed list on use."""
+    if name.startswith("WORDY_") and name[6:].lower() in WORD_LISTS:
+        return load_words(WORD_LISTS[name[6:].lower()])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 #------------------------------------------------------
 # GLOBAL VARIABLES - WORDY GAME
@@ -40,152 +39,231 @@ t = True                 # General-purpose boolean flag for loop control
 cor_let_wrong_spot = []  # Letters that exist in word but are in wrong positions
 attempts = 0             # Current number of guess attempts made by player
 guess = []               # Player's current guess split into characters
-words = []               # Active word list based on selected difficulty level
+difficulty = "medium"    # Active difficulty level ("easy", "medium", or "hard")
+hint_engine = None       # Words still possible in the current game, used for hints
+hard_mode = False        # Every guess must fit all feedback so far
+candidates = None        # Hard mode: bitset of the words that still fit the feedback
+word_band = None         # Measured difficulty band ("easier", "average", "harder") or None for any word
 word_length = 5          # Length of words for current difficulty (4, 5, or 8)
 
+# Multi-board mode: guesses allowed for each number of boards
+BOARD_GUESSES = {2: 7, 4: 9, 8: 13}
+
 # Turtle graphics constants
 SQUARE_SIZE = 70           # Size of each letter square in pixels
+MULTI_AREA = (1200, 640)   # Width and height available to the boards in multi-board mode
 GRID_COLOR = "black"       # Color of grid lines
 BACKGROUND_COLOR = "white" # Background color of game window
 
 #------------------------------------------------------
-# WORDY GAME FUNCTIONS
-# Word-guessing game with multiple difficulty levels and strategic feedback
+# WORDY GRID - Tile-stamped grid
+# Empty tiles are stamped once; a guess restamps only its own row
 #------------------------------------------------------
 
-def draw_grid(rows, cols, square_size=70):
+tile_shapes = {}  # Square size -> registered tile shape name
+
+def tile_shape(square_size):
     """
-    Draws the Wordy game grid with title.
+    Returns the name of the square tile shape for a size, registering it on first use.
     
     Args:
-        rows (int): Number of rows (attempts allowed)
-        cols (int): Number of columns (word length)
-        square_size (int): Size of each square in pixels
+        square_size (int): Side of the tile in pixels
     """
-    turtle.clearscreen()
-    turtle.bgcolor(BACKGROUND_COLOR)
-    
-    grid_turtle = turtle.Turtle()
-    grid_turtle.hideturtle()
-    grid_turtle.speed(0)
-    grid_turtle.pensize(3)
-    grid_turtle.color(GRID_COLOR)
-    
-    # Draw title above the grid
-    grid_turtle.penup()
-    grid_turtle.goto(0, rows * square_size / 2 + 20)
-    grid_turtle.write("Wordy", align="center", font=("Verdana", 40, "bold"))
-    
-    # Draw each square
-    start_x = -cols * square_size / 2
-    start_y = rows * square_size / 2
-
-    for row in range(rows):
-        for col in range(cols):
-            x = start_x + col * square_size
-            y = start_y - row * square_size
-            grid_turtle.penup()
-            grid_turtle.goto(x, y)
-            grid_turtle.pendown()
-            for _ in range(4):
-                grid_turtle.forward(square_size)
-                grid_turtle.right(90)
-    
-    turtle.update()
+    if square_size not in tile_shapes:
+        half = square_size / 2
+        tile_shapes[square_size] = f"wordy_tile_{square_size}"
+        turtle.register_shape(tile_shapes[square_size], ((-half, -half), (-half, half), (half, half), (half, -half)))
+    return tile_shapes[square_size]
 
-def color_square(turtle_obj, row, col, color, rows, cols):
+def new_pen():
+    """Creates a hidden, pen-up turtle for one part of the grid."""
+    pen = turtle.Turtle()
+    pen.hideturtle()
+    pen.speed(0)
+    pen.penup()
+    return pen
+
+class WordyGrid:
     """
-    Fills a square with the specified color (green/yellow/grey).
+    Retained-mode Wordy grid.
     
-    Args:
-        turtle_obj: Turtle object to use for drawing
-        row (int): Row index of the square
-        col (int): Column index of the square
-        color (str): Color to fill the square
-        rows (int): Total number of rows in grid
-        cols (int): Total number of columns in grid
-    """
-    start_x = -cols * SQUARE_SIZE / 2
-    start_y = rows * SQUARE_SIZE / 2
-    x = start_x + col * SQUARE_SIZE
-    y = start_y - row * SQUARE_SIZE
-    
-    turtle_obj.penup()
-    turtle_obj.goto(x, y)
-    turtle_obj.pendown()
-    turtle_obj.fillcolor(color)
-    turtle_obj.begin_fill()
-    for _ in range(4):
-        turtle_obj.forward(SQUARE_SIZE)
-        turtle_obj.right(90)
-    turtle_obj.end_fill()
-
-def write_letter(turtle_obj, letter, row, col, rows, cols):
+    build() writes the title and stamps every empty tile once. After that,
+    set_row() replaces only the stamps of one guessed row and rewrites its
+    letters, and show_message() writes input errors in an overlay under the
+    grid, so invalid input costs one small redraw instead of a clearscreen.
     """
-    Writes a letter in the center of a square.
     
-    Args:
-        turtle_obj: Turtle object to use for writing
-        letter (str): Letter to write
-        row (int): Row index of the square
-        col (int): Column index of the square
-        rows (int): Total number of rows in grid
-        cols (int): Total number of columns in grid
-    """
-    start_x = -cols * SQUARE_SIZE / 2
-    start_y = rows * SQUARE_SIZE / 2
-    x = start_x + col * SQUARE_SIZE + SQUARE_SIZE / 2
-    y = start_y - row * SQUARE_SIZE - SQUARE_SIZE * 0.75
-    
-    turtle_obj.penup()
-    turtle_obj.goto(x, y)
-    turtle_obj.pendown()
-    turtle_obj.color("black")
-    turtle_obj.write(letter.upper(), align="center", font=("Arial", 32, "bold"))
-
-def pick_word(difficulty, word_length):
+    def __init__(self, rows, cols, square_size=SQUARE_SIZE, center_x=0, center_y=0, title="Wordy"):
+        """
+        Args:
+            rows (int): Number of rows (attempts allowed)
+            cols (int): Number of columns (word length)
+            square_size (int): Size of each square in pixels
+            center_x (int): X coordinate of the grid center
+            center_y (int): Y coordinate of the grid center
+            title (str): Text above the grid (None for no title)
+        """
+        self.rows = rows
+        self.cols = cols
+        self.square_size = square_size
+        self.center_x = center_x
+        self.center_y = center_y
+        self.title = title
+        self.stamps = []  # Stamp id of every tile, [row][col]
+        self.row_pens = []  # One turtle per row for its letters
+        self.tile_pen = None
+        self.message_pen = None
+    
+    def tile_center(self, row, col):
+        """Returns the (x, y) screen position of a tile's center."""
+        x = self.center_x + (col - self.cols / 2 + 0.5) * self.square_size
+        y = self.center_y + (self.rows / 2 - row - 0.5) * self.square_size
+        return x, y
+    
+    def build(self, clear=True):
+        """
+        Draws the title and the empty tiles.
+        
+        Args:
+            clear (bool): Clear the screen first (False to add a grid beside another one)
+        """
+        if clear:
+            turtle.clearscreen()
+            turtle.bgcolor(BACKGROUND_COLOR)
+            turtle.tracer(0)
+        if self.title:
+            title_pen = new_pen()
+            title_pen.color(GRID_COLOR)
+            title_pen.goto(self.center_x, self.center_y + self.rows * self.square_size / 2 + 20)
+            title_pen.write(self.title, align="center", font=("Verdana", 40, "bold"))
+        
+        self.tile_pen = new_pen()
+        self.tile_pen.shape(tile_shape(self.square_size))
+        self.tile_pen.shapesize(outline=3)
+        self.tile_pen.pencolor(GRID_COLOR)
+        self.stamps = [[self.stamp_tile(row, col, BACKGROUND_COLOR) for col in range(self.cols)]
+                       for row in range(self.rows)]
+        self.row_pens = [new_pen() for _ in range(self.rows)]
+        self.message_pen = new_pen()
+        turtle.update()
+    
+    def stamp_tile(self, row, col, color):
+        """Stamps one tile in a fill color and returns the stamp id."""
+        self.tile_pen.goto(self.tile_center(row, col))
+        self.tile_pen.fillcolor(color)
+        return self.tile_pen.stamp()
+    
+    def set_row(self, row, letters, colors):
+        """
+        Shows a scored guess: restamps the row's tiles in their colors and writes the letters.
+        
+        Args:
+            row (int): Row index of the guess
+            letters (str): Guessed word
+            colors (list): Fill color of each tile
+        """
+        for col, color in enumerate(colors):
+            self.tile_pen.clearstamp(self.stamps[row][col])
+            self.stamps[row][col] = self.stamp_tile(row, col, color)
+        pen = self.row_pens[row]
+        pen.clear()
+        pen.color("black")
+        font_size = max(8, round(32 * self.square_size / SQUARE_SIZE))  # Letters shrink with smaller tiles
+        for col, letter in enumerate(letters):
+            x, y = self.tile_center(row, col)
+            pen.goto(x, y - self.square_size / 4)
+            pen.write(letter.upper(), align="center", font=("Arial", font_size, "bold"))
+        turtle.update()
+    
+    def show_message(self, text=None):
+        """Writes a message under the grid, replacing the last one (None just clears it)."""
+        self.message_pen.clear()
+        if text:
+            self.message_pen.color("red")
+            self.message_pen.goto(self.center_x, self.center_y - self.rows * self.square_size / 2 - 40)
+            self.message_pen.write(text, align="center", font=("Arial", 16, "bold"))
+        turtle.update()
+
+#------------------------------------------------------
+# WORDY GAME FUNCTIONS
+# Word-guessing game with multiple difficulty levels and strategic feedback
+#------------------------------------------------------
+
+def pick_word(difficulty, word_length, band=None):
     """
-    Selects a random word from the appropriate difficulty pool matching the requested length.
+    Selects the next word from the difficulty pool matching the requested length.
+    Words rotate in a shuffled order, so none repeats until the whole bucket
+    has been played this session.
     
     Args:
         difficulty (str): Difficulty level ("easy", "medium", or "hard")
         word_length (int): Required length of word (4, 5, or 8)
+        band (str): "easier", "average" or "harder" to pick by measured difficulty
+                    (wordy_ratings.json from wordy_rating.py) instead of rotating
     
     Returns:
-        str: Randomly selected word from appropriate pool
+        str: Selected word from appropriate pool
     """
-    if difficulty == "easy":
-        pool = WORDY_EASY
-    elif difficulty == "medium":
-        pool = WORDY_MEDIUM
-    else:
-        pool = WORDY_HARD
-    
-    # Prefer words matching the requested length
-    candidates = [w for w in pool if len(w) == word_length]
-    if candidates:
-        return random.choice(candidates)
-    # Fallback if no exact-length word exists in pool
-    return random.choice(pool)
+    # Fallback to the pool's most common length if no exact-length word exists
+    index = word_index()
+    if not index.words(difficulty, word_length):
+        word_length = index.lengths(difficulty)[0]
+    if band is not None:
+        return index.rated_sample(difficulty, word_length, band)
+    return index.next_word(difficulty, word_length)
 
 def gen_word():
     """
-    Randomly selects a target word from the current difficulty's word list.
+    Selects a target word for the current difficulty and word length.
     Converts the selected word into a list of individual characters for processing.
     
     Global Variables Modified:
-        cor_word: Set to list of characters from randomly selected word
+        cor_word: Set to list of characters from selected word
     """
     global cor_word
-    cor_word = random.choice(words)
-    cor_word = list(cor_word)
+    cor_word = list(pick_word(difficulty, word_length, word_band))
+
+def draw_hint_panel(panel, rows, cols, suggestion=None):
+    """
+    Writes the live count of possible words (and the latest hint) beside the grid.
+    
+    Args:
+        panel: Turtle object used only for the panel
+        rows (int): Total number of rows in grid
+        cols (int): Total number of columns in grid
+        suggestion (str): Hint text to show under the count
+    """
+    x = cols * SQUARE_SIZE / 2 + 30
+    y = rows * SQUARE_SIZE / 2 - 30
+    panel.clear()
+    panel.penup()
+    panel.color("black")
+    panel.goto(x, y)
+    count = len(hint_engine) if candidates is None else candidates.count()
+    panel.write(f"Possible words: {count}", align="left", font=("Arial", 16, "bold"))
+    if candidates is not None:
+        y -= 30
+        panel.goto(x, y)
+        panel.write("Hard mode", align="left", font=("Arial", 14, "italic"))
+    if suggestion:
+        panel.goto(x, y - 30)
+        panel.write(suggestion, align="left", font=("Arial", 14, "normal"))
+    turtle.update()
 
 def give_hint():
     """
-    Placeholder function for future hint system implementation.
-    Could provide clues like word category, synonym, or letter frequency.
+    Suggests the guess that narrows down the possible words the most.
+    
+    Returns:
+        str: Hint text for the panel
     """
-    pass
+    # In hard mode only guesses the player is allowed to make are suggested
+    word, bits = hint_engine.best_guess(None if candidates is None else candidates.allows)
+    if word is None:
+        return "No word fits the feedback so far."
+    if len(hint_engine) == 1:
+        return f"It must be {word.upper()}!"
+    return f"Hint: try {word.upper()}"
 
 def wordy_main():
     """
@@ -208,7 +286,12 @@ def wordy_main():
     Global Variables Modified:
         Multiple Wordy game state variables reset for new game
     """
-    global hint, cor_word, score, t, cor_let_wrong_spot, attempts, words, word_length, guess
+    global hint, cor_word, score, t, cor_let_wrong_spot, attempts, word_length, guess, hint_engine, candidates
+    
+    # Scoring and hints load with the first game, so starting the arcade never pulls in NumPy
+    from wordy_feedback import score_guess, PATTERN_COLORS
+    from wordy_hints import HintEngine
+    from wordy_candidates import CandidateSet
     
     attempts = 0
     gen_word()
@@ -216,90 +299,52 @@ def wordy_main():
     hint = ["_"] * len(cor_word)
     
     # Set up grid dimensions
-    ROWS = 6  # Number of attempts allowed
+    ROWS = MAX_GUESSES  # Number of attempts allowed
     COLS = word_length  # Number of letters in word
     
-    # Draw the initial grid
-    draw_grid(ROWS, COLS)
+    # Draw the initial grid (empty tiles are stamped once)
+    grid = WordyGrid(ROWS, COLS)
+    grid.build()
     
-    # Create turtle for drawing colors and letters
-    drawer = turtle.Turtle()
-    drawer.hideturtle()
-    drawer.speed(0)
-    drawer.pensize(3)
+    # Track the words still possible for the live count and hints
+    index = word_index()
+    hint_engine = HintEngine.for_words(index.words(difficulty, word_length), index.valid[word_length])
+    # Hard mode narrows a bitset of the valid guesses with every piece of feedback
+    candidates = CandidateSet.for_words(index.words(difficulty, word_length), index.valid[word_length]) if hard_mode else None
+    panel = new_pen()
+    draw_hint_panel(panel, ROWS, COLS)
     
     word_letters = list(cor_word)
     current_row = 0
     
-    while attempts < 6:
+    while attempts < MAX_GUESSES:
         # Get player guess
         while True:
-            guess_input = turtle.textinput("Wordy", f"Attempt {attempts + 1}: Enter a {word_length}-letter word:")
+            guess_input = turtle.textinput("Wordy", f"Attempt {attempts + 1}: Enter a {word_length}-letter word (? for a hint):")
             if guess_input is None:
-                show_help_message("No Input", "No input provided. Please try again.", wait_for_ok=False)
-                continue
-            guess = guess_input.lower()
-            if len(guess) != word_length:
-                show_help_message("Invalid Length", f"Please enter exactly {word_length} letters.", wait_for_ok=False)
-                # Redraw grid after message
-                draw_grid(ROWS, COLS)
-                # Redraw previous attempts
-                for r in range(current_row):
-                    for c in range(COLS):
-                        if hint[r * COLS + c] != "_":
-                            write_letter(drawer, hint[r * COLS + c], r, c, ROWS, COLS)
+                grid.show_message("No input provided. Please try again.")
                 continue
-            if not guess.isalpha():
-                show_help_message("Invalid Input", "Please use only alphabetic characters.", wait_for_ok=False)
-                # Redraw grid after message
-                draw_grid(ROWS, COLS)
-                # Redraw previous attempts
-                for r in range(current_row):
-                    for c in range(COLS):
-                        if hint[r * COLS + c] != "_":
-                            write_letter(drawer, hint[r * COLS + c], r, c, ROWS, COLS)
+            guess = guess_input.lower().strip()
+            if guess == "?":
+                draw_hint_panel(panel, ROWS, COLS, give_hint())
                 continue
-            break
-        
-        guess_letters = list(guess)
-        
-        # Count letters in the correct word
-        word_letter_count = {}
-        for letter in word_letters:
-            word_letter_count[letter] = word_letter_count.get(letter, 0) + 1
-        
-        # Create copy to track remaining available letters
-        available_letters = word_letter_count.copy()
+            error = check_guess(guess, index)
+            if error is None and candidates is not None and not candidates.allows(guess):
+                error = "Hard mode: " + candidates.reason(guess)
+            # Errors go in the overlay under the grid; the tiles stay as they are
+            grid.show_message(error)
+            if error is None:
+                break
         
-        # Track which positions are colored
-        colored = [None] * COLS
+        # Score the guess (green/yellow/grey per letter) and color only this row's tiles
+        pattern = score_guess(guess, "".join(word_letters))
+        grid.set_row(current_row, guess, [PATTERN_COLORS[code] for code in pattern])
         
-        # First pass: Mark exact matches (green)
-        for i in range(COLS):
-            if guess_letters[i] == word_letters[i]:
-                color_square(drawer, current_row, i, "green", ROWS, COLS)
-                write_letter(drawer, guess_letters[i], current_row, i, ROWS, COLS)
-                colored[i] = "green"
-                available_letters[guess_letters[i]] -= 1
-        
-        # Second pass: Mark letters that exist elsewhere (yellow), else grey
-        for i in range(COLS):
-            if colored[i] is not None:
-                continue
-            letter = guess_letters[i]
-            found = False
-            if letter in available_letters and available_letters[letter] > 0:
-                found = True
-                available_letters[letter] -= 1
-            
-            if found:
-                color_square(drawer, current_row, i, "yellow", ROWS, COLS)
-                write_letter(drawer, letter, current_row, i, ROWS, COLS)
-                colored[i] = "yellow"
-            else:
-                color_square(drawer, current_row, i, "light grey", ROWS, COLS)
-                write_letter(drawer, letter, current_row, i, ROWS, COLS)
-                colored[i] = "grey"
+        # Narrow down the possible words with this feedback
+        hint_engine.update(guess, pattern)
+        if candidates is not None:
+            candidates.update(guess, pattern)
+        draw_hint_panel(panel, ROWS, COLS)
         
         turtle.update()
         attempts += 1
@@ -311,10 +356,132 @@ def wordy_main():
             break
     
     # Check for lose
-    if attempts >= 6 and guess != "".join(word_letters):
+    if attempts >= MAX_GUESSES and guess != "".join(word_letters):
         show_help_message("YOU LOSE!", f"Sorry, you ran out of attempts.\nThe word was: {''.join(word_letters).upper()}", wait_for_ok=False)
     
-    # Play again prompt
+    play_again_prompt()
+
+def wordy_multi_main(boards):
+    """
+    Multi-board Wordy: every guess is played on 2, 4 or 8 boards, each hiding its own word.
+    Boards are drawn side by side; a solved board keeps its tiles and takes no more guesses.
+    
+    Args:
+        boards (int): Number of boards (a key of BOARD_GUESSES)
+    
+    Global Variables Modified:
+        attempts, guess, word_length: Game state for the current game
+    """
+    global attempts, guess, word_length
+    
+    # Scoring loads with the first game, like in wordy_main
+    from wordy_feedback import score_boards, PATTERN_COLORS
+    
+    # Pick a different word for every board
+    answers = []
+    while len(answers) < boards:
+        word = pick_word(difficulty, word_length, word_band)
+        if word not in answers:
+            answers.append(word)
+    word_length = len(answers[0])
+    rows = BOARD_GUESSES[boards]
+    index = word_index()
+    
+    # Draw every board once (empty tiles are stamped), then the title and status line
+    square_size, centers = board_layout(boards, rows, word_length)
+    turtle.Screen().setup(width=MULTI_AREA[0] + 100, height=MULTI_AREA[1] + 200)
+    grids = [WordyGrid(rows, word_length, square_size, x, y, title=None) for x, y in centers]
+    for number, grid in enumerate(grids):
+        grid.build(clear=number == 0)
+    title_pen = new_pen()
+    title_pen.goto(0, MULTI_AREA[1] / 2 + 20)
+    title_pen.write(f"Wordy x{boards}", align="center", font=("Verdana", 32, "bold"))
+    status_pen = new_pen()
+    
+    def show_status(text):
+        status_pen.clear()
+        status_pen.goto(0, -MULTI_AREA[1] / 2 - 40)
+        status_pen.color("red" if text.startswith("!") else "black")
+        status_pen.write(text.lstrip("!"), align="center", font=("Arial", 16, "bold"))
+        turtle.update()
+    
+    solved = [None] * boards  # Attempt that solved each board, None while unsolved
+    attempts = 0
+    show_status(f"Solved 0 of {boards} boards")
+    
+    while attempts < rows and None in solved:
+        # Get player guess
+        while True:
+            guess_input = turtle.textinput("Wordy", f"Attempt {attempts + 1} of {rows}: Enter a {word_length}-letter word:")
+            if guess_input is None:
+                show_status("!No input provided. Please try again.")
+                continue
+            guess = guess_input.lower().strip()
+            error = check_guess(guess, index)
+            if error is None:
+                break
+            show_status("!" + error)
+        
+        # Score the guess on every unsolved board in one batched call; only those rows change
+        open_boards = [board for board in range(boards) if solved[board] is None]
+        patterns = score_boards(guess, [answers[board] for board in open_boards])
+        for board, pattern in zip(open_boards, patterns):
+            grids[board].set_row(attempts, guess, [PATTERN_COLORS[code] for code in pattern])
+            if guess == answers[board]:
+                solved[board] = attempts + 1
+        attempts += 1
+        show_status(f"Solved {boards - solved.count(None)} of {boards} boards")
+    
+    if None not in solved:
+        show_help_message("YOU WIN!", f"Congratulations! You solved all {boards} boards in {attempts} attempts!", wait_for_ok=False)
+    else:
+        missed = ", ".join(answer.upper() for answer, solved_at in zip(answers, solved) if solved_at is None)
+        show_help_message("YOU LOSE!", f"Sorry, you ran out of attempts.\nUnsolved words: {missed}", wait_for_ok=False)
+    
+    play_again_prompt()
+
+def check_guess(guess, index):
+    """
+    Checks a guess before it is scored.
+    
+    Args:
+        guess (str): Lower-case guess
+        index (WordIndex): Word index holding the valid guesses
+    
+    Returns:
+        str: Error message, or None if the guess is a valid word of the current length
+    """
+    if len(guess) != word_length:
+        return f"Please enter exactly {word_length} letters."
+    if not guess.isalpha():
+        return "Please use only alphabetic characters."
+    if not index.is_valid(guess):
+        return f"{guess.upper()} is not in the word list."
+    return None
+
+def board_layout(boards, rows, cols):
+    """
+    Fits several boards into the multi-board area, at most 4 boards per line.
+    
+    Args:
+        boards (int): Number of boards
+        rows (int): Rows per board
+        cols (int): Columns per board
+    
+    Returns:
+        tuple: (square size, list of (x, y) board centers)
+    """
+    per_line = min(boards, 4)
+    lines = (boards + per_line - 1) // per_line
+    # One empty tile between neighboring boards
+    square_size = int(min(SQUARE_SIZE, MULTI_AREA[0] / (per_line * (cols + 1)), MULTI_AREA[1] / (lines * (rows + 1))))
+    width, height = (cols + 1) * square_size, (rows + 1) * square_size
+    centers = [((board % per_line - (per_line - 1) / 2) * width, ((lines - 1) / 2 - board // per_line) * height)
+               for board in range(boards)]
+    return square_size, centers
+
+def play_again_prompt():
+    """Asks whether to play again: back to the Wordy menu, or to the quit menu."""
     while True:
         play_again_input = turtle.textinput("Play Again?", "Would you like to play again? (y/n):")
         if play_again_input is None:
@@ -341,20 +508,22 @@ def wordy_menu():
     - Hard: 8-letter words for advanced players
     
     Navigation Options:
-    - Return to main menu, access help, or quit application
+    - Toggle hard mode, pick a word rating band, return to main menu, access help, or quit application
     
     Global Variables Modified:
-        words: Set to appropriate difficulty word list
+        difficulty: Set to selected difficulty level
         word_length: Set to match selected difficulty
+        hard_mode: Toggled by the hard mode option
+        word_band: Cycled by the word rating option
     """
-    global words, word_length
+    global difficulty, word_length, hard_mode, word_band
         
     while True:
-        menu_msg = """
+        menu_msg = f"""
 
         Welcome to Wordy!
 
-You have 6 tries to guess the correct word.
+You have {MAX_GUESSES} tries to guess the correct word.
 After each guess, you'll receive visual feedback:
 - GREEN: Letter in correct position
 - YELLOW: Letter in word but wrong position
@@ -365,40 +534,51 @@ Choose your difficulty to begin!
 1. Easy (4 letters)
 2. Medium (5 letters)
 3. Hard (8 letters)
-4. Main Menu
-5. Help
-6. Quit"""
+4. Multi-board (2, 4 or 8 words at once)
+5. Hard Mode: {"ON" if hard_mode else "OFF"} (every guess must fit the feedback so far)
+6. Word Rating: {(word_band or "any").upper()} (pick easier, average or harder words by solver rating)
+7. Main Menu
+8. Help
+9. Quit"""
 
         show_help_message("===== Wordy - Difficulty Selection =====", menu_msg, wait_for_ok=False)
 
-        difficulty_input = turtle.textinput("Wordy", "Enter your choice (1-6):")
+        difficulty_input = turtle.textinput("Wordy", "Enter your choice (1-9):")
         if difficulty_input is None:
             show_help_message("No Input", "No input provided. Please try again.", wait_for_ok=False)
             continue
-        difficulty = difficulty_input.lower()
+        choice = difficulty_input.lower()
 
-        if difficulty in ["easy", "1"]:
-            words = WORDY_EASY
-            word_length = 4
-            wordy_main()
-            return
-        elif difficulty in ["medium", "2"]:
-            words = WORDY_MEDIUM
-            word_length = 5
+        if choice in ["easy", "1", "medium", "2", "hard", "3"]:
+            difficulty = {"1": "easy", "2": "medium", "3": "hard"}.get(choice, choice)
+            word_length = DIFFICULTY_LENGTHS[difficulty]
             wordy_main()
             return
-        elif difficulty in ["hard", "3"]:
-            words = WORDY_HARD
-            word_length = 8
-            wordy_main()
+        elif choice in ["multi-board", "multi", "4"]:
+            boards_input = turtle.textinput("Wordy", "How many boards? (2, 4 or 8):")
+            level_input = turtle.textinput("Wordy", "Word difficulty? (1 = easy, 2 = medium, 3 = hard):")
+            levels = {"1": "easy", "2": "medium", "3": "hard", "easy": "easy", "medium": "medium", "hard": "hard"}
+            if boards_input is None or level_input is None or not boards_input.strip().isdigit() \
+                    or int(boards_input) not in BOARD_GUESSES or level_input.strip().lower() not in levels:
+                show_help_message("Invalid Input", "Please choose 2, 4 or 8 boards and a difficulty of 1-3.", wait_for_ok=False)
+                continue
+            difficulty = levels[level_input.strip().lower()]
+            word_length = DIFFICULTY_LENGTHS[difficulty]
+            wordy_multi_main(int(boards_input))
             return
-        elif difficulty in ["main menu", "4"]:
+        elif choice in ["hard mode", "5"]:
+            hard_mode = not hard_mode
+        elif choice in ["word rating", "rating", "6"]:
+            # Cycle any -> easier -> average -> harder -> any
+            bands = (None,) + RATING_BANDS
+            word_band = bands[(bands.index(word_band) + 1) % len(bands)]
+        elif choice in ["main menu", "7"]:
             return
-        elif difficulty in ["help", "5"]:
+        elif choice in ["help", "8"]:
             help_menu.help_menu()
             return
-        elif difficulty in ["quit", "6"]:
+        elif choice in ["quit", "9"]:
             quit_menu.quit_menu()
             return
         else:
-            show_help_message("Invalid Input", "Invalid choice. Please enter 1-6.", wait_for_ok=False)
\ No newline at end of file
+            show_help_message("Invalid Input", "Invalid choice. Please enter 1-9.", wait_for_ok=False)
\ No newline at end of file
@@ -0,0 +1,134 @@
+# CtrlUno Arcade - Wordy Batch Mode
+# Plays Wordy games headlessly from a stream of records and streams the results as JSON lines
+#
+# Each input line is one game: either a JSON object {"answer": ..., "guesses": [...]}
+# or plain words separated by spaces, answer first. Each output line is a JSON
+# object with the feedback pattern of every guess (G green, Y yellow, - grey)
+# and the outcome: "won" (answer guessed within MAX_GUESSES), "lost" (all
+# guesses used without it) or "unfinished". Bad records produce an "error"
+# line and the run continues. Records are read, scored and written one at a
+# time, so memory use does not grow with the input; turtle is never imported.
+#
+# Example:
+#     echo "crane slate crane" | python wordy_batch.py
+#     python wordy_batch.py games.jsonl --output results.jsonl --check-words
+
+# Import argparse, json, sys and time for the stream handling and command line
+import argparse
+import json
+import sys
+import time
+
+# Import feedback scoring shared with the game, and the word index for --check-words
+from wordy_feedback import score_guess
+from wordy_words import word_index, MAX_GUESSES
+
+#------------------------------------------------------
+# BATCH CONSTANTS
+#------------------------------------------------------
+
+PATTERN_LETTERS = "-YG"  # Output letter for GREY, YELLOW and GREEN
+
+#------------------------------------------------------
+# RECORD STREAM - Lines in, result dicts out, one at a time
+#------------------------------------------------------
+
+def read_records(lines):
+    """
+    Parses input lines into game records, skipping blank lines.
+
+    Yields:
+        tuple: (line number, answer, guesses), or (line number, None, error message)
+    """
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            try:
+                record = json.loads(line)
+                yield number, str(record["answer"]), [str(guess) for guess in record["guesses"]]
+            except (ValueError, KeyError, TypeError) as error:
+                yield number, None, f"bad JSON record: {error}"
+        else:
+            answer, *guesses = line.split()
+            yield number, answer, guesses
+
+def play_record(answer, guesses, valid=None):
+    """
+    Scores one game's guesses against its answer, like wordy_main does.
+
+    Args:
+        answer (str): Hidden word
+        guesses (list): Guesses in order; any after the winning one are ignored
+        valid (callable): Word check for guesses (None to accept any letters)
+
+    Returns:
+        dict: Patterns per guess and the outcome, or an "error" entry
+    """
+    answer = answer.lower()
+    patterns = []
+    for guess in guesses[:MAX_GUESSES]:
+        guess = guess.lower()
+        if len(guess) != len(answer) or not guess.isalpha():
+            return {"answer": answer, "error": f"guess {guess!r} is not a {len(answer)}-letter word"}
+        if valid is not None and not valid(guess):
+            return {"answer": answer, "error": f"guess {guess!r} is not in the word list"}
+        patterns.append("".join(PATTERN_LETTERS[code] for code in score_guess(guess, answer)))
+        if guess == answer:
+            return {"answer": answer, "patterns": patterns, "outcome": "won", "attempts": len(patterns)}
+    outcome = "lost" if len(patterns) == MAX_GUESSES else "unfinished"
+    return {"answer": answer, "patterns": patterns, "outcome": outcome, "attempts": len(patterns)}
+
+def run_batch(lines, output, check_words=False):
+    """
+    Plays every record in a line stream and writes one JSON result line per record.
+
+    Args:
+        lines (iterable): Input lines (a file, sys.stdin, a generator, ...)
+        output: Writable text stream
+        check_words (bool): Reject guesses that are not in the Wordy word lists
+
+    Returns:
+        dict: Counts of games per outcome (plus "error")
+    """
+    valid = word_index().is_valid if check_words else None
+    counts = {"won": 0, "lost": 0, "unfinished": 0, "error": 0}
+    for number, answer, guesses in read_records(lines):
+        if answer is None:
+            result = {"line": number, "error": guesses}
+        else:
+            result = {"line": number, **play_record(answer, guesses, valid)}
+        counts[result.get("outcome", "error")] += 1
+        output.write(json.dumps(result, separators=(",", ":")) + "\n")
+    return counts
+
+#------------------------------------------------------
+# COMMAND LINE ENTRY POINT
+#------------------------------------------------------
+
+def main(argv=None):
+    """Command line entry point for headless Wordy games."""
+    parser = argparse.ArgumentParser(description="Score Wordy games from a file or stdin as JSON lines.")
+    parser.add_argument("input", nargs="?", default="-", help="records file (default: stdin)")
+    parser.add_argument("--output", default="-", help="results file (default: stdout)")
+    parser.add_argument("--check-words", action="store_true", help="reject guesses not in the Wordy word lists")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input)
+    target = sys.stdout if args.output == "-" else open(args.output, "w")
+    start = time.perf_counter()
+    try:
+        counts = run_batch(source, target, args.check_words)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    elapsed = time.perf_counter() - start
+    games = sum(counts.values())
+    summary = ", ".join(f"{count} {name}" for name, count in counts.items())
+    print(f"{games} games in {elapsed:.2f}s ({games / max(elapsed, 1e-9):.0f} games/s): {summary}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+# CtrlUno Arcade - Wordy Hard Mode Candidates
+# Words still consistent with the feedback so far, kept as bitsets over the word index
+#
+# Every valid guess of one length gets a bit (its position in the sorted word
+# list). Masks are built once per length: one per (position, letter) and one
+# per (letter, n) holding the words with at least n copies of the letter.
+# Feedback on a guess then narrows the candidates with one AND per letter
+# position and one per distinct guessed letter, with no pass over the words.
+#
+# Example:
+#     candidates = CandidateSet.for_words(index.words("medium", 5), index.valid[5])
+#     candidates.update("crane", score_guess("crane", answer))
+#     candidates.allows("slate"), candidates.count()
+
+# Import the feedback codes
+from wordy_feedback import GREEN, GREY
+
+#------------------------------------------------------
+# LETTER MASKS
+#------------------------------------------------------
+
+def indices_to_mask(indices, size):
+    """
+    Packs word indices into an int bitset.
+
+    Args:
+        indices (list): Bit positions to set
+        size (int): Number of words (bits) in the index
+
+    Returns:
+        int: Bitset with bit i set for every i in indices
+    """
+    packed = bytearray((size + 7) // 8)
+    for index in indices:
+        packed[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(packed, "little")
+
+class LetterMasks:
+    """
+    Precomputed bitsets over one sorted word list.
+
+    Attributes:
+        words (tuple): Sorted words; word i is bit i
+        bits (dict): Word -> bit position
+        at (dict): (position, letter) -> words with that letter at that position
+        counts (dict): (letter, n) -> words with at least n copies of the letter
+        full (int): Every word
+    """
+
+    def __init__(self, words):
+        """
+        Args:
+            words (iterable): Words of one length
+        """
+        self.words = tuple(sorted(set(words)))
+        self.bits = {word: bit for bit, word in enumerate(self.words)}
+        self.full = (1 << len(self.words)) - 1
+        at = {}
+        counts = {}
+        for bit, word in enumerate(self.words):
+            seen = {}
+            for position, letter in enumerate(word):
+                at.setdefault((position, letter), []).append(bit)
+                seen[letter] = seen.get(letter, 0) + 1
+                counts.setdefault((letter, seen[letter]), []).append(bit)
+        size = len(self.words)
+        self.at = {key: indices_to_mask(bits, size) for key, bits in at.items()}
+        self.counts = {key: indices_to_mask(bits, size) for key, bits in counts.items()}
+
+    def letter_at(self, position, letter):
+        """Returns the words with a letter at a position (0 if none)."""
+        return self.at.get((position, letter), 0)
+
+    def at_least(self, letter, count):
+        """Returns the words with at least count copies of a letter."""
+        if count <= 0:
+            return self.full
+        return self.counts.get((letter, count), 0)
+
+    def mask_of(self, words):
+        """Returns the bitset of the given words (words not in the list are ignored)."""
+        return indices_to_mask([self.bits[word] for word in words if word in self.bits], len(self.words))
+
+# Masks built on first use, one per word list
+letter_masks_cache = {}
+
+def letter_masks(words):
+    """
+    Returns the masks for a word list, building them on first use.
+
+    Args:
+        words (iterable): Valid guesses of one length
+
+    Returns:
+        LetterMasks: Masks over the sorted words
+    """
+    key = tuple(sorted(words))
+    if key not in letter_masks_cache:
+        letter_masks_cache[key] = LetterMasks(key)
+    return letter_masks_cache[key]
+
+#------------------------------------------------------
+# CANDIDATE SET
+#------------------------------------------------------
+
+def describe_position(position):
+    """Returns "1st", "2nd", ... for a zero-based letter position."""
+    number = position + 1
+    suffix = "th" if 10 <= number % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+    return f"{number}{suffix}"
+
+class CandidateSet:
+    """
+    Words consistent with every piece of feedback in a game.
+
+    Guesses are checked against all valid words of the length (a guess fits
+    if it could still be the answer given the feedback); the answer count
+    only covers the answer pool.
+    """
+
+    def __init__(self, masks, answers):
+        """
+        Args:
+            masks (LetterMasks): Masks over the valid guesses
+            answers (iterable): Words that can be the answer
+        """
+        self.masks = masks
+        self.answers = masks.mask_of(answers)
+        self.candidates = masks.full
+        self.greens = {}  # Position -> letter known to be there
+        self.misses = set()  # (position, letter) known not to be there
+        self.minimums = {}  # Letter -> copies the word has at least
+        self.exact = {}  # Letter -> copies the word has exactly
+
+    @classmethod
+    def for_words(cls, answers, guesses):
+        """Builds a candidate set, reusing the cached masks of the guess list."""
+        return cls(letter_masks(guesses), answers)
+
+    def update(self, guess, pattern):
+        """
+        Narrows the candidates with the feedback on one guess.
+
+        Args:
+            guess (str): Guessed word
+            pattern (list): Feedback code per letter (GREY, YELLOW or GREEN)
+        """
+        masks = self.masks
+        found = {}
+        greyed = set()
+        for position, (letter, code) in enumerate(zip(guess, pattern)):
+            if code == GREEN:
+                self.candidates &= masks.letter_at(position, letter)
+                self.greens[position] = letter
+            else:
+                self.candidates &= ~masks.letter_at(position, letter)
+                self.misses.add((position, letter))
+            if code == GREY:
+                greyed.add(letter)
+            else:
+                found[letter] = found.get(letter, 0) + 1
+        for letter in set(guess):
+            count = found.get(letter, 0)
+            # A grey copy means the word has no more copies than were found
+            self.candidates &= masks.at_least(letter, count)
+            if letter in greyed:
+                self.candidates &= ~masks.at_least(letter, count + 1)
+                self.exact[letter] = count
+            else:
+                self.minimums[letter] = max(self.minimums.get(letter, 0), count)
+
+    def allows(self, guess):
+        """True if the guess fits every piece of feedback so far."""
+        bit = self.masks.bits.get(guess)
+        return bit is not None and self.candidates >> bit & 1 == 1
+
+    def count(self):
+        """Returns the number of answers still possible."""
+        return bin(self.candidates & self.answers).count("1")
+
+    def remaining(self):
+        """Returns the answers still possible, in word-list order."""
+        remaining = self.candidates & self.answers
+        return [word for bit, word in enumerate(self.masks.words) if remaining >> bit & 1]
+
+    def reason(self, guess):
+        """
+        Explains why a guess does not fit the feedback so far.
+
+        Returns:
+            str: First broken rule, or None if the guess fits
+        """
+        for position, letter in sorted(self.greens.items()):
+            if guess[position] != letter:
+                return f"{describe_position(position)} letter must be {letter.upper()}."
+        for letter, count in sorted(self.minimums.items()):
+            if guess.count(letter) < count:
+                copies = "" if count == 1 else f" {count} times"
+                return f"Guess must contain {letter.upper()}{copies}."
+        for position, letter in sorted(self.misses):
+            if guess[position] == letter:
+                return f"{letter.upper()} cannot be the {describe_position(position)} letter."
+        for letter, count in sorted(self.exact.items()):
+            if guess.count(letter) != count:
+                if count == 0:
+                    return f"Guess cannot contain {letter.upper()}."
+                return f"Guess must contain {letter.upper()} exactly {count} time(s)."
+        return None
@@ -0,0 +1,215 @@
+# CtrlUno Arcade - Wordy Feedback Engine
+# Green/yellow/grey scoring for one guess, and for whole word lists at once with NumPy
+#
+# Example:
+#     python wordy_feedback.py              # time the pattern matrix of every pool and check it
+
+# Import argparse and time for the command line check, array for the NumPy-free pattern table
+import argparse
+import time
+from array import array
+
+# Optional NumPy import - Only the batch pattern matrix needs NumPy, the game never does
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+#------------------------------------------------------
+# FEEDBACK CONSTANTS
+# One code per letter; a whole pattern packs into one base-3 number
+#------------------------------------------------------
+
+GREY = 0    # Letter not in word (or no copies left)
+YELLOW = 1  # Letter in word but wrong position
+GREEN = 2   # Letter in correct position
+
+# Square color drawn for each feedback code
+PATTERN_COLORS = {GREEN: "green", YELLOW: "yellow", GREY: "light grey"}
+
+MATRIX_CHUNK = 64  # Guesses scored per NumPy pass, keeps temporary arrays small
+
+#------------------------------------------------------
+# SINGLE GUESS SCORING
+#------------------------------------------------------
+
+def score_guess(guess, answer):
+    """
+    Scores one guess against the answer.
+
+    Greens are matched first; each remaining letter is yellow only while the
+    answer still has an unmatched copy of it, so repeated letters never get
+    more yellows than the answer holds.
+
+    Args:
+        guess (str): Guessed word
+        answer (str): Hidden word of the same length
+
+    Returns:
+        tuple: GREEN, YELLOW or GREY for each position
+    """
+    pattern = [GREY] * len(guess)
+    unmatched = {}
+    for i, (letter, target) in enumerate(zip(guess, answer)):
+        if letter == target:
+            pattern[i] = GREEN
+        else:
+            unmatched[target] = unmatched.get(target, 0) + 1
+    for i, letter in enumerate(guess):
+        if pattern[i] == GREY and unmatched.get(letter):
+            pattern[i] = YELLOW
+            unmatched[letter] -= 1
+    return tuple(pattern)
+
+def pattern_code(pattern):
+    """Packs a feedback pattern into one number (position i is base-3 digit i)."""
+    code = 0
+    for value in reversed(pattern):
+        code = code * 3 + value
+    return code
+
+def pattern_from_code(code, length):
+    """Unpacks a number made by pattern_code() back into a feedback pattern."""
+    pattern = []
+    for _ in range(length):
+        code, value = divmod(code, 3)
+        pattern.append(value)
+    return tuple(pattern)
+
+def solved_code(length):
+    """Pattern code of an all-green guess."""
+    return 3 ** length - 1
+
+#------------------------------------------------------
+# BATCH SCORING - Every guess x answer pair in one vectorized pass
+#------------------------------------------------------
+
+def encode_words(words):
+    """
+    Converts equal-length words into a letter array.
+
+    Returns:
+        ndarray: uint8 array [word, position] of letters 0-25
+
+    Raises:
+        ValueError: If the words do not all have the same length
+    """
+    lengths = {len(word) for word in words}
+    if len(lengths) != 1:
+        raise ValueError(f"Words must all have the same length, got lengths {sorted(lengths)}")
+    data = "".join(words).lower().encode("ascii")
+    return (np.frombuffer(data, dtype=np.uint8) - ord("a")).reshape(len(words), lengths.pop())
+
+def pattern_dtype(length):
+    """Smallest unsigned type holding every pattern code: uint8 up to 5 letters, uint16 up to 10."""
+    return np.uint8 if 3 ** length <= 256 else np.uint16 if 3 ** length <= 65536 else np.uint32
+
+def pattern_matrix(guesses, answers=None):
+    """
+    Computes the feedback pattern code of every guess against every answer.
+
+    Same rules as score_guess(): a non-green letter is yellow when fewer
+    earlier non-green copies of it were used than the answer has unmatched.
+    Both counts come from small batched matrix products over the greens.
+
+    Args:
+        guesses (list): Equal-length guess words
+        answers (list): Equal-length answer words (defaults to guesses)
+
+    Returns:
+        ndarray: [guess, answer] pattern codes (uint8 for words up to 5 letters)
+    """
+    if answers is None:
+        answers = guesses
+    guess_letters = encode_words(guesses)
+    answer_letters = encode_words(answers)
+    length = guess_letters.shape[1]
+    if answer_letters.shape[1] != length:
+        raise ValueError("Guesses and answers must have the same length")
+    weights = 3 ** np.arange(length)
+    earlier = np.tri(length, k=-1, dtype=bool)  # [i, k]: k comes before i
+    letter_counts = np.zeros((len(answers), 26), dtype=np.float32)
+    np.add.at(letter_counts, (np.arange(len(answers))[:, None], answer_letters), 1)
+    matrix = np.empty((len(guesses), len(answers)), dtype=pattern_dtype(length))
+
+    for start in range(0, len(guesses), MATRIX_CHUNK):
+        chunk = guess_letters[start:start + MATRIX_CHUNK]
+        green = chunk[:, None, :] == answer_letters[None, :, :]                 # [g, a, k]
+        greens = green.astype(np.float32)
+        same = (chunk[:, :, None] == chunk[:, None, :]).astype(np.float32)      # [g, i, k]
+        repeats = same * earlier
+        # Unmatched answer copies of the letter at guess position i
+        available = letter_counts[:, chunk].transpose(1, 0, 2) - greens @ same
+        # Non-green copies of that letter earlier in the guess
+        used = repeats.sum(axis=2)[:, None, :] - greens @ repeats.transpose(0, 2, 1)
+        yellow = ~green & (used < available)
+        matrix[start:start + MATRIX_CHUNK] = (GREEN * green + YELLOW * yellow) @ weights
+    return matrix
+
+def pattern_typecode(length):
+    """array typecode matching pattern_dtype(), for the pattern table built without NumPy."""
+    return "B" if 3 ** length <= 256 else "H" if 3 ** length <= 65536 else "I"
+
+def pattern_table(guesses, answers=None):
+    """
+    Pure Python pattern_matrix(): the same codes as a flat array, row by row.
+
+    Slow (one score_guess() per pair), so it is meant to be built once and
+    cached; entry [g * len(answers) + a] is guess g against answer a.
+
+    Args:
+        guesses (list): Equal-length guess words
+        answers (list): Equal-length answer words (defaults to guesses)
+
+    Returns:
+        array: Pattern codes, typecode from pattern_typecode()
+    """
+    if answers is None:
+        answers = guesses
+    return array(pattern_typecode(len(guesses[0])),
+                 (pattern_code(score_guess(guess, answer)) for guess in guesses for answer in answers))
+
+def score_boards(guess, answers):
+    """
+    Scores one guess against several hidden words at once (multi-board Wordy).
+
+    With NumPy every board is scored in a single pattern_matrix() pass;
+    without it each board falls back to score_guess().
+
+    Args:
+        guess (str): Guessed word
+        answers (list): Hidden words of the same length, one per board
+
+    Returns:
+        list: Feedback pattern per answer
+    """
+    if np is None:
+        return [score_guess(guess, answer) for answer in answers]
+    return [pattern_from_code(int(code), len(guess)) for code in pattern_matrix([guess], answers)[0]]
+
+#------------------------------------------------------
+# COMMAND LINE CHECK
+#------------------------------------------------------
+
+def main(argv=None):
+    """Times the pattern matrix of each Wordy pool and checks it against score_guess()."""
+    parser = argparse.ArgumentParser(description="Build Wordy feedback pattern matrices.")
+    parser.add_argument("--checks", type=int, default=20000, help="random pairs compared with score_guess()")
+    args = parser.parse_args(argv)
+    if np is None:
+        parser.exit(1, "The pattern matrix needs NumPy: pip install numpy\n")
+
+    from wordy_words import word_index, DIFFICULTY_LENGTHS
+    rng = np.random.default_rng(0)
+    for difficulty, length in DIFFICULTY_LENGTHS.items():
+        words = word_index().words(difficulty, length)
+        start = time.perf_counter()
+        matrix = pattern_matrix(words)
+        elapsed = time.perf_counter() - start
+        pairs = rng.integers(len(words), size=(args.checks, 2))
+        bad = sum(matrix[g, a] != pattern_code(score_guess(words[g], words[a])) for g, a in pairs)
+        print(f"{difficulty}: {len(words)}x{len(words)} {matrix.dtype} matrix ({matrix.nbytes / 1024:.0f} KiB) "
+              f"in {elapsed * 1000:.0f} ms, {bad} mismatches in {args.checks} checks")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+# CtrlUno Arcade - Wordy Hint Engine
+# Tracks the words still possible after each guess and suggests the most informative next guess
+#
+# The feedback pattern of every guess x answer pair comes from a pattern matrix
+# (see wordy_feedback.pattern_matrix) that is computed once per word list and
+# cached on disk; later games memory-map the cached file, so the first hint
+# costs milliseconds. Without NumPy the same codes are built once into a flat
+# array file (wordy_feedback.pattern_table) and memory-mapped, so hints are
+# still only table lookups.
+
+# Import hashlib, mmap, os and tempfile for the on-disk matrix cache, math and Counter for the NumPy-free entropy
+import hashlib
+import math
+import mmap
+import os
+import tempfile
+from collections import Counter
+from operator import itemgetter
+
+# Optional NumPy import - Without it hints read the memory-mapped pattern table instead
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Import feedback scoring shared with the game
+from wordy_feedback import score_guess, pattern_code, pattern_matrix, pattern_table, pattern_typecode
+
+#------------------------------------------------------
+# HINT CONSTANTS
+#------------------------------------------------------
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "wordy_cache")  # Pattern matrix cache folder next to this module, one .npy file per word list
+
+#------------------------------------------------------
+# PATTERN MATRIX CACHE
+#------------------------------------------------------
+
+def cache_path(guesses, answers, cache_dir=CACHE_DIR, suffix=".npy"):
+    """Returns the cache file of a word list pair (named by a hash of both lists)."""
+    digest = hashlib.sha1(("\n".join(guesses) + "|" + "\n".join(answers)).encode()).hexdigest()
+    return os.path.join(cache_dir, f"patterns_{len(guesses[0])}_{digest[:16]}{suffix}")
+
+def write_cache(path, cache_dir, write):
+    """Writes a cache file atomically: write(file) fills a temporary file that then replaces path."""
+    os.makedirs(cache_dir, exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(dir=cache_dir, prefix=".patterns_", suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            write(file)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def load_pattern_matrix(guesses, answers, cache_dir=CACHE_DIR):
+    """
+    Returns the pattern matrix of a word list pair, memory-mapped from the cache.
+
+    The matrix is computed and written (atomically) only the first time a
+    word list is seen; changing a list changes its hash, so stale files are
+    never read.
+
+    Args:
+        guesses (list): Equal-length guess words
+        answers (list): Equal-length answer words
+        cache_dir (str): Cache folder
+
+    Returns:
+        ndarray: Read-only [guess, answer] pattern codes
+    """
+    path = cache_path(guesses, answers, cache_dir)
+    if not os.path.exists(path):
+        write_cache(path, cache_dir, lambda file: np.save(file, pattern_matrix(guesses, answers)))
+    return np.load(path, mmap_mode="r")
+
+def load_pattern_table(guesses, answers, cache_dir=CACHE_DIR):
+    """
+    NumPy-free load_pattern_matrix(): the flat pattern_table() of a word list
+    pair, built once and memory-mapped from a .bin cache file.
+
+    Args:
+        guesses (list): Equal-length guess words
+        answers (list): Equal-length answer words
+        cache_dir (str): Cache folder
+
+    Returns:
+        memoryview: Read-only codes, entry [g * len(answers) + a]
+    """
+    path = cache_path(guesses, answers, cache_dir, suffix=".bin")
+    if not os.path.exists(path):
+        write_cache(path, cache_dir, lambda file: pattern_table(guesses, answers).tofile(file))
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped).cast(pattern_typecode(len(guesses[0])))
+
+#------------------------------------------------------
+# HINT ENGINE
+#------------------------------------------------------
+
+class HintEngine:
+    """
+    Remaining candidate answers of one Wordy game and the best next guess.
+
+    Attributes:
+        answers (tuple): Every word the answer may be
+        guesses (tuple): Every word the player may guess
+        matrix (ndarray): [guess, answer] pattern codes, None without NumPy
+        table: Flat pattern codes (see load_pattern_table()) used when matrix is None
+        candidates: Indexes into answers still consistent with all feedback
+    """
+
+    def __init__(self, answers, guesses=None, matrix=None, table=None):
+        self.answers = tuple(answers)
+        self.guesses = tuple(guesses or answers)
+        self.guess_ids = {word: index for index, word in enumerate(self.guesses)}
+        self.matrix = matrix
+        if matrix is None and table is None:
+            table = pattern_table(self.guesses, self.answers)
+        self.table = table
+        self.reset()
+
+    @classmethod
+    def for_words(cls, answers, guesses=None, cache_dir=CACHE_DIR):
+        """Builds an engine over the cached pattern matrix, or the cached pattern table without NumPy."""
+        guesses = tuple(sorted(guesses or answers))
+        if np is None:
+            return cls(answers, guesses, table=load_pattern_table(guesses, tuple(answers), cache_dir))
+        return cls(answers, guesses, load_pattern_matrix(guesses, tuple(answers), cache_dir))
+
+    def __len__(self):
+        """Number of candidate answers left."""
+        return len(self.candidates)
+
+    def remaining(self):
+        """Returns the candidate answers left."""
+        return [self.answers[index] for index in self.candidates]
+
+    def update(self, guess, pattern):
+        """
+        Keeps only the candidates that would have given this feedback.
+
+        Args:
+            guess (str): Word that was guessed
+            pattern (tuple): Its feedback from score_guess()
+        """
+        code = pattern_code(pattern)
+        row = self.guess_ids.get(guess)
+        if self.matrix is not None and row is not None:
+            self.candidates = self.candidates[self.matrix[row, self.candidates] == code]
+        elif row is not None:
+            start = row * len(self.answers)
+            self.candidates = [index for index in self.candidates if self.table[start + index] == code]
+        else:
+            keep = [index for index in self.candidates if score_guess(guess, self.answers[index]) == tuple(pattern)]
+            self.candidates = keep if self.matrix is None else np.array(keep, dtype=int)
+
+    def reset(self):
+        """Makes every answer a candidate again (for reusing the engine on a new game)."""
+        self.candidates = list(range(len(self.answers))) if self.matrix is None else np.arange(len(self.answers))
+
+    def guess_scores(self):
+        """
+        Rates every guess by the information its feedback is expected to give.
+
+        A guess splits the candidates into groups by the feedback it would
+        give; its expected information is the entropy of those group sizes.
+        Guesses that could themselves be the answer get a small bonus, so
+        they win ties. Needs the pattern matrix.
+
+        Returns:
+            tuple: (score array over guesses, expected bits array over guesses)
+        """
+        count = len(self.candidates)
+        patterns = np.sort(self.matrix[:, self.candidates], axis=1)  # [guess, candidate]
+        # Runs of equal codes in each sorted row are the feedback groups
+        starts = np.ones(patterns.shape, dtype=bool)
+        starts[:, 1:] = patterns[:, 1:] != patterns[:, :-1]
+        run_starts = np.flatnonzero(starts)
+        odds = np.diff(np.append(run_starts, patterns.size)) / count
+        bits = -np.bincount(run_starts // count, weights=odds * np.log2(odds), minlength=len(self.guesses))
+
+        candidate_words = {self.answers[index] for index in self.candidates}
+        bonus = np.array([word in candidate_words for word in self.guesses]) / count
+        return bits + bonus, bits
+
+    def best_guess(self, allowed=None):
+        """
+        Suggests the guess with the highest expected information (see guess_scores()).
+
+        Args:
+            allowed (callable): Only suggest guesses it accepts (hard mode), None for any guess
+
+        Returns:
+            tuple: (word, expected bits), or (None, 0.0) if no candidate is left
+        """
+        count = len(self.candidates)
+        if count <= 2:
+            return (self.answers[self.candidates[0]], float(count == 2)) if count else (None, 0.0)
+        if self.matrix is None:
+            return self.best_table_guess(allowed)
+        scores, bits = self.guess_scores()
+        if allowed is not None:
+            # Candidates always pass, so at least one guess is left
+            scores = np.where([allowed(word) for word in self.guesses], scores, -np.inf)
+        best = int(np.argmax(scores))
+        return self.guesses[best], float(bits[best])
+
+    def best_table_guess(self, allowed=None):
+        """NumPy-free best_guess(): the same scores, counted from pattern table rows."""
+        count = len(self.candidates)
+        width = len(self.answers)
+        pick = itemgetter(*self.candidates)
+        candidate_words = {self.answers[index] for index in self.candidates}
+        best_word, best_score, best_bits = None, -math.inf, 0.0
+        for row, word in enumerate(self.guesses):
+            if allowed is not None and not allowed(word):
+                continue
+            groups = Counter(pick(self.table[row * width:(row + 1) * width]))
+            bits = -sum(size / count * math.log2(size / count) for size in groups.values())
+            score = bits + (word in candidate_words) / count
+            if score > best_score:
+                best_word, best_score, best_bits = word, score, bits
+        return best_word, best_bits
@@ -0,0 +1,183 @@
+# CtrlUno Arcade - Wordy Difficulty Rating
+# Measures how hard every Wordy word is by letting a solver play it on every core
+#
+# The solver is the hint engine (wordy_hints.HintEngine) choosing at random
+# among its few best guesses, so repeated trials on one word give a spread of
+# results. Every trial reuses the cached pattern matrix of the word's list, so
+# a guess costs a few NumPy operations instead of rescoring the word list.
+# Each word gets its mean guesses to solve, its failure rate (not solved in
+# MAX_GUESSES) and a score, the mean guesses with failures counted as
+# MAX_GUESSES + 1. Scores are written to wordy_ratings.json, which pick_word()
+# can use to sample easier or harder words (see WordIndex.rated_sample()).
+# Words from buckets with fewer than MIN_BUCKET_WORDS words are left unrated:
+# with a single candidate the solver always wins in one guess, which says
+# nothing about the word, and rated_sample() treats unrated words as average.
+#
+# Example:
+#     python wordy_rating.py
+#     python wordy_rating.py --trials 16 --top 5 --workers 4
+
+# Import argparse, json, multiprocessing, os, random and time for the tool and its worker pool
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import time
+
+# Optional NumPy import - Only the rating tool and hints need NumPy, the game never does
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Import the word lists, hint engine and scoring
+from wordy_feedback import score_guess
+from wordy_hints import HintEngine, load_pattern_matrix
+from wordy_words import word_index, WORD_LISTS, MAX_GUESSES, RATINGS_FILE
+
+#------------------------------------------------------
+# RATING CONSTANTS
+#------------------------------------------------------
+
+DEFAULT_TRIALS = 8      # Solver games per word
+DEFAULT_TOP = 3         # Solver picks at random among this many best guesses
+CHUNK_WORDS = 32        # Words per worker task: fixed, so ratings are the same for any worker count
+MIN_BUCKET_WORDS = 2    # Smaller (difficulty, length) buckets are not rated, one candidate is no game
+
+#------------------------------------------------------
+# SOLVER
+#------------------------------------------------------
+
+def solve(engine, answer, rng, top, first_choices):
+    """
+    Plays one game with the hint engine as the player.
+
+    Args:
+        engine (HintEngine): Engine over the answer's word list (reset here)
+        answer (str): Hidden word
+        rng (random.Random): Source for picking among the best guesses
+        top (int): Number of best guesses to pick from
+        first_choices (list): Best opening guesses (the same for every answer)
+
+    Returns:
+        int: Guesses used, or MAX_GUESSES + 1 if the solver failed
+    """
+    engine.reset()
+    for attempt in range(1, MAX_GUESSES + 1):
+        if attempt == 1:
+            guess = rng.choice(first_choices)
+        elif len(engine) <= 2:
+            guess = rng.choice(engine.remaining())
+        else:
+            scores, _ = engine.guess_scores()
+            best = np.argpartition(-scores, min(top, len(scores)) - 1)[:top]
+            guess = engine.guesses[int(rng.choice(best))]
+        if guess == answer:
+            return attempt
+        engine.update(guess, score_guess(guess, answer))
+    return MAX_GUESSES + 1
+
+def best_openers(engine, top):
+    """Returns the top opening guesses of a fresh engine."""
+    scores, _ = engine.guess_scores()
+    return [engine.guesses[int(index)] for index in np.argsort(-scores)[:top]]
+
+def rate_chunk(task):
+    """
+    Worker entry point: plays every trial for a chunk of words from one list.
+
+    Args:
+        task (tuple): (difficulty, length, words, trials, top, seed)
+
+    Returns:
+        tuple: (difficulty, {word: [guesses per trial]})
+    """
+    difficulty, length, words, trials, top, seed = task
+    index = word_index()
+    engine = HintEngine.for_words(index.words(difficulty, length), index.valid[length])
+    first_choices = best_openers(engine, top)
+    rng = random.Random(seed)
+    return difficulty, {word: [solve(engine, word, rng, top, first_choices) for _ in range(trials)]
+                        for word in words}
+
+#------------------------------------------------------
+# RATING RUN
+#------------------------------------------------------
+
+def rate_words(trials=DEFAULT_TRIALS, top=DEFAULT_TOP, seed=0, workers=None):
+    """
+    Rates every word of every Wordy list across a process pool (buckets under MIN_BUCKET_WORDS are skipped).
+
+    Returns:
+        dict: difficulty -> {word: {"guesses", "failures", "score"}}
+    """
+    index = word_index()
+    workers = workers or os.cpu_count() or 1
+    buckets = [(difficulty, length) for difficulty in WORD_LISTS for length in index.lengths(difficulty)
+               if len(index.words(difficulty, length)) >= MIN_BUCKET_WORDS]
+    # Build (or load) each list's pattern matrix once here, so workers only memory-map it
+    for difficulty, length in buckets:
+        load_pattern_matrix(tuple(sorted(index.valid[length])), index.words(difficulty, length))
+
+    tasks = []
+    for difficulty, length in buckets:
+        words = index.words(difficulty, length)
+        for start in range(0, len(words), CHUNK_WORDS):
+            tasks.append((difficulty, length, words[start:start + CHUNK_WORDS], trials, top, f"{seed}:{len(tasks)}"))
+
+    results = {difficulty: {} for difficulty in WORD_LISTS}
+    if workers == 1:
+        for task in tasks:
+            merge_ratings(results, *rate_chunk(task))
+        return results
+    with multiprocessing.Pool(workers) as pool:
+        for chunk in pool.imap_unordered(rate_chunk, tasks):
+            merge_ratings(results, *chunk)
+    return results
+
+def merge_ratings(results, difficulty, counts):
+    """Adds the rating of every word in a finished chunk to the results."""
+    for word, guesses in counts.items():
+        solved = [count for count in guesses if count <= MAX_GUESSES]
+        results[difficulty][word] = {
+            "guesses": round(sum(solved) / len(solved), 3) if solved else None,
+            "failures": round(1 - len(solved) / len(guesses), 3),
+            "score": round(sum(guesses) / len(guesses), 3),
+        }
+
+def format_report(results, elapsed):
+    """Builds a printable summary of a rating run."""
+    total = sum(len(words) for words in results.values())
+    lines = [f"Rated {total} words in {elapsed:.1f}s"]
+    for difficulty, words in results.items():
+        ranked = sorted(words, key=lambda word: words[word]["score"])
+        scores = [words[word]["score"] for word in ranked]
+        failures = sum(words[word]["failures"] for word in ranked) / max(len(ranked), 1)
+        lines.append(f"  {difficulty:<7} mean score {sum(scores) / max(len(scores), 1):.2f}, "
+                     f"failure rate {failures:.1%}, easiest {', '.join(ranked[:3])}, hardest {', '.join(ranked[-3:])}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    """Command line entry point for the difficulty rating tool."""
+    parser = argparse.ArgumentParser(description="Rate Wordy words by letting a solver play them.")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS, help="solver games per word")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="solver picks among this many best guesses")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: every core)")
+    parser.add_argument("--output", default=RATINGS_FILE)
+    args = parser.parse_args(argv)
+    if np is None:
+        parser.exit(1, "The rating tool needs NumPy: pip install numpy\n")
+
+    start = time.perf_counter()
+    results = rate_words(args.trials, args.top, args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+    with open(args.output, "w") as file:
+        json.dump({"version": 1, "trials": args.trials, "top": args.top, "max_guesses": MAX_GUESSES,
+                   "words": results}, file, separators=(",", ":"), sort_keys=True)
+    print(format_report(results, elapsed))
+    print(f"Wrote {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+# CtrlUno Arcade - Wordy Word Index
+# Word pools bucketed once by difficulty and length for fast picking and guess checking
+
+# Import json, os and random for word selection and measured ratings
+import json
+import os
+import random
+
+# Import packed word lists
+from word_store import load_words
+
+#------------------------------------------------------
+# WORD RATINGS - WORDY GAME
+# Measured difficulty per word from the solver simulation
+#------------------------------------------------------
+
+# Measured difficulty of every word, written by wordy_rating.py
+RATINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "wordy_ratings.json")
+
+# Rating bands: which third of a bucket (sorted by measured difficulty) to pick from
+RATING_BANDS = ("easier", "average", "harder")
+
+def load_ratings(path=RATINGS_FILE):
+    """
+    Reads the measured word difficulties written by wordy_rating.py.
+    
+    Returns:
+        dict: difficulty -> {word: score}, empty if no ratings file exists
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path) as file:
+        data = json.load(file)
+    return {difficulty: {word: entry["score"] for word, entry in words.items()}
+            for difficulty, words in data["words"].items()}
+
+#------------------------------------------------------
+# WORD INDEX - WORDY GAME
+# Built once per session from the difficulty pools
+#------------------------------------------------------
+
+class WordIndex:
+    """
+    Wordy word pools bucketed by (difficulty, length).
+
+    Picking a word is a single random index into a prebuilt bucket instead of
+    filtering a whole pool, and guesses are checked against one frozenset per
+    word length.
+
+    Attributes:
+        buckets (dict): (difficulty, length) -> tuple of words
+        valid (dict): length -> frozenset of every word of that length in any pool
+    """
+
+    def __init__(self, pools, rng=None):
+        """
+        Args:
+            pools (dict): Difficulty name -> list of words
+            rng (random.Random): Random source (defaults to the random module)
+        """
+        self.rng = rng or random
+        self.buckets = {}
+        for difficulty, pool in pools.items():
+            # Words are stored lower case once here, so lookups never re-normalize
+            for word in dict.fromkeys(word.lower() for word in pool):
+                self.buckets.setdefault((difficulty, len(word)), []).append(word)
+        self.buckets = {key: tuple(bucket) for key, bucket in self.buckets.items()}
+        valid = {}
+        for (_, length), bucket in self.buckets.items():
+            valid.setdefault(length, set()).update(bucket)
+        self.valid = {length: frozenset(bucket) for length, bucket in valid.items()}
+        self.rotations = {}  # (difficulty, length) -> [shuffled words, cursor]
+        self.ratings = {}  # difficulty -> {word: measured score}
+        self.rated = {}  # (difficulty, length) -> bucket sorted from easiest to hardest
+
+    def words(self, difficulty, length):
+        """Returns the words of one difficulty and length (empty tuple if none)."""
+        return self.buckets.get((difficulty, length), ())
+
+    def lengths(self, difficulty):
+        """Returns the word lengths available at a difficulty, most words first."""
+        sizes = {length: len(bucket) for (name, length), bucket in self.buckets.items() if name == difficulty}
+        return sorted(sizes, key=sizes.get, reverse=True)
+
+    def sample(self, difficulty, length):
+        """
+        Picks a uniformly random word (repeats allowed).
+
+        Raises:
+            KeyError: If no word has that difficulty and length
+        """
+        bucket = self.buckets[(difficulty, length)]
+        return bucket[self.rng.randrange(len(bucket))]
+
+    def next_word(self, difficulty, length):
+        """
+        Picks the next word of a shuffled rotation, so no word repeats until
+        the whole bucket has been played this session.
+
+        Raises:
+            KeyError: If no word has that difficulty and length
+        """
+        key = (difficulty, length)
+        rotation = self.rotations.get(key)
+        if rotation is None or rotation[1] >= len(rotation[0]):
+            order = list(self.buckets[key])
+            self.rng.shuffle(order)
+            rotation = self.rotations[key] = [order, 0]
+        rotation[1] += 1
+        return rotation[0][rotation[1] - 1]
+
+    def is_valid(self, guess):
+        """True if the guess is a known word (any difficulty) of its length."""
+        return guess.lower() in self.valid.get(len(guess), ())
+
+    def set_ratings(self, ratings):
+        """Uses measured word difficulties (see load_ratings()) for rated_sample()."""
+        self.ratings = ratings
+        self.rated = {}
+
+    def rated_sample(self, difficulty, length, band):
+        """
+        Picks a random word from one third of a bucket ordered by measured difficulty.
+        Words without a rating count as average; without any ratings this is sample().
+        
+        Args:
+            difficulty (str): Difficulty level
+            length (int): Word length
+            band (str): One of RATING_BANDS
+        
+        Raises:
+            KeyError: If no word has that difficulty and length
+        """
+        scores = self.ratings.get(difficulty)
+        if not scores:
+            return self.sample(difficulty, length)
+        key = (difficulty, length)
+        if key not in self.rated:
+            average = sum(scores.values()) / len(scores)
+            self.rated[key] = sorted(self.buckets[key], key=lambda word: scores.get(word, average))
+        ordered = self.rated[key]
+        third = RATING_BANDS.index(band)
+        start = len(ordered) * third // 3
+        end = max(len(ordered) * (third + 1) // 3, start + 1)
+        return ordered[self.rng.randrange(start, end)]
+
+#------------------------------------------------------
+# SESSION WORD INDEX - WORDY GAME
+# Shared by the game and the headless tools, none of which need turtle
+#------------------------------------------------------
+
+# Packed list name for each difficulty: easy 4-letter, medium 5-letter, hard 8-letter words
+WORD_LISTS = {"easy": "wordy_easy", "medium": "wordy_medium", "hard": "wordy_hard"}
+
+# Usual word length for each difficulty
+DIFFICULTY_LENGTHS = {"easy": 4, "medium": 5, "hard": 8}
+
+# Guesses allowed in a game (rows in the grid)
+MAX_GUESSES = 6
+
+# Word index built on first use: words by (difficulty, length) and valid guesses by length
+word_index_cache = None
+
+def word_index():
+    """
+    Returns the session's word index, building it from the packed word lists on first use.
+    
+    Returns:
+        WordIndex: Words by (difficulty, length) and valid guesses by length
+    """
+    global word_index_cache
+    if word_index_cache is None:
+        word_index_cache = WordIndex({difficulty: load_words(name) for difficulty, name in WORD_LISTS.items()})
+        word_index_cache.set_ratings(load_ratings())
+    return word_index_cache